@@ -1 +1,8 @@
-BATCH_SIZE: int = 50
\ No newline at end of file
+BATCH_SIZE: int = 50
+# Rows read and normalized at a time when a file is streamed
+READ_CHUNK_SIZE: int = 5000
+# Saves of a merged catalog retried when a concurrent write changed it
+CATALOG_SAVE_ATTEMPTS: int = 3
+# Texts embedded per call when progress is reported, enough API batches to
+# keep the concurrent embedding requests busy
+EMBEDDING_PROGRESS_CHUNK_SIZE: int = 8192
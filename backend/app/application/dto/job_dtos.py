@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+JobState = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobProgressDTO(BaseModel):
+    rows_parsed: int
+    rows_embedded: int
+    rows_indexed: int
+
+
+class JobRatesDTO(BaseModel):
+    # Rows per second of each stage, None until the stage reports rows.
+    # Stages run one after the other: each is timed from the last report of
+    # the previous one (or the job start) to its own last report
+    rows_parsed: float | None
+    rows_embedded: float | None
+    rows_indexed: float | None
+
+
+class JobStatusDTO(BaseModel):
+    job_id: str
+    status: JobState
+    progress: JobProgressDTO
+    rows_per_second: JobRatesDTO
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    error: str | None
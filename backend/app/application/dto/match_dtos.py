@@ -1,6 +1,14 @@
-from typing import Any
+from typing import Any, Literal
 from pydantic import BaseModel
 
+# How a match was found, which sets what its score means. Lower is better
+# for all three:
+# - "exact": the requirement names the item identifier, score is 0.0
+# - "vector": L2 distance between the requirement and item embeddings
+# - "hybrid": 1 - reciprocal rank fusion of the vector and BM25 rankings,
+#   normalized to [0, 1)
+MatchType = Literal["exact", "vector", "hybrid"]
+
 
 class MatchItemDTO(BaseModel):
     catalog_item_id: str
@@ -12,6 +20,7 @@ class MatchItemDTO(BaseModel):
     provider: str | None
     attributes: dict[str, Any]
     score: float
+    match_type: MatchType
 
 class RequirementMatchDTO(BaseModel):
     requirement: dict[str, Any]
@@ -19,3 +28,12 @@ class RequirementMatchDTO(BaseModel):
 
 class MatchResultDTO(BaseModel):
     results: list[RequirementMatchDTO]
+
+class MatchCacheStatsDTO(BaseModel):
+    hits: int
+    misses: int
+    # hits / (hits + misses), None before the first lookup
+    hit_rate: float | None
+    entries: int
+    evictions: int
+    invalidations: int
@@ -0,0 +1,6 @@
+from app.application.exceptions.application_layer_exception import ApplicationLayerException
+
+
+class CatalogVersionConflictException(ApplicationLayerException):
+    def __init__(self, message: str):
+        super().__init__(message)
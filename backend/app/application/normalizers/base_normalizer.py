@@ -1,9 +1,57 @@
 from abc import ABC
+import re
 from typing import Any, Type
 import unicodedata
+
+import pandas as pd
+
 from app.application.ports.normalizer import Normalizer
 
 
+def normalize_text(value: str) -> str:
+    """
+    Trims, lowercases and strips accents, the form every catalog and
+    requirement text is stored and compared in.
+    """
+    value = value.strip().lower()
+    value = unicodedata.normalize("NFD", value)
+    return "".join(
+        char for char in value
+        if not unicodedata.combining(char)
+    )
+
+
+def normalize_texts(values: list[str]) -> list[str]:
+    """
+    normalize_text over many values at once, identical results. Each
+    distinct value is normalized once, with whole-column string operations.
+    """
+    if not values:
+        return []
+
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    normalized = pd.Series(uniques, dtype=object).str.strip().str.lower()
+
+    # ASCII text has nothing to decompose nor accents to strip
+    accented = ~normalized.map(str.isascii).to_numpy(dtype=bool)
+
+    if accented.any():
+        decomposed = normalized[accented].str.normalize("NFD")
+
+        # Only the characters present are checked, not the whole Unicode range
+        combining = sorted(
+            char for char in set().union(*decomposed) if unicodedata.combining(char)
+        )
+        if combining:
+            decomposed = decomposed.str.replace(
+                f"[{''.join(map(re.escape, combining))}]", "", regex=True
+            )
+
+        normalized[accented] = decomposed
+
+    return normalized.to_numpy(dtype=object)[codes].tolist()
+
+
 class BaseNormalizer(Normalizer, ABC):
     _REQUIRED_FIELDS: set[str]
     _OPTIONAL_FIELDS: set[str]
@@ -15,11 +63,24 @@ class BaseNormalizer(Normalizer, ABC):
 
     def normalize(
         self,
-        raw_items: list[dict[str, Any]]
+        raw_items: list[dict[str, Any]],
+        start: int = 0,
+    ) -> list[dict[str, Any]]:
+        # Rows of one file share their header, normalize them column by
+        # column. Anything else goes row by row
+        if self._is_tabular(raw_items):
+            return self._normalize_columns(raw_items, start)
+
+        return self._normalize_rows(raw_items, start)
+
+    def _normalize_rows(
+        self,
+        raw_items: list[dict[str, Any]],
+        start: int = 0,
     ) -> list[dict[str, Any]]:
         normalized: list[dict[str, Any]] = []
 
-        for index, item in enumerate(raw_items):
+        for index, item in enumerate(raw_items, start=start):
             if not isinstance(item, dict):
                 raise self._EXCEPTION(
                     f"Item at index {index} is not a dictionary."
@@ -29,6 +90,61 @@ class BaseNormalizer(Normalizer, ABC):
 
         return normalized
 
+    def _normalize_columns(
+        self,
+        raw_items: list[dict[str, Any]],
+        start: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Same output and errors as _normalize_rows for rows sharing one header:
+        the header is validated once, then each column is normalized at once.
+        """
+        keys = list(raw_items[0])
+        normalized_keys = normalize_texts(keys)
+
+        # Every row has the header, so the first row is the one that fails
+        for key, normalized_key in zip(keys, normalized_keys):
+            if normalized_key not in self._ALLOWED_FIELDS:
+                raise self._EXCEPTION(
+                    f"Item at index {start} contains unknown field '{key}'."
+                )
+
+        missing = self._REQUIRED_FIELDS - set(normalized_keys)
+        if missing:
+            raise self._EXCEPTION(
+                f"Item at index {start} is missing required fields: {missing}"
+            )
+
+        columns = [
+            self._normalize_column([item[key] for item in raw_items]) for key in keys
+        ]
+
+        return [dict(zip(normalized_keys, values)) for values in zip(*columns)]
+
+    def _normalize_column(self, values: list[Any]) -> list[Any]:
+        positions = [
+            position for position, value in enumerate(values) if isinstance(value, str)
+        ]
+
+        if not positions:
+            return values
+
+        normalized = list(values)
+        for position, text in zip(
+            positions, normalize_texts([values[position] for position in positions])
+        ):
+            normalized[position] = text
+
+        return normalized
+
+    @staticmethod
+    def _is_tabular(raw_items: list[dict[str, Any]]) -> bool:
+        if not raw_items or not all(isinstance(item, dict) for item in raw_items):
+            return False
+
+        header = list(raw_items[0])
+        return bool(header) and all(list(item) == header for item in raw_items)
+
     def _normalize_item(
         self,
         item: dict[str, Any],
@@ -60,9 +176,4 @@ class BaseNormalizer(Normalizer, ABC):
 
     @staticmethod
     def _normalize_text(value: str) -> str:
-        value = value.strip().lower()
-        value = unicodedata.normalize("NFD", value)
-        return "".join(
-            char for char in value
-            if not unicodedata.combining(char)
-        )
+        return normalize_text(value)
@@ -0,0 +1,19 @@
+from typing import Protocol
+
+
+class AsyncEmbeddingService(Protocol):
+    async def get_embedding(self, text: str) -> list[float]:
+        ...
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Returns one embedding per text, in the same order as the input. Large
+        inputs are split into batches that are requested concurrently.
+        """
+        ...
+
+    async def close(self) -> None:
+        """
+        Releases the pooled connections.
+        """
+        ...
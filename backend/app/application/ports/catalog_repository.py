@@ -1,13 +1,45 @@
 from typing import Any, Protocol
 
+from app.domain.entities.catalog_item import CatalogItem
+
 
 class CatalogRepository(Protocol):
     def get(self) -> list[dict[str, Any]]: ...
 
-    def save(self, catalog: list[dict[str, Any]]) -> None: ...
+    def get_catalog_items(self) -> list[CatalogItem]: ...
+
+    def get_items_by_id(self, item_ids: list[str]) -> dict[str, CatalogItem]:
+        """
+        Returns the persisted items among item_ids, keyed by item_id. Unknown
+        identifiers are left out.
+        """
+        ...
+
+    def get_version(self) -> str:
+        """
+        Returns a stamp that changes every time the persisted catalog changes.
+        """
+        ...
+
+    def save(
+        self, catalog: list[dict[str, Any]], expected_version: str | None = None
+    ) -> None:
+        """
+        Replaces the persisted catalog. With expected_version the save only
+        happens if the persisted catalog is still at that version (see
+        get_version), otherwise CatalogVersionConflictException is raised.
+        """
+        ...
+
+    def update_item(self, item_id: str, fields: dict[str, Any]) -> None:
+        """
+        Updates the given fields of a single persisted item.
+        Raises ItemNotFoundException when the item does not exist.
+        """
+        ...
 
     def list_providers(self) -> list[str]: ...
 
     def list_catagories(self) -> list[str]: ...
 
-    def list_subcategories(self, category: str) -> list[str]: ...
+    def list_subcategories(self, category: str | None = None) -> list[str]: ...
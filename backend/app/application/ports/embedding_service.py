@@ -3,4 +3,10 @@ from typing import Protocol
 
 class EmbeddingService(Protocol):
     def get_embedding(self, text: str) -> list[float]:
-        ...
\ No newline at end of file
+        ...
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Returns one embedding per text, in the same order as the input.
+        """
+        ...
@@ -1,4 +1,4 @@
-from typing import Any, Protocol
+from typing import Any, BinaryIO, Iterator, Protocol
 
 
 class FileReader(Protocol):
@@ -15,4 +15,18 @@ class FileReader(Protocol):
         Returns a list of raw requirements.
         Each dict represents a row with primitive values only.
         """
-        ...
\ No newline at end of file
+        ...
+
+    def iter_catalog(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        """
+        Yields the raw catalog items of a binary file one row at a time,
+        without reading the whole file in memory. The file is left open.
+        """
+        ...
+
+    def iter_requirements(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        """
+        Yields the raw requirements of a binary file one row at a time,
+        without reading the whole file in memory. The file is left open.
+        """
+        ...
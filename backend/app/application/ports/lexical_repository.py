@@ -0,0 +1,59 @@
+from typing import Protocol
+
+
+class LexicalRepository(Protocol):
+    def save(self, items: list[dict], catalog_version: str | None = None) -> None:
+        """
+        Replaces the index with the given items. Each item holds item_id,
+        text (the searchable catalog fields) and the active, category and
+        provider search filters.
+        """
+        ...
+
+    def upsert(self, items: list[dict], catalog_version: str | None = None) -> None:
+        """
+        Adds the given items, or replaces those already indexed, leaving the
+        others untouched. Items are shaped as in save.
+        """
+        ...
+
+    def set_active(
+        self, item_ids: list[str], active: bool, catalog_version: str | None = None
+    ) -> None:
+        """
+        Includes or excludes the given items from searches.
+        """
+        ...
+
+    def get_catalog_version(self) -> str | None:
+        """
+        Catalog version (see CatalogRepository.get_version) the index was
+        last saved with.
+        """
+        ...
+
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Returns up to top_k (item_id, score) pairs per query among the active
+        items, best first. Scores are relevance scores: higher is better.
+        Stopwords are ignored, a query made of them only finds nothing.
+        filters works as in VectorRepository.search_batch.
+        """
+        ...
+
+    def find_exact(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[str]]:
+        """
+        Returns, per query, at most top_k active items whose identifier
+        (e.g. a SKU) appears verbatim in the query, in query order.
+        """
+        ...
@@ -0,0 +1,26 @@
+from typing import Protocol
+
+from app.application.dto.match_dtos import MatchCacheStatsDTO
+
+
+class MatchCache(Protocol):
+    def get_many(
+        self, keys: list[str], version: str
+    ) -> dict[str, list[tuple[str, float, str]]]:
+        """
+        Returns the cached (item_id, score, match_type) candidates of the given keys,
+        missing keys are left out. A version other than the one the cache
+        holds drops every entry.
+        """
+        ...
+
+    def set_many(
+        self, entries: dict[str, list[tuple[str, float, str]]], version: str
+    ) -> None:
+        """
+        Stores candidates computed against the given version.
+        """
+        ...
+
+    def get_stats(self) -> MatchCacheStatsDTO:
+        ...
@@ -3,4 +3,11 @@ from typing import Any, Protocol
 
 class Normalizer(Protocol):
 
-    def normalize(self, raw_items: list[dict[str, Any]]) -> list[dict[str, Any]]: ...
+    def normalize(
+        self, raw_items: list[dict[str, Any]], start: int = 0
+    ) -> list[dict[str, Any]]:
+        """
+        start is the file position of raw_items[0], so errors raised while
+        normalizing a chunk name the row of the whole file.
+        """
+        ...
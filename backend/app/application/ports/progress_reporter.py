@@ -0,0 +1,14 @@
+from typing import Protocol
+
+
+class ProgressReporter(Protocol):
+    """
+    Receives the progress of a long running use case. Every call adds count
+    rows to the given stage.
+    """
+
+    def rows_parsed(self, count: int) -> None: ...
+
+    def rows_embedded(self, count: int) -> None: ...
+
+    def rows_indexed(self, count: int) -> None: ...
@@ -2,8 +2,62 @@ from typing import Protocol
 
 
 class VectorRepository(Protocol):
-    def save(self, items: list[dict]) -> None:
+    def save(self, items: list[dict], catalog_version: str | None = None) -> None:
         ...
 
-    def search(self, query_embedding: list[float], top_k: int) -> list[tuple[str, float]]:
-        ...
\ No newline at end of file
+    def upsert(self, items: list[dict], catalog_version: str | None = None) -> None:
+        """
+        Adds the given items or replaces the vectors of the ones already indexed,
+        keeping every other indexed item untouched. The cost depends on the
+        number of given items, not on the size of the index.
+        """
+        ...
+
+    def remove(self, item_ids: list[str], catalog_version: str | None = None) -> None:
+        """
+        Removes the given items from the index. Unknown ids are ignored.
+        """
+        ...
+
+    def set_active(
+        self, item_ids: list[str], active: bool, catalog_version: str | None = None
+    ) -> None:
+        """
+        Includes or excludes the given items from searches without re-indexing
+        their vectors.
+        """
+        ...
+
+    def get_catalog_version(self) -> str | None:
+        """
+        Catalog version (see CatalogRepository.get_version) the index was last
+        committed with. Every write takes the catalog version it brings the
+        index up to, and records it in the same atomic commit as the vectors.
+        """
+        ...
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        category: str | None = None,
+        provider: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Returns up to top_k (item_id, distance) pairs among the active items,
+        optionally restricted to the given category and provider.
+        """
+        ...
+
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Same as search for many queries at once. filters, when given, holds the
+        category/provider filters of each query in the same order.
+        Returns one result list per query.
+        """
+        ...
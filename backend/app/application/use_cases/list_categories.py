@@ -1,5 +1,3 @@
-from typing import Any
-
 from app.application.dto.catalog_dtos import CategoriesListDTO
 from app.application.ports.catalog_repository import CatalogRepository
 
@@ -10,10 +8,6 @@ class ListCategories:
 
     def execute(self) -> CategoriesListDTO:
 
-        items: list[dict[str, Any]] = self.catalog_repository.get()
-
-        categories_set: set[str] = {
-            (str(item.get("category"))) for item in items if item.get("category")
-        }
+        categories: list[str] = self.catalog_repository.list_catagories()
 
-        return CategoriesListDTO(categories=list(categories_set))
+        return CategoriesListDTO(categories=categories)
@@ -1,5 +1,3 @@
-from typing import Any
-
 from app.application.dto.catalog_dtos import ProvidersListDTO
 from app.application.ports.catalog_repository import CatalogRepository
 
@@ -10,10 +8,6 @@ class ListProviders:
 
     def execute(self) -> ProvidersListDTO:
 
-        items: list[dict[str, Any]] = self.catalog_repository.get()
-
-        providers_set: set[str] = {
-            (str(item.get("provider"))) for item in items if item.get("provider")
-        }
+        providers: list[str] = self.catalog_repository.list_providers()
 
-        return ProvidersListDTO(providers=list(providers_set))
+        return ProvidersListDTO(providers=providers)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Optional
 
 from app.application.dto.catalog_dtos import SubcategoriesListDTO
 from app.application.ports.catalog_repository import CatalogRepository
@@ -8,12 +8,10 @@ class ListSubcategories:
     def __init__(self, catalog_repository: CatalogRepository):
         self.catalog_repository = catalog_repository
 
-    def execute(self) -> SubcategoriesListDTO:
+    def execute(self, category: Optional[str] = None) -> SubcategoriesListDTO:
 
-        items: list[dict[str, Any]] = self.catalog_repository.get()
+        subcategories: list[str] = self.catalog_repository.list_subcategories(
+            category=category
+        )
 
-        subcategories_set: set[str] = {
-            (str(item.get("subcategory"))) for item in items if item.get("subcategory")
-        }
-
-        return SubcategoriesListDTO(subcategories=list(subcategories_set))
+        return SubcategoriesListDTO(subcategories=subcategories)
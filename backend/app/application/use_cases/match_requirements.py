@@ -1,17 +1,28 @@
-from typing import Any
+import hashlib
+from itertools import batched
+from typing import Any, BinaryIO
 
-from app.application.dto.match_dtos import MatchItemDTO, MatchResultDTO, RequirementMatchDTO
+from app.application.constants import READ_CHUNK_SIZE
+from app.application.dto.match_dtos import (
+    MatchItemDTO,
+    MatchResultDTO,
+    MatchType,
+    RequirementMatchDTO,
+)
 from app.application.exceptions.empty_requirement_file_exception import (
     EmptyRequirementFileException,
 )
 from app.application.ports.catalog_repository import CatalogRepository
 from app.application.ports.embedding_service import EmbeddingService
 from app.application.ports.file_reader import FileReader
+from app.application.ports.lexical_repository import LexicalRepository
+from app.application.ports.match_cache import MatchCache
 from app.application.ports.normalizer import Normalizer
 from app.application.ports.vector_repository import VectorRepository
-from app.domain.entities.catalog import Catalog
 from app.infrastructure.config import settings
-from app.application.utils.catalog_helpers import convert_to_catalog_items
+
+# (item_id, score, match_type), see MatchType for the meaning of the score
+Candidate = tuple[str, float, MatchType]
 
 
 class MatchRequirements:
@@ -23,6 +34,8 @@ class MatchRequirements:
         embedding_service: EmbeddingService,
         vector_repository: VectorRepository,
         top_k: int = 5,
+        lexical_repository: LexicalRepository | None = None,
+        match_cache: MatchCache | None = None,
     ):
         self.file_reader = file_reader
         self.normalizer = normalizer
@@ -30,61 +43,59 @@ class MatchRequirements:
         self.embedding_service = embedding_service
         self.vector_repository = vector_repository
         self.top_k = top_k
+        self.lexical_repository = lexical_repository
+        self.match_cache = match_cache
 
-    def execute(self, file_bytes: bytes) -> MatchResultDTO:
-        raw_items = self.file_reader.read_requirements(file_bytes)
+    def execute(self, file: BinaryIO) -> MatchResultDTO:
+        normalized_requirements: list[dict[str, Any]] = []
 
-        if not raw_items:
+        # Normalized by chunks while the file is read, never held raw in memory
+        for chunk in batched(self.file_reader.iter_requirements(file), READ_CHUNK_SIZE):
+            normalized_requirements.extend(
+                self.normalizer.normalize(list(chunk), start=len(normalized_requirements))
+            )
+
+        if not normalized_requirements:
             raise EmptyRequirementFileException(
                 "Requirements does not contain any item."
             )
 
-        normalized_requirements = self.normalizer.normalize(raw_items=raw_items)
-
-        persisted_items: list[dict[str, Any]] = self.catalog_repository.get()
-        catalog_items = convert_to_catalog_items(items_data=persisted_items)
-        catalog = Catalog()
-        catalog.batch_upsert(catalog_items)
-
-        output = self._get_matches(
-            normalized_requirements=normalized_requirements, catalog=catalog
-        )
+        output = self._get_matches(normalized_requirements=normalized_requirements)
 
         return output
 
-    def _get_matches(self, normalized_requirements, catalog) -> MatchResultDTO:
+    def _get_matches(self, normalized_requirements) -> MatchResultDTO:
         results: list[RequirementMatchDTO] = []
 
-        for requirement in normalized_requirements:
-            attributes_str = ",".join(
-                f"{k}:{v}" for k, v in requirement.get("attributes", {}).items()
-            )
+        filters = [
+            self._build_search_filters(requirement)
+            for requirement in normalized_requirements
+        ]
+        candidates_per_requirement = self._search(normalized_requirements, filters)
 
-            text_to_embed = (
-                f"name: {requirement.get('name', '')} | "
-                f"description: {requirement.get('description', '')} | "
-                f"category: {requirement.get('category', '')} | "
-                f"subcategory: {requirement.get('subcategory', '')} | "
-                f"unit: {requirement.get('unit', '')} | "
-                f"provider: {requirement.get('provider', '')} | "
-                f"attributes: {attributes_str}"
-            )
-
-            embedding = self.embedding_service.get_embedding(text_to_embed)
-
-            candidates = self.vector_repository.search(
-                query_embedding=embedding,
-                top_k=self.top_k,
+        # Only the candidates are loaded, not the whole catalog
+        catalog_items = self.catalog_repository.get_items_by_id(
+            list(
+                {
+                    item_id
+                    for candidates in candidates_per_requirement
+                    for item_id, _, _ in candidates
+                }
             )
+        )
 
+        for requirement, candidates in zip(
+            normalized_requirements, candidates_per_requirement
+        ):
             matches: list[MatchItemDTO] = []
 
-            for item_id, distance in candidates:
-                if distance > settings.MAX_DISTANCE:
+            for item_id, score, match_type in candidates:
+                item = catalog_items.get(item_id)
+                if item is None:
+                    # Indexed before the catalog it belongs to was read,
+                    # e.g. an index swapped in between both reads
                     continue
 
-                item = catalog.get_item(item_id)
-
                 matches.append(
                     MatchItemDTO(
                         catalog_item_id=item.item_id,
@@ -95,7 +106,8 @@ class MatchRequirements:
                         unit=item.unit,
                         provider=item.provider,
                         attributes=item.attributes,
-                        score=distance,
+                        score=score,
+                        match_type=match_type,
                     )
                 )
 
@@ -109,3 +121,249 @@ class MatchRequirements:
             )
 
         return MatchResultDTO(results=results)
+
+    def _search(
+        self,
+        normalized_requirements: list[dict[str, Any]],
+        filters: list[dict[str, str]],
+    ) -> list[list[Candidate]]:
+        """
+        Returns the (item_id, score, match_type) candidates of every
+        requirement, lower scores are better. Rows only differing by quantity or priority are
+        embedded and searched once, then fanned out in input order.
+        """
+        groups: dict[tuple[str, tuple], int] = {}
+        group_per_requirement: list[int] = []
+        unique_requirements: list[dict[str, Any]] = []
+        unique_filters: list[dict[str, str]] = []
+
+        for requirement, requirement_filters in zip(normalized_requirements, filters):
+            group_key = (
+                self._build_embedding_text(requirement),
+                tuple(sorted(requirement_filters.items())),
+            )
+
+            if group_key not in groups:
+                groups[group_key] = len(unique_requirements)
+                unique_requirements.append(requirement)
+                unique_filters.append(requirement_filters)
+
+            group_per_requirement.append(groups[group_key])
+
+        unique_candidates = self._lookup(unique_requirements, unique_filters)
+
+        return [list(unique_candidates[group]) for group in group_per_requirement]
+
+    def _lookup(
+        self,
+        normalized_requirements: list[dict[str, Any]],
+        filters: list[dict[str, str]],
+    ) -> list[list[Candidate]]:
+        """
+        Requirements found in the match cache are neither embedded nor
+        searched.
+        """
+        lexical_repository = self._get_lexical_repository()
+
+        if self.match_cache is None:
+            return self._retrieve(normalized_requirements, filters, lexical_repository)
+
+        version = self._get_cache_version(lexical_repository)
+        keys = [
+            self._build_cache_key(requirement, requirement_filters)
+            for requirement, requirement_filters in zip(normalized_requirements, filters)
+        ]
+
+        found = self.match_cache.get_many(keys, version)
+        misses = [position for position, key in enumerate(keys) if key not in found]
+
+        if misses:
+            retrieved = self._retrieve(
+                [normalized_requirements[position] for position in misses],
+                [filters[position] for position in misses],
+                lexical_repository,
+            )
+            computed = {
+                keys[position]: candidates
+                for position, candidates in zip(misses, retrieved)
+            }
+            self.match_cache.set_many(computed, version)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def _retrieve(
+        self,
+        normalized_requirements: list[dict[str, Any]],
+        filters: list[dict[str, str]],
+        lexical_repository: LexicalRepository | None,
+    ) -> list[list[Candidate]]:
+        """
+        Without lexical repository, or while it lags behind the catalog, the
+        score is the vector distance. Vector candidates farther than
+        MAX_DISTANCE and lexical ones below MATCH_LEXICAL_MIN_SCORE are
+        dropped before the rankings are fused.
+        """
+        candidates: list[list[Candidate]] = [[] for _ in normalized_requirements]
+        lexical_texts = [
+            self._build_lexical_text(requirement) for requirement in normalized_requirements
+        ]
+
+        # Requirements naming an item identifier are answered without embedding
+        pending = list(range(len(normalized_requirements)))
+        if lexical_repository is not None:
+            exact = lexical_repository.find_exact(
+                lexical_texts, top_k=self.top_k, filters=filters
+            )
+            for position, item_ids in enumerate(exact):
+                candidates[position] = [(item_id, 0.0, "exact") for item_id in item_ids]
+            pending = [position for position in pending if not exact[position]]
+
+        if not pending:
+            return candidates
+
+        embeddings = self.embedding_service.get_embeddings(
+            [
+                self._build_embedding_text(normalized_requirements[position])
+                for position in pending
+            ]
+        )
+
+        # One vectorized search for every requirement instead of one per row
+        vector_results = self.vector_repository.search_batch(
+            query_embeddings=embeddings,
+            top_k=self.top_k,
+            filters=[filters[position] for position in pending],
+        )
+
+        if lexical_repository is None:
+            for position, vector_candidates in zip(pending, vector_results):
+                candidates[position] = [
+                    (item_id, distance, "vector")
+                    for item_id, distance in vector_candidates
+                    if distance <= settings.MAX_DISTANCE
+                ]
+            return candidates
+
+        lexical_results = lexical_repository.search_batch(
+            queries=[lexical_texts[position] for position in pending],
+            top_k=self.top_k,
+            filters=[filters[position] for position in pending],
+        )
+
+        for position, vector_candidates, lexical_candidates in zip(
+            pending, vector_results, lexical_results
+        ):
+            candidates[position] = self._fuse(
+                [
+                    [
+                        item_id
+                        for item_id, distance in vector_candidates
+                        if distance <= settings.MAX_DISTANCE
+                    ],
+                    [
+                        item_id
+                        for item_id, score in lexical_candidates
+                        if score >= settings.MATCH_LEXICAL_MIN_SCORE
+                    ],
+                ]
+            )
+
+        return candidates
+
+    def _get_cache_version(self, lexical_repository: LexicalRepository | None) -> str:
+        # Candidates depend on the catalog and on both indexes it was built into
+        lexical_version = (
+            lexical_repository.get_catalog_version() if lexical_repository else None
+        )
+
+        return (
+            f"{self.catalog_repository.get_version()}|"
+            f"{self.vector_repository.get_catalog_version()}|{lexical_version}"
+        )
+
+    def _build_cache_key(
+        self, requirement: dict[str, Any], filters: dict[str, str]
+    ) -> str:
+        parts = [
+            getattr(self.embedding_service, "model", None),
+            self.top_k,
+            settings.MAX_DISTANCE,
+            settings.MATCH_RRF_K,
+            settings.MATCH_LEXICAL_MIN_SCORE,
+            sorted(filters.items()),
+            self._build_embedding_text(requirement),
+        ]
+
+        return hashlib.sha256(
+            "\x00".join(str(part) for part in parts).encode("utf-8")
+        ).hexdigest()
+
+    def _get_lexical_repository(self) -> LexicalRepository | None:
+        # Built on the next catalog upload, until then match on vectors only
+        if (
+            self.lexical_repository is None
+            or self.lexical_repository.get_catalog_version()
+            != self.catalog_repository.get_version()
+        ):
+            return None
+
+        return self.lexical_repository
+
+    def _fuse(self, rankings: list[list[str]]) -> list[Candidate]:
+        """
+        Reciprocal rank fusion of the given rankings. The fused score is
+        mapped to [0, 1), 0 meaning first in every ranking, so lower is
+        better as for vector distances.
+        """
+        k = settings.MATCH_RRF_K
+        fused: dict[str, float] = {}
+
+        for ranking in rankings:
+            for rank, item_id in enumerate(ranking):
+                fused[item_id] = fused.get(item_id, 0.0) + 1.0 / (k + rank + 1)
+
+        best_possible = len(rankings) / (k + 1)
+        ranked = sorted(fused.items(), key=lambda entry: entry[1], reverse=True)
+
+        return [
+            (item_id, 1.0 - score / best_possible, "hybrid")
+            for item_id, score in ranked[: self.top_k]
+        ]
+
+    def _build_search_filters(self, requirement: dict[str, Any]) -> dict[str, str]:
+        filters: dict[str, str] = {}
+
+        if settings.MATCH_FILTER_BY_CATEGORY and requirement.get("category"):
+            filters["category"] = requirement["category"]
+
+        if settings.MATCH_FILTER_BY_PROVIDER and requirement.get("provider"):
+            filters["provider"] = requirement["provider"]
+
+        return filters
+
+    def _build_lexical_text(self, requirement: dict[str, Any]) -> str:
+        # Same fields as the embedding text, quantity and priority do not
+        # describe the item
+        values = [
+            requirement.get(key)
+            for key in ("name", "description", "category", "subcategory", "unit", "provider")
+        ]
+        values.extend(str(value) for value in requirement.get("attributes", {}).values())
+
+        return " ".join(str(value) for value in values if value)
+
+    def _build_embedding_text(self, requirement: dict[str, Any]) -> str:
+        attributes_str = ",".join(
+            f"{k}:{v}" for k, v in requirement.get("attributes", {}).items()
+        )
+
+        return (
+            f"name: {requirement.get('name', '')} | "
+            f"description: {requirement.get('description', '')} | "
+            f"category: {requirement.get('category', '')} | "
+            f"subcategory: {requirement.get('subcategory', '')} | "
+            f"unit: {requirement.get('unit', '')} | "
+            f"provider: {requirement.get('provider', '')} | "
+            f"attributes: {attributes_str}"
+        )
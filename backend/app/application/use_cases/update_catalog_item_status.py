@@ -1,35 +1,33 @@
-from typing import Any
 from app.application.ports.catalog_repository import CatalogRepository
-from app.application.utils.catalog_helpers import convert_to_catalog_items
-from app.domain.entities.catalog_item import CatalogItem
-from app.domain.entities.catalog import Catalog
+from app.application.ports.lexical_repository import LexicalRepository
+from app.application.ports.vector_repository import VectorRepository
 
 
 class UpdateCatalogItemStatus:
 
-    def __init__(self, catalog_repository: CatalogRepository):
+    def __init__(
+        self,
+        catalog_repository: CatalogRepository,
+        vector_repository: VectorRepository,
+        lexical_repository: LexicalRepository | None = None,
+    ):
         self.catalog_repository = catalog_repository
+        self.vector_repository = vector_repository
+        self.lexical_repository = lexical_repository
 
     def execute(self, item_id: str, active: bool) -> None:
-        persisted_items: list[dict[str, Any]] = self.catalog_repository.get()
-        catalog_items: list[CatalogItem] = convert_to_catalog_items(
-            items_data=persisted_items
+        # Only the affected row is touched, the rest of the catalog is not loaded
+        self.catalog_repository.update_item(item_id=item_id, fields={"active": active})
+
+        # The vector stays indexed, only its search mask changes
+        catalog_version = self.catalog_repository.get_version()
+        self.vector_repository.set_active(
+            item_ids=[item_id],
+            active=active,
+            catalog_version=catalog_version,
         )
-        catalog = Catalog()
-        catalog.batch_upsert(catalog_items)
-        catalog.update_item_status(item_id=item_id, active=active)
-      
-        self.catalog_repository.save(catalog=[
-            {
-                "item_id": item.item_id,
-                "name": item.name,
-                "category": item.category,
-                "subcategory": item.subcategory,
-                "description": item.description,
-                "unit": item.unit,
-                "provider": item.provider,
-                "attributes": item.attributes,
-                "active": item.active,
-            }
-            for item in catalog.get_items().values()
-        ])
+
+        if self.lexical_repository is not None:
+            self.lexical_repository.set_active(
+                item_ids=[item_id], active=active, catalog_version=catalog_version
+            )
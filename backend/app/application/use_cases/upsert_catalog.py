@@ -1,18 +1,32 @@
-from itertools import batched
-from typing import Any
+from array import array
+from collections.abc import Sequence
+from itertools import batched, islice
+from typing import Any, BinaryIO
 
-from app.application.constants import BATCH_SIZE
+from app.application.constants import (
+    BATCH_SIZE,
+    CATALOG_SAVE_ATTEMPTS,
+    EMBEDDING_PROGRESS_CHUNK_SIZE,
+    READ_CHUNK_SIZE,
+)
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
 from app.application.exceptions.empty_catalog_file_exception import (
     EmptyCatalogFileException,
 )
 from app.application.ports.catalog_repository import CatalogRepository
 from app.application.ports.embedding_service import EmbeddingService
 from app.application.ports.file_reader import FileReader
+from app.application.ports.lexical_repository import LexicalRepository
 from app.application.ports.normalizer import Normalizer
+from app.application.ports.progress_reporter import ProgressReporter
 from app.application.ports.vector_repository import VectorRepository
 from app.domain.entities.catalog import Catalog
+from app.domain.entities.catalog_change_set import CatalogChangeSet
 from app.domain.entities.catalog_item import CatalogItem
 from app.application.utils.catalog_helpers import convert_to_catalog_items
+from app.application.utils.null_progress_reporter import NullProgressReporter
 
 
 class UpsertCatalog:
@@ -24,36 +38,106 @@ class UpsertCatalog:
         catalog_repository: CatalogRepository,
         vector_repository: VectorRepository,
         embedding_service: EmbeddingService,
+        lexical_repository: LexicalRepository | None = None,
     ):
         self.file_reader = file_reader
         self.normalizer = normalizer
         self.catalog_repository = catalog_repository
         self.vector_repository = vector_repository
         self.embedding_service = embedding_service
+        self.lexical_repository = lexical_repository
 
-    def execute(self, file_bytes: bytes) -> None:
-        # Open and read the file
-        raw_items = self.file_reader.read_catalog(file_bytes)
+    def validate(self, file: BinaryIO) -> None:
+        """
+        Reads and normalizes the first chunk of the file only, so a file that
+        cannot be read or lacks required columns is rejected before execute
+        runs in the background. Later rows are checked by execute.
+        """
+        first_chunk = list(islice(self.file_reader.iter_catalog(file), READ_CHUNK_SIZE))
 
-        if len(raw_items) == 0:
+        if not first_chunk:
             raise EmptyCatalogFileException("Catalog does not contains any item.")
 
-        # normalize items. Let the normalizer exception raise
-        normalized_items = self.normalizer.normalize(raw_items)
+        self.normalizer.normalize(first_chunk, start=0)
+
+    def execute(
+        self, file: BinaryIO, progress_reporter: ProgressReporter | None = None
+    ) -> None:
+        progress = progress_reporter or NullProgressReporter()
+
+        # Read, normalize and merge the file by chunks so only the catalog
+        # itself is held in memory. Let the normalizer exception raise
+        catalog: Catalog | None = None
+        persisted_version: str | None = None
+        change_set = CatalogChangeSet()
+        rows_read = 0
+
+        for chunk in batched(self.file_reader.iter_catalog(file), READ_CHUNK_SIZE):
+            normalized_items = self.normalizer.normalize(list(chunk), start=rows_read)
+
+            # Get the persisted items once the file is known to be valid
+            if catalog is None:
+                persisted_version = self.catalog_repository.get_version()
+                catalog = self._build_catalog_from_persistence()
+
+            self._apply_new_items(
+                catalog=catalog,
+                normalized_items=convert_to_catalog_items(normalized_items),
+                change_set=change_set,
+            )
+
+            rows_read += len(chunk)
+            progress.rows_parsed(len(chunk))
+
+        if catalog is None:
+            raise EmptyCatalogFileException("Catalog does not contains any item.")
 
-        # Get the persisted items & Add items to the catalog by batches using itertools
-        catalog: Catalog = self._build_catalog_from_persistence()
-        self._apply_new_items(
-            catalog=catalog,
-            normalized_items=convert_to_catalog_items(normalized_items),
+        # The index records the catalog version it was built from. A different
+        # version means a previous upload died between both commits.
+        catalog_version = self.catalog_repository.get_version()
+        index_in_sync = self.vector_repository.get_catalog_version() == catalog_version
+        lexical_in_sync = (
+            self.lexical_repository is None
+            or self.lexical_repository.get_catalog_version() == catalog_version
         )
 
+        # Nothing to persist nor to embed when the upload matches the catalog
+        if not change_set.has_changes() and index_in_sync and lexical_in_sync:
+            return
+
         # Persist the catalog.
-        items_to_save = self._map_catalog_to_persistence(catalog)
-        self.catalog_repository.save(items_to_save)
+        if change_set.has_changes():
+            self._save_catalog(catalog, persisted_version)
+
+        # Create embeddings & index only the inserted or updated items, or the
+        # whole catalog when the index has to catch up
+        if index_in_sync:
+            item_ids = change_set.get_changed_ids()
+        else:
+            item_ids = list(catalog.get_items())
+
+        catalog_version = self.catalog_repository.get_version()
 
-        # Create embeddings & save embeddings
-        self._recreate_embeddings(catalog)
+        if item_ids:
+            self._update_embeddings(
+                catalog,
+                item_ids,
+                catalog_version=catalog_version,
+                progress=progress,
+            )
+
+        # Same for the lexical index, rebuilt whole when it has to catch up
+        if self.lexical_repository is not None:
+            if lexical_in_sync:
+                self.lexical_repository.upsert(
+                    self._map_catalog_to_lexical(catalog, change_set.get_changed_ids()),
+                    catalog_version=catalog_version,
+                )
+            else:
+                self.lexical_repository.save(
+                    self._map_catalog_to_lexical(catalog, list(catalog.get_items())),
+                    catalog_version=catalog_version,
+                )
 
     def _build_catalog_from_persistence(self) -> Catalog:
         catalog = Catalog()
@@ -66,12 +150,41 @@ class UpsertCatalog:
 
         return catalog
 
+    def _save_catalog(self, catalog: Catalog, persisted_version: str | None) -> None:
+        # Status changes may land while the file is read. Save only over the
+        # catalog the merge started from, otherwise take their flags and retry
+        for attempt in range(1, CATALOG_SAVE_ATTEMPTS + 1):
+            try:
+                self.catalog_repository.save(
+                    self._map_catalog_to_persistence(catalog),
+                    expected_version=persisted_version,
+                )
+                return
+            except CatalogVersionConflictException:
+                if attempt == CATALOG_SAVE_ATTEMPTS:
+                    raise
+
+                persisted_version = self.catalog_repository.get_version()
+                self._apply_persisted_status(catalog)
+
+    def _apply_persisted_status(self, catalog: Catalog) -> None:
+        items = catalog.get_items()
+
+        for persisted_item in self.catalog_repository.get() or []:
+            item = items.get(persisted_item["item_id"])
+            active = persisted_item.get("active", True)
+            if item is not None and item.active != active:
+                catalog.update_item_status(item.item_id, active)
+
     def _apply_new_items(
-        self, catalog: Catalog, normalized_items: list[CatalogItem]
+        self,
+        catalog: Catalog,
+        normalized_items: list[CatalogItem],
+        change_set: CatalogChangeSet,
     ) -> None:
 
         for batch in batched(normalized_items, BATCH_SIZE):
-            catalog.batch_upsert(list(batch))
+            catalog.batch_upsert(list(batch), change_set=change_set)
 
     def _map_catalog_to_persistence(self, catalog: Catalog):
         return [
@@ -89,15 +202,68 @@ class UpsertCatalog:
             for item in catalog.get_items().values()
         ]
 
-    def _recreate_embeddings(self, catalog: Catalog) -> None:
-        vector_items = []
+    def _map_catalog_to_lexical(
+        self, catalog: Catalog, item_ids: Sequence[str]
+    ) -> list[dict[str, Any]]:
+        items = catalog.get_items()
 
-        for item in catalog.get_items().values():
-            text = self._build_embedding_text(item)
-            embedding = self.embedding_service.get_embedding(text)
-            vector_items.append({"item_id": item.item_id, "embedding": embedding})
+        return [
+            {
+                "item_id": item.item_id,
+                "text": self._build_lexical_text(item),
+                "active": item.active,
+                "category": item.category,
+                "provider": item.provider,
+            }
+            for item in (items[item_id] for item_id in item_ids)
+        ]
+
+    def _update_embeddings(
+        self,
+        catalog: Catalog,
+        item_ids: list[str],
+        catalog_version: str,
+        progress: ProgressReporter,
+    ) -> None:
+        items = [catalog.get_item(item_id) for item_id in item_ids]
+
+        # Embed by chunks so progress moves while the embedding calls run.
+        # Packed as float32, a list of Python floats takes 8 times the memory
+        embeddings: list[Sequence[float]] = []
+        for chunk in batched(items, EMBEDDING_PROGRESS_CHUNK_SIZE):
+            embeddings.extend(
+                array("f", embedding)
+                for embedding in self.embedding_service.get_embeddings(
+                    [self._build_embedding_text(item) for item in chunk]
+                )
+            )
+            progress.rows_embedded(len(chunk))
 
-        self.vector_repository.save(vector_items)
+        vector_items = [
+            {
+                "item_id": item.item_id,
+                "embedding": embedding,
+                "active": item.active,
+                "category": item.category,
+                "provider": item.provider,
+            }
+            for item, embedding in zip(items, embeddings)
+        ]
+
+        self.vector_repository.upsert(vector_items, catalog_version=catalog_version)
+        progress.rows_indexed(len(vector_items))
+
+    def _build_lexical_text(self, item: CatalogItem) -> str:
+        values = [
+            item.name,
+            item.category,
+            item.subcategory,
+            item.description,
+            item.unit,
+            item.provider,
+            *(str(value) for value in item.attributes.values()),
+        ]
+        return " ".join(value for value in values if value)
 
     def _build_embedding_text(self, item: CatalogItem) -> str:
         return (
@@ -29,6 +29,7 @@ def convert_to_catalog_items(
             subcategory=item_data.get("subcategory"),
             unit=item_data.get("unit"),
             provider=item_data.get("provider"),
+            active=item_data.get("active", True),
             attributes=item_data.get("attributes", {}),
         )
         catalog_items.append(catalog_item)
@@ -0,0 +1,14 @@
+from app.application.ports.progress_reporter import ProgressReporter
+
+
+class NullProgressReporter(ProgressReporter):
+    """Discards progress, used when the caller does not follow it."""
+
+    def rows_parsed(self, count: int) -> None:
+        pass
+
+    def rows_embedded(self, count: int) -> None:
+        pass
+
+    def rows_indexed(self, count: int) -> None:
+        pass
@@ -1,8 +1,10 @@
 from datetime import datetime
 from typing import Any, Optional
 
+from app.domain.entities.catalog_change_set import CatalogChangeSet
 from app.domain.entities.catalog_item import CatalogItem
 from app.domain.enums.catalog_sources import CatalogSource
+from app.domain.enums.item_change_type import ItemChangeType
 from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
 
 
@@ -72,8 +74,8 @@ class Catalog:
         self.version += 1
         self.last_updated = datetime.now()
 
-    def _add_or_update_item_internal(self, item: CatalogItem) -> None:
-        """Internal method to add items by batches."""
+    def _add_or_update_item_internal(self, item: CatalogItem) -> ItemChangeType:
+        """Internal method to add items by batches. Returns what happened to the item."""
         existing_item = self.items.get(item.item_id)
 
         if existing_item is None:
@@ -86,7 +88,9 @@ class Catalog:
                 unit=item.unit,
                 provider=item.provider,
                 attributes=item.attributes or {},
+                active=item.active,
             )
+            return ItemChangeType.INSERTED
         else:
             updated_item = existing_item
             if item.name is not None:
@@ -104,10 +108,22 @@ class Catalog:
             if item.attributes is not None:
                 updated_item = updated_item.replace_attributes(item.attributes)
 
+            if updated_item == existing_item:
+                return ItemChangeType.UNCHANGED
+
             self.items[item.item_id] = updated_item
+            return ItemChangeType.UPDATED
 
     ## add or update in batches
-    def batch_upsert(self, list_items: list[CatalogItem]) -> dict[str, Any]:
+    def batch_upsert(
+        self,
+        list_items: list[CatalogItem],
+        change_set: Optional[CatalogChangeSet] = None,
+    ) -> dict[str, Any]:
+        """
+        Adds or updates the given items and returns the errors per item_id.
+        When a change set is given, the outcome of every valid item is recorded in it.
+        """
         errors: dict[str, Any] = {}
 
         for item in list_items:
@@ -117,7 +133,9 @@ class Catalog:
                 continue
 
             try:
-                self._add_or_update_item_internal(item=item)
+                change_type = self._add_or_update_item_internal(item=item)
+                if change_set is not None:
+                    change_set.record(item_id, change_type)
             except Exception as e:
                 errors[item_id] = str(e)
 
@@ -0,0 +1,52 @@
+from dataclasses import dataclass, field
+
+from app.domain.enums.item_change_type import ItemChangeType
+
+
+@dataclass(slots=True)
+class CatalogChangeSet:
+    """Outcome of one or more batch upserts for every item id they touched."""
+
+    changes: dict[str, ItemChangeType] = field(default_factory=dict)
+
+    def record(self, item_id: str, change_type: ItemChangeType) -> None:
+        # An id keeps its strongest outcome: inserted > updated > unchanged
+        current = self.changes.get(item_id)
+
+        if current is ItemChangeType.INSERTED:
+            return
+        if current is ItemChangeType.UPDATED and change_type is ItemChangeType.UNCHANGED:
+            return
+
+        self.changes[item_id] = change_type
+
+    @property
+    def inserted(self) -> list[str]:
+        return self._ids_with(ItemChangeType.INSERTED)
+
+    @property
+    def updated(self) -> list[str]:
+        return self._ids_with(ItemChangeType.UPDATED)
+
+    @property
+    def unchanged(self) -> list[str]:
+        return self._ids_with(ItemChangeType.UNCHANGED)
+
+    def get_changed_ids(self) -> list[str]:
+        return [
+            item_id
+            for item_id, change_type in self.changes.items()
+            if change_type is not ItemChangeType.UNCHANGED
+        ]
+
+    def has_changes(self) -> bool:
+        return any(
+            change_type is not ItemChangeType.UNCHANGED
+            for change_type in self.changes.values()
+        )
+
+    def _ids_with(self, change_type: ItemChangeType) -> list[str]:
+        return [
+            item_id for item_id, item_change in self.changes.items()
+            if item_change is change_type
+        ]
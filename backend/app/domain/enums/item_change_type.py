@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ItemChangeType(Enum):
+    INSERTED = 'INSERTED'
+    UPDATED = 'UPDATED'
+    UNCHANGED = 'UNCHANGED'
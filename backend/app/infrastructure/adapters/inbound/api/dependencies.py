@@ -1,46 +1,176 @@
 # File dependencies
 from pathlib import Path
 
-from fastapi import Depends
+from anyio import CapacityLimiter
+from fastapi import Depends, Request
 
 from app.application.normalizers.catalog_normalizer import CatalogNormalizer
 from app.application.normalizers.requirements_normalizer import RequirementNormalizer
 from app.application.ports.catalog_repository import CatalogRepository
 from app.application.ports.embedding_service import EmbeddingService
+from app.application.ports.file_reader import FileReader
+from app.application.ports.lexical_repository import LexicalRepository
+from app.application.ports.match_cache import MatchCache
 from app.application.ports.vector_repository import VectorRepository
+from app.application.utils.catalog_helpers import resolve_source
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_cached import (
+    CachedCatalogRepository,
+)
 from app.infrastructure.adapters.outbound.catalog.catalog_repository_csv import (
     CatalogRepositoryCSV,
 )
-from app.infrastructure.adapters.outbound.embeddings.embedding_service_open_ai import (
-    OpenAIEmbeddingService,
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_sqlite import (
+    CatalogRepositorySQLite,
+)
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_cached import (
+    CachedEmbeddingService,
+)
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_hashing import (
+    HashingEmbeddingService,
+)
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_open_ai_async import (
+    AsyncOpenAIEmbeddingService,
+)
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_sync_bridge import (
+    SyncEmbeddingServiceBridge,
 )
 from app.infrastructure.adapters.outbound.files.file_reader_csv import FileReaderCSV
+from app.infrastructure.adapters.outbound.files.file_reader_xlsx import FileReaderXLSX
+from app.infrastructure.adapters.outbound.lexical_store.lexical_repository_bm25 import (
+    LexicalRepositoryBM25,
+)
+from app.infrastructure.adapters.outbound.match_cache.match_cache_memory import (
+    InMemoryMatchCache,
+)
 from app.infrastructure.adapters.outbound.vector_store.vector_repository_faiss import (
     VectorRepositoryFAISS,
 )
+from app.domain.enums.catalog_sources import CatalogSource
 from app.infrastructure.config import settings
+from app.infrastructure.jobs.job_manager import JobManager
+
 
+def build_file_reader(filename: str) -> FileReader:
+    # Picked per upload, the extension is validated beforehand
+    if resolve_source(filename) == CatalogSource.XLSX:
+        return FileReaderXLSX()
 
-def get_file_reader() -> FileReaderCSV:
     return FileReaderCSV()
 
 
 # Repository dependencies
-def get_catalog_repository() -> CatalogRepository:
-    return CatalogRepositoryCSV(csv_path=Path(settings.REPOSITORY_FILE_PATH))
+def build_catalog_repository() -> CatalogRepository:
+    catalog_repository: CatalogRepository
+    if settings.REPOSITORY_BACKEND.lower() == "sqlite":
+        catalog_repository = CatalogRepositorySQLite(
+            db_path=Path(settings.REPOSITORY_SQLITE_PATH)
+        )
+    else:
+        catalog_repository = CatalogRepositoryCSV(
+            csv_path=Path(settings.REPOSITORY_FILE_PATH)
+        )
+
+    if not settings.CATALOG_CACHE_ENABLED:
+        return catalog_repository
+
+    return CachedCatalogRepository(catalog_repository=catalog_repository)
+
+
+def get_catalog_repository(request: Request) -> CatalogRepository:
+    # Shared by every request so the in-memory cache outlives a single call
+    return request.app.state.catalog_repository
 
 
 # Service dependencies
-def get_embedding_service() -> EmbeddingService:
-    return OpenAIEmbeddingService()
+def build_embedding_service() -> HashingEmbeddingService | SyncEmbeddingServiceBridge:
+    if settings.EMBEDDING_BACKEND.lower() == "hashing":
+        return HashingEmbeddingService(dimension=settings.VECTOR_DIMENSION)
+
+    # The use cases are synchronous, the bridge runs the async client on its
+    # own event loop thread
+    return SyncEmbeddingServiceBridge(AsyncOpenAIEmbeddingService())
+
+
+def build_cached_embedding_service(
+    embedding_service: HashingEmbeddingService | SyncEmbeddingServiceBridge,
+) -> EmbeddingService:
+    # Local embeddings are computed faster than they are read from the cache
+    if not settings.EMBEDDING_CACHE_ENABLED or isinstance(
+        embedding_service, HashingEmbeddingService
+    ):
+        return embedding_service
 
+    return CachedEmbeddingService(
+        embedding_service=embedding_service,
+        model=embedding_service.model,
+        path=Path(settings.EMBEDDING_CACHE_PATH),
+    )
+
+
+def get_embedding_service(request: Request) -> EmbeddingService:
+    # Shared so every request goes through the same connection pool and
+    # rate limits
+    return request.app.state.embedding_service
 
-def get_vector_repository() -> VectorRepository:
+
+def build_vector_repository() -> VectorRepository:
     return VectorRepositoryFAISS(
         dimension=settings.VECTOR_DIMENSION, path=Path(settings.VECTOR_FILE_PATH)
     )
 
 
+def get_vector_repository(request: Request) -> VectorRepository:
+    # Loaded once in the app lifespan and shared by every request
+    return request.app.state.vector_repository
+
+
+def build_lexical_repository() -> LexicalRepository:
+    # Stored next to the FAISS index it is fused with
+    return LexicalRepositoryBM25(
+        path=Path(settings.VECTOR_FILE_PATH).with_suffix(".lexical.npz")
+    )
+
+
+def get_lexical_repository(request: Request) -> LexicalRepository | None:
+    if not settings.MATCH_HYBRID_ENABLED:
+        return None
+
+    return request.app.state.lexical_repository
+
+
+# Match cache dependencies
+def build_match_cache() -> MatchCache | None:
+    if not settings.MATCH_CACHE_ENABLED:
+        return None
+
+    return InMemoryMatchCache()
+
+
+def get_match_cache(request: Request) -> MatchCache | None:
+    # Shared so repeated requirements hit across uploads
+    return request.app.state.match_cache
+
+
+# Job dependencies
+def build_job_manager() -> JobManager:
+    return JobManager()
+
+
+def get_job_manager(request: Request) -> JobManager:
+    # Jobs outlive the request that submitted them
+    return request.app.state.job_manager
+
+
+# Thread limiter dependencies
+def build_match_limiter() -> CapacityLimiter:
+    return CapacityLimiter(settings.MATCH_MAX_CONCURRENCY)
+
+
+def get_match_limiter(request: Request) -> CapacityLimiter:
+    # Shared so the bound applies to every match request of the process
+    return request.app.state.match_limiter
+
+
 # Normalizer dependency
 def get_catalog_normalizer() -> CatalogNormalizer:
     return CatalogNormalizer()
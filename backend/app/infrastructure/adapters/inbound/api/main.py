@@ -1,3 +1,17 @@
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
+
+from app.infrastructure.adapters.inbound.api.dependencies import (
+    build_cached_embedding_service,
+    build_catalog_repository,
+    build_embedding_service,
+    build_job_manager,
+    build_lexical_repository,
+    build_match_cache,
+    build_match_limiter,
+    build_vector_repository,
+)
 from app.infrastructure.adapters.inbound.api.middleware.error_handler_middleware import (
     ErrorHandlerMiddleware,
 )
@@ -9,10 +23,30 @@ from app.infrastructure.adapters.inbound.api.routers.templates import template_r
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Deserialize the FAISS index once per process instead of once per request
+    app.state.vector_repository = build_vector_repository()
+    app.state.catalog_repository = build_catalog_repository()
+    app.state.lexical_repository = build_lexical_repository()
+    app.state.job_manager = build_job_manager()
+    app.state.match_limiter = build_match_limiter()
+    app.state.match_cache = build_match_cache()
+    embedding_service = build_embedding_service()
+    app.state.embedding_service = build_cached_embedding_service(embedding_service)
+    yield
+    # Let the running job commit, drop the queued ones. Waiting happens in a
+    # worker thread so the event loop keeps serving until the job is done
+    await to_thread.run_sync(app.state.job_manager.shutdown)
+    embedding_service.close()
+
+
 app = FastAPI(
     title="Catalog Requirement Matcher API",
     description="API for matching catalog items with requirements using embeddings and vector search.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(ErrorHandlerMiddleware)
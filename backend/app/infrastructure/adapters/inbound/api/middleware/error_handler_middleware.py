@@ -14,6 +14,9 @@ from app.domain.exceptions.invalid_catalog_item_exception import (
     InvalidCatalogItemException,
 )
 from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
+from app.infrastructure.exceptions.catalog_repository_validation_exception import (
+    CatalogRepositoryValidationException,
+)
 from app.infrastructure.exceptions.embedding_service_validation_exception import (
     EmbeddingServiceValidationException,
 )
@@ -23,6 +26,12 @@ from app.infrastructure.exceptions.infrastructure_exception import (
 from app.infrastructure.exceptions.invalid_file_type_exception import (
     InvalidFileTypeException,
 )
+from app.infrastructure.exceptions.job_not_found_exception import (
+    JobNotFoundException,
+)
+from app.infrastructure.exceptions.job_queue_full_exception import (
+    JobQueueFullException,
+)
 from app.infrastructure.exceptions.vector_repository_validation_exception import (
     VectorRepositoryValidationException,
 )
@@ -45,6 +54,26 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     "correlation_id": correlation_id,
                 },
             )
+        except JobNotFoundException as exc:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={
+                    "error_code": "job_not_found",
+                    "message": str(exc),
+                    "details": None,
+                    "correlation_id": correlation_id,
+                },
+            )
+        except JobQueueFullException as exc:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "error_code": "job_queue_full",
+                    "message": str(exc),
+                    "details": None,
+                    "correlation_id": correlation_id,
+                },
+            )
         except InvalidCatalogItemException as exc:
             return JSONResponse(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
@@ -67,6 +96,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             )
         except (
             InvalidFileTypeException,
+            CatalogRepositoryValidationException,
             EmbeddingServiceValidationException,
             VectorRepositoryValidationException,
         ) as exc:
@@ -6,7 +6,9 @@ from app.application.dto.catalog_dtos import (
     ProvidersListDTO,
     SubcategoriesListDTO,
 )
+from app.application.dto.job_dtos import JobStatusDTO
 from app.application.ports.catalog_repository import CatalogRepository
+from app.application.ports.lexical_repository import LexicalRepository
 from app.application.ports.normalizer import Normalizer
 from app.application.use_cases.list_catalog_items import ListCatalogItems
 from app.application.use_cases.list_categories import ListCategories
@@ -22,7 +24,10 @@ from app.infrastructure.adapters.outbound import *
 from app.infrastructure.adapters.outbound.vector_store.vector_repository_faiss import (
     VectorRepositoryFAISS,
 )
+from app.infrastructure.jobs.job_manager import JobManager
 from app.infrastructure.utils.file_validation import validate_file_extension
+from app.infrastructure.utils.upload_spool import spool_upload
+from anyio import to_thread
 from fastapi import APIRouter, Body, Depends, File, Path, Query, UploadFile, status
 
 catalog_router = APIRouter(
@@ -43,17 +48,22 @@ def list_catalog(
     )
 
 
-@catalog_router.post("/items", status_code=status.HTTP_200_OK)
+@catalog_router.post(
+    "/items", status_code=status.HTTP_202_ACCEPTED, response_model=JobStatusDTO
+)
 async def upsert_catalog(
-    # background_tasks: BackgroundTasks,
+    job_manager: Annotated[JobManager, Depends(get_job_manager)],
     catalog_repository: Annotated[CatalogRepository, Depends(get_catalog_repository)],
-    file_reader: Annotated[FileReaderCSV, Depends(get_file_reader)],
     normalizer: Annotated[Normalizer, Depends(get_catalog_normalizer)],
     vector_repository: Annotated[VectorRepositoryFAISS, Depends(get_vector_repository)],
     embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    lexical_repository: Annotated[
+        LexicalRepository | None, Depends(get_lexical_repository)
+    ],
     catalog_file: UploadFile = File(...),
 ):
     validate_file_extension(catalog_file)
+    file_reader = build_file_reader(catalog_file.filename)
 
     use_case = UpsertCatalog(
         file_reader=file_reader,
@@ -61,15 +71,48 @@ async def upsert_catalog(
         catalog_repository=catalog_repository,
         vector_repository=vector_repository,
         embedding_service=embedding_service,
+        lexical_repository=lexical_repository,
     )
 
-    file_bytes = await catalog_file.read()
-    use_case.execute(file_bytes)
-    # background_tasks.add_task(
-    #     use_case.execute,
-    #     file_bytes)
+    # The upload is closed with the request, the job streams its own copy
+    spooled_path = await spool_upload(catalog_file)
+
+    def validate():
+        with open(spooled_path, "rb") as spooled_file:
+            use_case.validate(spooled_file)
+
+    # Unreadable files and missing columns are answered now, instead of
+    # only showing up in the job status
+    try:
+        await to_thread.run_sync(validate)
+    except Exception:
+        spooled_path.unlink(missing_ok=True)
+        raise
+
+    def run(progress):
+        try:
+            with open(spooled_path, "rb") as spooled_file:
+                use_case.execute(spooled_file, progress_reporter=progress)
+        finally:
+            spooled_path.unlink(missing_ok=True)
+
+    # Read, normalize, embed and index on the job workers, poll the returned
+    # job through GET /catalog/jobs/{job_id}
+    try:
+        return job_manager.submit(run)
+    except Exception:
+        spooled_path.unlink(missing_ok=True)
+        raise
 
-    return
+
+@catalog_router.get(
+    "/jobs/{job_id}", status_code=status.HTTP_200_OK, response_model=JobStatusDTO
+)
+def get_catalog_job(
+    job_id: Annotated[str, Path()],
+    job_manager: Annotated[JobManager, Depends(get_job_manager)],
+):
+    return job_manager.get(job_id)
 
 
 @catalog_router.get(
@@ -101,10 +144,11 @@ def list_providers(
 )
 def list_subcategories(
     catalog_repository: Annotated[CatalogRepository, Depends(get_catalog_repository)],
+    category: Annotated[str | None, Query()] = None,
 ):
     use_case = ListSubcategories(catalog_repository=catalog_repository)
 
-    return use_case.execute()
+    return use_case.execute(category=category)
 
 
 @catalog_router.patch("/items/{item_id}/status", status_code=status.HTTP_204_NO_CONTENT)
@@ -112,9 +156,17 @@ def update_catalog_item_status(
     item_id: Annotated[str, Path()],
     status: Annotated[UpdateCatalogItemStatusDTO, Body()],
     catalog_repository: Annotated[CatalogRepository, Depends(get_catalog_repository)],
+    vector_repository: Annotated[VectorRepositoryFAISS, Depends(get_vector_repository)],
+    lexical_repository: Annotated[
+        LexicalRepository | None, Depends(get_lexical_repository)
+    ],
 ):
 
-    use_case = UpdateCatalogItemStatus(catalog_repository=catalog_repository)
+    use_case = UpdateCatalogItemStatus(
+        catalog_repository=catalog_repository,
+        vector_repository=vector_repository,
+        lexical_repository=lexical_repository,
+    )
 
     use_case.execute(item_id=item_id, active=status.active)
     return
@@ -1,9 +1,12 @@
 from typing import Annotated
 
+from anyio import CapacityLimiter, to_thread
 from fastapi import APIRouter, Depends, File, UploadFile, status
 
-from app.application.dto.match_dtos import MatchResultDTO
+from app.application.dto.match_dtos import MatchCacheStatsDTO, MatchResultDTO
 from app.application.ports.catalog_repository import CatalogRepository
+from app.application.ports.lexical_repository import LexicalRepository
+from app.application.ports.match_cache import MatchCache
 from app.application.ports.normalizer import Normalizer
 from app.application.use_cases.match_requirements import MatchRequirements
 from app.infrastructure.adapters.inbound.api.dependencies import *
@@ -24,19 +27,45 @@ requirement_router = APIRouter(
 )
 async def match(
     catalog_repository: Annotated[CatalogRepository, Depends(get_catalog_repository)],
-    file_reader: Annotated[FileReaderCSV, Depends(get_file_reader)],
     normalizer: Annotated[Normalizer, Depends(get_requirement_normalizer)],
     vector_repository: Annotated[VectorRepositoryFAISS, Depends(get_vector_repository)],
     embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    lexical_repository: Annotated[
+        LexicalRepository | None, Depends(get_lexical_repository)
+    ],
+    match_cache: Annotated[MatchCache | None, Depends(get_match_cache)],
+    match_limiter: Annotated[CapacityLimiter, Depends(get_match_limiter)],
     requirement_file: UploadFile = File(...),
 ):
     validate_file_extension(requirement_file)
-    
+    file_reader = build_file_reader(requirement_file.filename)
+
     use_case = MatchRequirements(
         file_reader=file_reader,
         normalizer=normalizer,
         catalog_repository=catalog_repository,
         vector_repository=vector_repository,
         embedding_service=embedding_service,
+        lexical_repository=lexical_repository,
+        match_cache=match_cache,
+    )
+    # Parsing, embedding calls and FAISS search are blocking, run them on a
+    # worker thread so the event loop keeps serving other requests. The
+    # spooled upload is streamed, never read whole in memory
+    return await to_thread.run_sync(
+        use_case.execute, requirement_file.file, limiter=match_limiter
     )
-    return use_case.execute(file_bytes=await requirement_file.read())
\ No newline at end of file
+
+
+@requirement_router.get(
+    "/matches/cache", status_code=status.HTTP_200_OK, response_model=MatchCacheStatsDTO
+)
+def match_cache_stats(
+    match_cache: Annotated[MatchCache | None, Depends(get_match_cache)],
+):
+    if match_cache is None:
+        return MatchCacheStatsDTO(
+            hits=0, misses=0, hit_rate=None, entries=0, evictions=0, invalidations=0
+        )
+
+    return match_cache.get_stats()
@@ -0,0 +1,121 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.application.ports.catalog_repository import CatalogRepository
+from app.application.utils.catalog_helpers import convert_to_catalog_items
+from app.domain.entities.catalog_item import CatalogItem
+
+
+@dataclass(slots=True)
+class _CatalogSnapshot:
+    version: str
+    rows: list[dict[str, Any]]
+    items: list[CatalogItem] | None = field(default=None)
+    items_by_id: dict[str, CatalogItem] | None = field(default=None)
+
+
+class CachedCatalogRepository(CatalogRepository):
+    """
+    Keeps the parsed rows and CatalogItem objects of the wrapped repository in
+    memory. They are reloaded only when the wrapped repository reports a new
+    version, i.e. when the persisted catalog was modified.
+    """
+
+    def __init__(self, catalog_repository: CatalogRepository):
+        self.catalog_repository = catalog_repository
+        self._lock = threading.Lock()
+        self._snapshot: _CatalogSnapshot | None = None
+
+    def get(self) -> list[dict[str, Any]]:
+        # Callers get their own rows, a mutation must not reach the cache
+        return [self._copy_row(row) for row in self._current().rows]
+
+    def get_catalog_items(self) -> list[CatalogItem]:
+        return list(self._items(self._current()))
+
+    def get_items_by_id(self, item_ids: list[str]) -> dict[str, CatalogItem]:
+        snapshot = self._current()
+
+        # Built once per version, lookups then cost O(len(item_ids))
+        if snapshot.items_by_id is None:
+            items = self._items(snapshot)
+            with self._lock:
+                if snapshot.items_by_id is None:
+                    snapshot.items_by_id = {item.item_id: item for item in items}
+
+        return {
+            item_id: snapshot.items_by_id[item_id]
+            for item_id in item_ids
+            if item_id in snapshot.items_by_id
+        }
+
+    def get_version(self) -> str:
+        return self.catalog_repository.get_version()
+
+    def save(
+        self, catalog: list[dict[str, Any]], expected_version: str | None = None
+    ) -> None:
+        try:
+            self.catalog_repository.save(catalog, expected_version=expected_version)
+        finally:
+            self._snapshot = None
+
+    def update_item(self, item_id: str, fields: dict[str, Any]) -> None:
+        try:
+            self.catalog_repository.update_item(item_id, fields)
+        finally:
+            self._snapshot = None
+
+    def list_catagories(self) -> list[str]:
+        return self._distinct("category")
+
+    def list_providers(self) -> list[str]:
+        return self._distinct("provider")
+
+    def list_subcategories(self, category: str | None = None) -> list[str]:
+        return self._distinct("subcategory", category=category)
+
+    def _distinct(self, field_name: str, category: str | None = None) -> list[str]:
+        return list(
+            {
+                str(row.get(field_name))
+                for row in self._current().rows
+                if row.get(field_name)
+                and (not category or row.get("category") == category)
+            }
+        )
+
+    @staticmethod
+    def _copy_row(row: dict[str, Any]) -> dict[str, Any]:
+        copy = dict(row)
+        # attributes is the only nested value of a row
+        if isinstance(copy.get("attributes"), dict):
+            copy["attributes"] = dict(copy["attributes"])
+        return copy
+
+    def _items(self, snapshot: _CatalogSnapshot) -> list[CatalogItem]:
+        # CatalogItem objects are only built when a caller needs them
+        if snapshot.items is None:
+            with self._lock:
+                if snapshot.items is None:
+                    snapshot.items = convert_to_catalog_items(snapshot.rows)
+
+        return snapshot.items
+
+    def _current(self) -> _CatalogSnapshot:
+        version = self.catalog_repository.get_version()
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = _CatalogSnapshot(
+                    version=version, rows=self.catalog_repository.get()
+                )
+                self._snapshot = snapshot
+
+        return snapshot
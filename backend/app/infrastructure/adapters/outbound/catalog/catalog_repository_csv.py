@@ -1,10 +1,21 @@
 import csv
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
 from app.application.ports.catalog_repository import CatalogRepository
+from app.application.utils.catalog_helpers import convert_to_catalog_items
 from app.domain.entities.catalog import Catalog
+from app.domain.entities.catalog_item import CatalogItem
+from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
+from app.infrastructure.exceptions.catalog_repository_validation_exception import (
+    CatalogRepositoryValidationException,
+)
+from app.infrastructure.utils.atomic_files import atomic_write
 
 
 class CatalogRepositoryCSV(CatalogRepository):
@@ -24,6 +35,8 @@ class CatalogRepositoryCSV(CatalogRepository):
     def __init__(self, csv_path: Path | None = None) -> None:
         self.csv_path = csv_path or Path("data") / "catalog" / "catalog.csv"
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        # Writes read the file they replace, run them one at a time
+        self._write_lock = threading.Lock()
 
     def get(self) -> list[dict[str, Any]]:
         if not self.csv_path.exists():
@@ -56,14 +69,94 @@ class CatalogRepositoryCSV(CatalogRepository):
 
             return items
 
-    def save(self, catalog: list[dict[str, Any]]) -> None:
-        with open(self.csv_path, mode="w", newline="", encoding="utf-8") as file:
+    def get_catalog_items(self) -> list[CatalogItem]:
+        return convert_to_catalog_items(self.get())
+
+    def get_items_by_id(self, item_ids: list[str]) -> dict[str, CatalogItem]:
+        wanted = set(item_ids)
+        rows = [row for row in self.get() if row["item_id"] in wanted]
+        return {item.item_id: item for item in convert_to_catalog_items(rows)}
+
+    def get_version(self) -> str:
+        if not self.csv_path.exists():
+            return ""
+
+        stat = self.csv_path.stat()
+        # Writes replace the file, so a new inode tells rewrites of the same
+        # size apart even within the timestamp granularity
+        return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
+
+    def save(
+        self, catalog: list[dict[str, Any]], expected_version: str | None = None
+    ) -> None:
+        with self._write_lock:
+            if expected_version is not None and self.get_version() != expected_version:
+                raise CatalogVersionConflictException(
+                    "The catalog was modified since it was read."
+                )
+
+            self._write_rows(catalog)
+
+    def _write_rows(self, catalog: list[dict[str, Any]]) -> None:
+        # Readers see the previous or the new catalog, never a partial file
+        with atomic_write(self.csv_path, mode="w", newline="", encoding="utf-8") as file:
             writer = csv.DictWriter(
                 file, fieldnames=self._FIELDNAMES, extrasaction="ignore"
             )
             writer.writeheader()
             writer.writerows(self._serialize_rows(catalog))
 
+    def update_item(self, item_id: str, fields: dict[str, Any]) -> None:
+        unknown = set(fields) - set(self._FIELDNAMES[1:])
+        if unknown:
+            raise CatalogRepositoryValidationException(f"Unknown catalog fields: {unknown}")
+
+        if not self.csv_path.exists():
+            raise ItemNotFoundException()
+
+        serialized = self._serialize_fields(fields)
+
+        with self._write_lock:
+            self._update_rows(item_id, serialized)
+
+    def _update_rows(self, item_id: str, serialized: dict[str, Any]) -> None:
+        found = False
+
+        # Stream the rows into a sibling file: no row is decoded or validated,
+        # and the original file is only replaced once the new one is complete
+        with (
+            open(self.csv_path, mode="r", encoding="utf-8") as source,
+            atomic_write(self.csv_path, mode="w", newline="", encoding="utf-8") as target,
+        ):
+            csv_reader = csv.DictReader(source)
+            fieldnames = list(csv_reader.fieldnames or self._FIELDNAMES)
+            fieldnames += [name for name in serialized if name not in fieldnames]
+
+            writer = csv.DictWriter(target, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+
+            for row in csv_reader:
+                if row.get("item_id") == item_id:
+                    row.update(serialized)
+                    found = True
+                writer.writerow(row)
+
+            # Raising inside the block discards the new file
+            if not found:
+                raise ItemNotFoundException()
+
+    def _serialize_fields(self, fields: dict[str, Any]) -> dict[str, Any]:
+        serialized = dict(fields)
+
+        if "attributes" in serialized:
+            attributes = serialized["attributes"]
+            serialized["attributes"] = json.dumps(attributes) if attributes else "{}"
+
+        if "active" in serialized:
+            serialized["active"] = str(serialized["active"]).lower()
+
+        return serialized
+
     def _serialize_rows(self, catalog: list[dict[str, Any]]) -> list[dict[str, Any]]:
         serialized = []
 
@@ -106,7 +199,7 @@ class CatalogRepositoryCSV(CatalogRepository):
             }
             return list(provider_set)
 
-    def list_subcategories(self, category: str) -> list[str]:
+    def list_subcategories(self, category: str | None = None) -> list[str]:
         if not self.csv_path.exists():
             return []
 
@@ -116,5 +209,6 @@ class CatalogRepositoryCSV(CatalogRepository):
                 (str(row.get("subcategory")))
                 for row in csv_reader
                 if row.get("subcategory")
+                and (not category or row.get("category") == category)
             }
             return list(subcategories_set)
@@ -0,0 +1,232 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from itertools import batched
+from pathlib import Path
+from typing import Any, Iterator
+
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
+from app.application.ports.catalog_repository import CatalogRepository
+from app.application.utils.catalog_helpers import convert_to_catalog_items
+from app.domain.entities.catalog_item import CatalogItem
+from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
+from app.infrastructure.exceptions.catalog_repository_validation_exception import (
+    CatalogRepositoryValidationException,
+)
+
+# SQLite limits the number of bound parameters per statement.
+_SQLITE_MAX_VARIABLES: int = 500
+
+
+class CatalogRepositorySQLite(CatalogRepository):
+
+    _FIELDNAMES = [
+        "item_id",
+        "name",
+        "category",
+        "subcategory",
+        "description",
+        "unit",
+        "provider",
+        "attributes",
+        "active",
+    ]
+
+    _SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS catalog_items ("
+        "item_id TEXT PRIMARY KEY, "
+        "name TEXT NOT NULL, "
+        "category TEXT, "
+        "subcategory TEXT, "
+        "description TEXT, "
+        "unit TEXT, "
+        "provider TEXT, "
+        "attributes TEXT NOT NULL DEFAULT '{}', "
+        "active INTEGER NOT NULL DEFAULT 1)",
+        "CREATE INDEX IF NOT EXISTS idx_catalog_items_category ON catalog_items (category)",
+        "CREATE INDEX IF NOT EXISTS idx_catalog_items_subcategory ON catalog_items (subcategory)",
+        "CREATE INDEX IF NOT EXISTS idx_catalog_items_provider ON catalog_items (provider)",
+        "CREATE INDEX IF NOT EXISTS idx_catalog_items_active ON catalog_items (active)",
+        # Single row table holding a counter bumped by every write
+        "CREATE TABLE IF NOT EXISTS catalog_meta ("
+        "id INTEGER PRIMARY KEY CHECK (id = 1), "
+        "version INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO catalog_meta (id, version) VALUES (1, 0)",
+    ]
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        self.db_path = db_path or Path("data") / "catalog" / "catalog.sqlite3"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._create_schema()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_schema(self) -> None:
+        with self._connect() as connection:
+            # WAL lets readers keep working while a write transaction is open
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def get(self) -> list[dict[str, Any]]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(self._FIELDNAMES)} FROM catalog_items ORDER BY rowid"
+            ).fetchall()
+
+        return [self._deserialize_row(row) for row in rows]
+
+    def get_catalog_items(self) -> list[CatalogItem]:
+        return convert_to_catalog_items(self.get())
+
+    def get_items_by_id(self, item_ids: list[str]) -> dict[str, CatalogItem]:
+        rows = []
+
+        with self._connect() as connection:
+            # SQLite limits the number of bound parameters per statement
+            for chunk in batched(dict.fromkeys(item_ids), _SQLITE_MAX_VARIABLES):
+                rows.extend(
+                    connection.execute(
+                        f"SELECT {', '.join(self._FIELDNAMES)} FROM catalog_items "
+                        f"WHERE item_id IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                )
+
+        items = convert_to_catalog_items([self._deserialize_row(row) for row in rows])
+        return {item.item_id: item for item in items}
+
+    def get_version(self) -> str:
+        with self._connect() as connection:
+            (version,) = connection.execute(
+                "SELECT version FROM catalog_meta WHERE id = 1"
+            ).fetchone()
+
+        return str(version)
+
+    def save(
+        self, catalog: list[dict[str, Any]], expected_version: str | None = None
+    ) -> None:
+        columns = ", ".join(self._FIELDNAMES)
+        placeholders = ", ".join(f":{name}" for name in self._FIELDNAMES)
+        updates = ", ".join(
+            f"{name} = excluded.{name}" for name in self._FIELDNAMES if name != "item_id"
+        )
+
+        with self._connect() as connection:
+            # Take the write lock before reading the version it is compared to
+            connection.execute("BEGIN IMMEDIATE")
+
+            if expected_version is not None:
+                (version,) = connection.execute(
+                    "SELECT version FROM catalog_meta WHERE id = 1"
+                ).fetchone()
+                if str(version) != expected_version:
+                    raise CatalogVersionConflictException(
+                        "The catalog was modified since it was read."
+                    )
+
+            connection.executemany(
+                f"INSERT INTO catalog_items ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT (item_id) DO UPDATE SET {updates}",
+                (self._serialize_row(item) for item in catalog),
+            )
+
+            # The saved list is the whole catalog: drop rows that are not part of it
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS saved_ids (item_id TEXT PRIMARY KEY)")
+            connection.execute("DELETE FROM saved_ids")
+            connection.executemany(
+                "INSERT OR IGNORE INTO saved_ids (item_id) VALUES (?)",
+                ((item["item_id"],) for item in catalog),
+            )
+            connection.execute(
+                "DELETE FROM catalog_items WHERE item_id NOT IN (SELECT item_id FROM saved_ids)"
+            )
+
+            self._bump_version(connection)
+
+    def update_item(self, item_id: str, fields: dict[str, Any]) -> None:
+        unknown = set(fields) - set(self._FIELDNAMES[1:])
+        if unknown:
+            raise CatalogRepositoryValidationException(f"Unknown catalog fields: {unknown}")
+
+        if not fields:
+            return
+
+        row = self._serialize_row({"item_id": item_id, **fields})
+        assignments = ", ".join(f"{name} = :{name}" for name in fields)
+
+        with self._connect() as connection:
+            cursor = connection.execute(
+                f"UPDATE catalog_items SET {assignments} WHERE item_id = :item_id",
+                {name: row[name] for name in ["item_id", *fields]},
+            )
+
+            if cursor.rowcount == 0:
+                raise ItemNotFoundException()
+
+            self._bump_version(connection)
+
+    def list_catagories(self) -> list[str]:
+        return self._distinct("category")
+
+    def list_providers(self) -> list[str]:
+        return self._distinct("provider")
+
+    def list_subcategories(self, category: str | None = None) -> list[str]:
+        if category:
+            return self._distinct("subcategory", category=category)
+        return self._distinct("subcategory")
+
+    def _distinct(self, column: str, category: str | None = None) -> list[str]:
+        query = (
+            f"SELECT DISTINCT {column} FROM catalog_items "
+            f"WHERE {column} IS NOT NULL AND {column} != ''"
+        )
+        parameters: tuple[str, ...] = ()
+
+        if category is not None:
+            query += " AND category = ?"
+            parameters = (category,)
+
+        with self._connect() as connection:
+            return [row[0] for row in connection.execute(query, parameters)]
+
+    @staticmethod
+    def _bump_version(connection: sqlite3.Connection) -> None:
+        connection.execute("UPDATE catalog_meta SET version = version + 1 WHERE id = 1")
+
+    def _serialize_row(self, item: dict[str, Any]) -> dict[str, Any]:
+        row = {name: item.get(name) for name in self._FIELDNAMES}
+
+        # attributes -> json string
+        row["attributes"] = json.dumps(row["attributes"] or {})
+
+        # active -> integer, defaults to true
+        active = item.get("active", True)
+        row["active"] = 1 if active is None or active else 0
+
+        return row
+
+    @staticmethod
+    def _deserialize_row(row: sqlite3.Row) -> dict[str, Any]:
+        item = dict(row)
+
+        try:
+            item["attributes"] = json.loads(item["attributes"]) if item["attributes"] else {}
+        except json.JSONDecodeError:
+            item["attributes"] = {}
+
+        item["active"] = bool(item["active"])
+
+        return item
@@ -0,0 +1,184 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from itertools import batched
+from pathlib import Path
+from typing import Any
+
+from app.application.ports.embedding_service import EmbeddingService
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.embedding_service_exception import EmbeddingServiceException
+
+# SQLite limits the number of bound parameters per statement.
+_SQLITE_MAX_VARIABLES: int = 500
+
+# Stored in PRAGMA user_version. Version 1 stores float32 embeddings, older
+# caches hold float64 blobs that cannot be told apart by length.
+_SCHEMA_VERSION: int = 1
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """
+    Decorator that stores embeddings on disk keyed by a hash of (model, text),
+    so unchanged texts are never sent to the wrapped service twice.
+    The store is bounded to max_entries, evicting the least recently used rows.
+    Embeddings are stored as float32, the precision the vector index keeps.
+
+    Missing texts are embedded checkpoint_size at a time and each chunk is
+    stored as soon as it is done, so when a long call fails, calling again
+    resumes after the last stored chunk instead of starting over.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        model: str,
+        path: str | Path | None = None,
+        max_entries: int = settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        checkpoint_size: int = settings.EMBEDDING_CHECKPOINT_SIZE,
+    ):
+        self.embedding_service = embedding_service
+        self.model = model
+        self.max_entries = max_entries
+        self.checkpoint_size = checkpoint_size
+        self.path = (
+            Path(path) if path else Path("data") / "embeddings" / "embedding_cache.sqlite3"
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                # Entries of another format are dropped, they are embedded again
+                self._connection.execute("DROP TABLE IF EXISTS embeddings")
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, "
+                "embedding BLOB NOT NULL, "
+                "last_used INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used "
+                "ON embeddings (last_used)"
+            )
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+
+        keys = [self._build_key(text) for text in texts]
+
+        with self._lock:
+            cached = self._load(set(keys))
+
+        # Embed every distinct missing text once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        for chunk in batched(missing.items(), self.checkpoint_size):
+            chunk_keys = [key for key, _ in chunk]
+            embeddings = self.embedding_service.get_embeddings([text for _, text in chunk])
+            computed = dict(zip(chunk_keys, embeddings))
+
+            # Checkpoint: finished chunks survive a failure of the next ones
+            with self._lock:
+                self._store(computed)
+
+            cached.update(computed)
+
+        with self._lock:
+            self.misses += len(missing)
+            self.hits += len(texts) - len(missing)
+
+        return [cached[key] for key in keys]
+
+    def get_stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _build_key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _load(self, keys: set[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+
+        try:
+            with self._connection:
+                for chunk in batched(keys, _SQLITE_MAX_VARIABLES):
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._connection.execute(
+                        f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+
+                    for key, blob in rows:
+                        found[key] = self._deserialize(blob)
+
+                    # Refresh recency of the rows we are about to serve
+                    self._connection.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE key IN ({placeholders})",
+                        (time.time_ns(), *chunk),
+                    )
+        except sqlite3.Error as e:
+            raise EmbeddingServiceException(f"Failed to read embedding cache: {str(e)}") from e
+
+        return found
+
+    def _store(self, embeddings: dict[str, list[float]]) -> None:
+        now = time.time_ns()
+
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, embedding, last_used) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        (key, self._serialize(embedding), now)
+                        for key, embedding in embeddings.items()
+                    ),
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            raise EmbeddingServiceException(f"Failed to write embedding cache: {str(e)}") from e
+
+    def _evict(self) -> None:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+
+        if overflow > 0:
+            self._connection.execute(
+                "DELETE FROM embeddings WHERE key IN ("
+                "SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    @staticmethod
+    def _serialize(embedding: list[float]) -> bytes:
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _deserialize(blob: bytes) -> list[float]:
+        embedding = array("f")
+        embedding.frombytes(blob)
+        return embedding.tolist()
@@ -0,0 +1,92 @@
+import re
+import zlib
+
+import numpy as np
+
+from app.application.ports.embedding_service import EmbeddingService
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.embedding_service_validation_exception import EmbeddingServiceValidationException
+
+_WORD = re.compile(r"\w+")
+
+
+class HashingEmbeddingService(EmbeddingService):
+    """
+    Local CPU embeddings, no network nor model files: every character n-gram
+    of every word (padded with spaces, ngram_min to ngram_max long) and the
+    word itself are hashed into one of dimension buckets with a +/-1 sign,
+    then the vector is L2 normalized.
+
+    Texts sharing words or word fragments get close vectors, which is enough
+    for catalog names and descriptions with typos or inflections. Hashing is
+    crc32 based, so vectors are identical across processes and restarts.
+    """
+
+    def __init__(
+        self,
+        dimension: int = settings.VECTOR_DIMENSION,
+        ngram_min: int = settings.EMBEDDING_HASHING_NGRAM_MIN,
+        ngram_max: int = settings.EMBEDDING_HASHING_NGRAM_MAX,
+    ):
+        if dimension <= 0 or not 0 < ngram_min <= ngram_max:
+            raise EmbeddingServiceValidationException(
+                "Hashing embeddings need a positive dimension and 0 < ngram_min <= ngram_max"
+            )
+
+        self.dimension = dimension
+        self.ngram_min = ngram_min
+        self.ngram_max = ngram_max
+        # Identifies the vector space, e.g. in embedding cache keys
+        self.model = f"hashing-char{ngram_min}-{ngram_max}-d{dimension}"
+
+    def get_embedding(self, text: str) -> list[float]:
+        if not text:
+            raise EmbeddingServiceValidationException("Input text cannot be empty")
+
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        if any(not text for text in texts):
+            raise EmbeddingServiceValidationException("Input text cannot be empty")
+
+        if not texts:
+            return []
+
+        rows: list[int] = []
+        hashes: list[int] = []
+
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            rows.extend([row] * len(features))
+            hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+
+        # Low bits pick the bucket, the top bit the sign
+        hashes_array = np.array(hashes, dtype=np.uint32)
+        buckets = (hashes_array & 0x7FFFFFFF) % self.dimension
+        signs = np.where(hashes_array >> 31, -1.0, 1.0).astype(np.float32)
+
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        np.add.at(vectors, (np.array(rows, dtype=np.int64), buckets), signs)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+
+        return vectors.tolist()
+
+    def close(self) -> None:
+        # Nothing to release, kept so every backend can be closed the same way
+        pass
+
+    def _features(self, text: str) -> list[str]:
+        features: list[str] = []
+
+        for word in _WORD.findall(text.lower()):
+            features.append(word)
+
+            padded = f" {word} "
+            for size in range(self.ngram_min, self.ngram_max + 1):
+                features.extend(
+                    padded[start : start + size] for start in range(len(padded) - size + 1)
+                )
+
+        return features
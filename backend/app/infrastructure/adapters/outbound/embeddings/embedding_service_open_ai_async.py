@@ -0,0 +1,155 @@
+import asyncio
+
+import httpx
+import openai
+
+from app.application.ports.async_embedding_service import AsyncEmbeddingService
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.embedding_service_exception import EmbeddingServiceException
+from app.infrastructure.exceptions.embedding_service_validation_exception import EmbeddingServiceValidationException
+from app.infrastructure.utils.embedding_batching import build_embedding_batches, estimate_tokens
+from app.infrastructure.utils.rate_limiter import AsyncRateLimiter, parse_duration
+from app.infrastructure.utils.retry_policy import RetryPolicy
+
+# Errors worth another attempt: throttling, timeouts, dropped connections and 5xx
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class AsyncOpenAIEmbeddingService(AsyncEmbeddingService):
+    """
+    Embeds through its own AsyncOpenAI client, whose HTTP connections are
+    pooled and reused between requests.
+
+    The batches of one call are sent concurrently, at most max_concurrency
+    requests in flight and within requests_per_minute / tokens_per_minute, so
+    throughput is bound by the provider rate limits rather than by latency.
+    A batch that fails for good cancels the batches still pending.
+    The client is bound to the event loop that first uses it.
+
+    Each batch is retried on its own after throttling or transient errors,
+    with exponential backoff and jitter (see RetryPolicy); the provider rate
+    limit headers of every response keep the local pacing in step.
+    """
+
+    def __init__(
+        self,
+        model: str = settings.OPENAI_MODEL,
+        batch_size: int = settings.EMBEDDING_BATCH_SIZE,
+        batch_max_tokens: int = settings.EMBEDDING_BATCH_MAX_TOKENS,
+        max_concurrency: int = settings.EMBEDDING_MAX_CONCURRENCY,
+        requests_per_minute: int = settings.EMBEDDING_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = settings.EMBEDDING_TOKENS_PER_MINUTE,
+        retry_policy: RetryPolicy | None = None,
+        client: openai.AsyncOpenAI | None = None,
+    ):
+        self.model = model
+        self.api_key = settings.OPENAI_API_KEY
+        self.batch_size = batch_size
+        self.batch_max_tokens = batch_max_tokens
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        if client is None and not self.api_key:
+            raise EmbeddingServiceValidationException("OPENAI_API_KEY is not set")
+
+        self.client = client or openai.AsyncOpenAI(
+            api_key=self.api_key,
+            # Retries are scheduled here, together with the rate limiter
+            max_retries=0,
+            http_client=openai.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                )
+            ),
+        )
+
+        self._rate_limiter = AsyncRateLimiter(
+            requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_embedding(self, text: str) -> list[float]:
+        if not text:
+            raise EmbeddingServiceValidationException("Input text cannot be empty")
+
+        return (await self._embed_batch([text]))[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        if any(not text for text in texts):
+            raise EmbeddingServiceValidationException("Input text cannot be empty")
+
+        batches = list(
+            build_embedding_batches(
+                texts, max_items=self.batch_size, max_tokens=self.batch_max_tokens
+            )
+        )
+
+        # The first failing batch cancels the others instead of letting them
+        # spend requests and quota on a call that already failed
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(self._embed_batch(batch)) for batch in batches]
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+
+        # Tasks are read in batch order whatever order the responses come in
+        return [embedding for task in tasks for embedding in task.result()]
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        tokens = sum(estimate_tokens(text) for text in batch)
+        attempt = 0
+
+        while True:
+            await self._rate_limiter.acquire(tokens)
+
+            async with self._semaphore:
+                try:
+                    raw_response = await self.client.embeddings.with_raw_response.create(
+                        model=self.model, input=batch
+                    )
+                except _RETRYABLE_ERRORS as e:
+                    if attempt >= self.retry_policy.max_retries:
+                        raise EmbeddingServiceException(
+                            f"Failed to get embeddings after {attempt + 1} attempts: {str(e)}"
+                        ) from e
+                    error = e
+                except openai.OpenAIError as e:
+                    raise EmbeddingServiceException(f"Failed to get embeddings: {str(e)}") from e
+                else:
+                    self._rate_limiter.update_from_headers(raw_response.headers)
+                    response = raw_response.parse()
+
+                    # The API does not guarantee response order, each entry carries its input index
+                    return [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+
+            delay = self.retry_policy.delay(attempt, retry_after=self._retry_after(error))
+            if isinstance(error, openai.RateLimitError):
+                # Throttled: hold every batch back, not only this one
+                self._rate_limiter.pause(delay)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float | None:
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+
+        headers = response.headers
+        retry_after_ms = parse_duration(headers.get("retry-after-ms"))
+        if retry_after_ms is not None:
+            return retry_after_ms / 1000
+
+        return parse_duration(headers.get("retry-after")) or parse_duration(
+            headers.get("x-ratelimit-reset-requests")
+        )
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+from app.application.ports.async_embedding_service import AsyncEmbeddingService
+from app.application.ports.embedding_service import EmbeddingService
+
+
+class SyncEmbeddingServiceBridge(EmbeddingService):
+    """
+    Exposes an AsyncEmbeddingService to the synchronous use cases. Every call
+    runs on one private event loop thread, so the pooled client, its
+    concurrency limit and its rate limits are shared by all the worker
+    threads calling the bridge.
+    """
+
+    def __init__(self, embedding_service: AsyncEmbeddingService):
+        self.embedding_service = embedding_service
+        self.model = getattr(embedding_service, "model", None)
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="embedding-loop", daemon=True
+        )
+        self._thread.start()
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self._run(self.embedding_service.get_embedding(text))
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+
+        return self._run(self.embedding_service.get_embeddings(texts))
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+
+        self._run(self.embedding_service.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
@@ -1,45 +1,35 @@
-import json
 from csv import DictReader
-from io import StringIO
-from typing import Any
+from io import BytesIO, TextIOWrapper
+from typing import Any, BinaryIO, Iterator
 
 from app.application.ports.file_reader import FileReader
+from app.infrastructure.adapters.outbound.files.row_parsing import parse_row
 from app.infrastructure.exceptions.invalid_file_type_exception import InvalidFileTypeException
 
 
 class FileReaderCSV(FileReader):
 
     def read_catalog(self, file_bytes: bytes) -> list[dict[str, Any]]:
-        return self._read_file(file_bytes)
+        return list(self._iter_file(BytesIO(file_bytes)))
 
     def read_requirements(self, file_bytes: bytes) -> list[dict[str, Any]]:
-        return self._read_file(file_bytes)
+        return list(self._iter_file(BytesIO(file_bytes)))
 
-    def _read_file(self, file_bytes: bytes) -> list[dict[str, Any]]:
-        try:
-            file_str = file_bytes.decode("utf-8")
-        except UnicodeDecodeError as e:
-            raise InvalidFileTypeException("Invalid encoding for CSV file") from e
-        
-        file_like = StringIO(file_str)
-
-        csv_reader = DictReader(file_like)
-        items = []
-
-        for row in csv_reader:
-            item = dict(row)
+    def iter_catalog(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        return self._iter_file(file)
 
-            # parse attributes JSON
-            if "attributes" in item and item["attributes"]:
-                try:
-                    item["attributes"] = json.loads(item["attributes"])
-                except json.JSONDecodeError:
-                    item["attributes"] = {}
+    def iter_requirements(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        return self._iter_file(file)
 
-            # parse active boolean
-            if "active" in item:
-                item["active"] = item["active"].lower() == "true"
+    def _iter_file(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        # Decodes incrementally, only one buffer of the file is held at a time
+        file_like = TextIOWrapper(file, encoding="utf-8", newline="")
 
-            items.append(item)
-
-        return items
+        try:
+            for row in DictReader(file_like):
+                yield parse_row(dict(row))
+        except UnicodeDecodeError as e:
+            raise InvalidFileTypeException("Invalid encoding for CSV file") from e
+        finally:
+            # Hand the file back to the caller instead of closing it
+            file_like.detach()
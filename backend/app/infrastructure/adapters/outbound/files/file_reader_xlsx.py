@@ -0,0 +1,87 @@
+import zipfile
+from datetime import date, datetime, time
+from io import BytesIO
+from typing import Any, BinaryIO, Iterator
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+from app.application.ports.file_reader import FileReader
+from app.infrastructure.adapters.outbound.files.row_parsing import parse_row
+from app.infrastructure.exceptions.invalid_file_type_exception import InvalidFileTypeException
+
+
+class FileReaderXLSX(FileReader):
+    """
+    Reads the first sheet of a workbook in openpyxl read-only mode, rows are
+    parsed from the sheet XML as they are iterated instead of loading the
+    whole workbook. The first row holds the headers.
+
+    Cells are turned into the strings a CSV export would contain, so rows
+    are identical to the ones of FileReaderCSV.
+    """
+
+    def read_catalog(self, file_bytes: bytes) -> list[dict[str, Any]]:
+        return list(self._iter_file(BytesIO(file_bytes)))
+
+    def read_requirements(self, file_bytes: bytes) -> list[dict[str, Any]]:
+        return list(self._iter_file(BytesIO(file_bytes)))
+
+    def iter_catalog(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        return self._iter_file(file)
+
+    def iter_requirements(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        return self._iter_file(file)
+
+    def _iter_file(self, file: BinaryIO) -> Iterator[dict[str, Any]]:
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile, KeyError) as e:
+            raise InvalidFileTypeException("Invalid XLSX file") from e
+
+        try:
+            sheet = workbook.worksheets[0]
+            # Some writers store a wrong dimension, read-only mode would then
+            # truncate rows or columns to it
+            sheet.reset_dimensions()
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+
+            if header is None:
+                return
+
+            # Columns without header are left out, as empty trailing cells
+            columns = [
+                (position, self._to_text(name))
+                for position, name in enumerate(header)
+                if self._to_text(name).strip()
+            ]
+
+            for row in rows:
+                values = [
+                    self._to_text(row[position]) if position < len(row) else ""
+                    for position, _ in columns
+                ]
+
+                # Blank lines, common at the end of sheets, are not rows
+                if not any(values):
+                    continue
+
+                yield parse_row(
+                    {name: value for (_, name), value in zip(columns, values)}
+                )
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _to_text(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        # Excel stores every number as a float, 10 must not become "10.0"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        return str(value)
@@ -0,0 +1,22 @@
+import json
+from typing import Any
+
+
+def parse_row(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Turns the text cells of a file row into the primitive values the
+    normalizers expect. Shared by every FileReader so all formats produce
+    the same rows.
+    """
+    # parse attributes JSON
+    if "attributes" in item and item["attributes"]:
+        try:
+            item["attributes"] = json.loads(item["attributes"])
+        except json.JSONDecodeError:
+            item["attributes"] = {}
+
+    # parse active boolean
+    if "active" in item:
+        item["active"] = item["active"].lower() == "true"
+
+    return item
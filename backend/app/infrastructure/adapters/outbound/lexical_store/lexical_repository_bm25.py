@@ -0,0 +1,502 @@
+import re
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+import numpy as np
+
+from app.application.normalizers.base_normalizer import normalize_text, normalize_texts
+from app.application.ports.lexical_repository import LexicalRepository
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.lexical_repository_exception import LexicalRepositoryException
+from app.infrastructure.utils.atomic_files import atomic_write
+
+# Words, numbers and compounds joined by - . / such as "m6", "abc-123", "1/2"
+_TOKEN = re.compile(r"[^\W_]+(?:[-./][^\W_]+)*")
+_PART = re.compile(r"[^\W_]+")
+
+# Function words of the catalog languages (normalized, without accents).
+# They are indexed but never searched: a requirement sharing only "de" or
+# "para" with an item says nothing about it
+STOPWORDS = frozenset(
+    {
+        "a", "al", "con", "de", "del", "e", "el", "en", "la", "las", "lo",
+        "los", "o", "para", "por", "se", "sin", "sobre", "su", "sus", "u",
+        "un", "una", "unas", "unos", "y",
+        "an", "and", "by", "for", "in", "of", "on", "or", "the", "to", "with",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Tokens of the normalized text. Compounds are kept whole and also split,
+    so "abc-123" matches both "abc-123" and "abc 123".
+    """
+    return split_tokens(normalize_text(text))
+
+
+def split_tokens(normalized: str) -> list[str]:
+    # tokenize over an already normalized text
+    tokens: list[str] = []
+
+    for token in _TOKEN.findall(normalized):
+        tokens.append(token)
+
+        parts = _PART.findall(token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+
+    return tokens
+
+
+def is_identifier(token: str) -> bool:
+    # SKU like: mixes letters and digits, so quantities ("10") and plain
+    # words are never taken for an item id
+    return (
+        len(token) >= 4
+        and any(char.isdigit() for char in token)
+        and any(char.isalpha() for char in token)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _LexicalSnapshot:
+    item_ids: np.ndarray
+    active: np.ndarray
+    categories: np.ndarray
+    providers: np.ndarray
+    terms: np.ndarray
+    # CSR postings: the documents of term t are doc_ids[offsets[t]:offsets[t + 1]]
+    offsets: np.ndarray
+    doc_ids: np.ndarray
+    # Precomputed BM25 contribution of each posting
+    weights: np.ndarray
+    # Term frequency of each posting and token count of each document, the
+    # inputs the weights are recomputed from when items change
+    frequencies: np.ndarray
+    doc_lengths: np.ndarray
+    catalog_version: str | None = None
+    stamp: tuple | None = None
+    term_index: dict[str, int] = field(default_factory=dict)
+    positions: dict[str, int] = field(default_factory=dict)
+    # Normalized item_id -> position, for identifier lookups
+    identifiers: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> "_LexicalSnapshot":
+        return cls(
+            item_ids=np.zeros(0, dtype=str),
+            active=np.zeros(0, dtype=bool),
+            categories=np.zeros(0, dtype=str),
+            providers=np.zeros(0, dtype=str),
+            terms=np.zeros(0, dtype=str),
+            offsets=np.zeros(1, dtype=np.int64),
+            doc_ids=np.zeros(0, dtype=np.int32),
+            weights=np.zeros(0, dtype=np.float32),
+            frequencies=np.zeros(0, dtype=np.int32),
+            doc_lengths=np.zeros(0, dtype=np.float32),
+        )
+
+
+class LexicalRepositoryBM25(LexicalRepository):
+    """
+    BM25 inverted index over the normalized catalog text, kept in memory as
+    one immutable snapshot (see VectorRepositoryFAISS) and stored as a single
+    .npz file written atomically next to the FAISS index.
+
+    Postings hold their final BM25 weight, so scoring a query is one
+    bincount over the postings of its terms. They also keep their term
+    frequency, so upsert only tokenizes the items it is given and then
+    recomputes the weights of the whole index with array operations.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        k1: float = settings.LEXICAL_BM25_K1,
+        b: float = settings.LEXICAL_BM25_B,
+    ):
+        self.path = Path(path) if path else Path("data") / "vectors" / "catalog.lexical.npz"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+
+        # Reentrant: writers also go through _current
+        self._write_lock = threading.RLock()
+        self._snapshot = self._load()
+
+    def get_catalog_version(self) -> str | None:
+        return self._current().catalog_version
+
+    def save(self, items: list[dict], catalog_version: str | None = None) -> None:
+        # Last occurrence wins when the same item_id comes more than once
+        items = list({item["item_id"]: item for item in items}.values())
+
+        with self._write_lock:
+            try:
+                self._commit(self._build(items, catalog_version))
+            except Exception as e:
+                raise LexicalRepositoryException(
+                    f"Failed to save lexical index: {str(e)}"
+                ) from e
+
+    def upsert(self, items: list[dict], catalog_version: str | None = None) -> None:
+        if not items:
+            return
+
+        # Last occurrence wins when the same item_id comes more than once
+        items = list({item["item_id"]: item for item in items}.values())
+
+        with self._write_lock:
+            try:
+                self._commit(self._merge(self._current(), items, catalog_version))
+            except Exception as e:
+                raise LexicalRepositoryException(
+                    f"Failed to update lexical index: {str(e)}"
+                ) from e
+
+    def set_active(
+        self, item_ids: list[str], active: bool, catalog_version: str | None = None
+    ) -> None:
+        with self._write_lock:
+            current = self._current()
+            positions = [
+                current.positions[item_id] for item_id in item_ids if item_id in current.positions
+            ]
+
+            if not positions and (
+                catalog_version is None or catalog_version == current.catalog_version
+            ):
+                return
+
+            # With no positions the mask is unchanged, only the catalog version
+            # is recorded so the index is not taken for lagging
+            mask = current.active.copy()
+            mask[positions] = active
+
+            try:
+                self._commit(
+                    _LexicalSnapshot(
+                        **{
+                            **self._arrays(current),
+                            "active": mask,
+                            "catalog_version": catalog_version,
+                        }
+                    )
+                )
+            except Exception as e:
+                raise LexicalRepositoryException(
+                    f"Failed to save lexical index: {str(e)}"
+                ) from e
+
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        snapshot = self._current()
+        results: list[list[tuple[str, float]]] = []
+
+        for position, query in enumerate(queries):
+            allowed = self._allowed(snapshot, filters[position] if filters else {})
+            term_ids = [
+                snapshot.term_index[token]
+                for token in set(tokenize(query))
+                if token in snapshot.term_index and token not in STOPWORDS
+            ]
+
+            if not term_ids or not allowed.any():
+                results.append([])
+                continue
+
+            postings = np.concatenate(
+                [np.arange(snapshot.offsets[t], snapshot.offsets[t + 1]) for t in term_ids]
+            )
+            scores = np.bincount(
+                snapshot.doc_ids[postings],
+                weights=snapshot.weights[postings],
+                minlength=len(snapshot.item_ids),
+            )
+            scores[~allowed] = 0.0
+
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > top_k:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            results.append(
+                [(str(snapshot.item_ids[doc]), float(scores[doc])) for doc in candidates]
+            )
+
+        return results
+
+    def find_exact(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[str]]:
+        snapshot = self._current()
+        results: list[list[str]] = []
+
+        for position, query in enumerate(queries):
+            allowed = self._allowed(snapshot, filters[position] if filters else {})
+            found: list[str] = []
+
+            for token in dict.fromkeys(tokenize(query)):
+                if len(found) >= top_k:
+                    break
+
+                doc = snapshot.identifiers.get(token)
+                if doc is not None and is_identifier(token) and allowed[doc]:
+                    found.append(str(snapshot.item_ids[doc]))
+
+            results.append(found)
+
+        return results
+
+    def _allowed(self, snapshot: _LexicalSnapshot, filters: dict[str, str | None]) -> np.ndarray:
+        allowed = snapshot.active.copy()
+
+        if filters.get("category"):
+            allowed &= snapshot.categories == filters["category"]
+        if filters.get("provider"):
+            allowed &= snapshot.providers == filters["provider"]
+
+        return allowed
+
+    def _build(self, items: list[dict], catalog_version: str | None) -> _LexicalSnapshot:
+        if not items:
+            return replace(_LexicalSnapshot.empty(), catalog_version=catalog_version)
+
+        term_index: dict[str, int] = {}
+        posting_terms, posting_docs, frequencies, doc_lengths = self._postings(
+            items, np.arange(len(items), dtype=np.int64), term_index
+        )
+
+        return self._assemble(
+            item_ids=np.array([item["item_id"] for item in items], dtype=str),
+            active=np.array([bool(item.get("active", True)) for item in items], dtype=bool),
+            categories=np.array([item.get("category") or "" for item in items], dtype=str),
+            providers=np.array([item.get("provider") or "" for item in items], dtype=str),
+            terms=np.array(list(term_index), dtype=str),
+            posting_terms=posting_terms,
+            posting_docs=posting_docs,
+            frequencies=frequencies,
+            doc_lengths=doc_lengths,
+            catalog_version=catalog_version,
+        )
+
+    def _merge(
+        self, current: _LexicalSnapshot, items: list[dict], catalog_version: str | None
+    ) -> _LexicalSnapshot:
+        """
+        Current snapshot with the given items added or replaced. Only these
+        items are tokenized, the postings of the others are kept as they are.
+        """
+        positions = dict(current.positions)
+        for item in items:
+            positions.setdefault(item["item_id"], len(positions))
+
+        size = len(positions)
+        docs = np.array([positions[item["item_id"]] for item in items], dtype=np.int64)
+
+        term_index = dict(current.term_index)
+        posting_terms, posting_docs, frequencies, doc_lengths = self._postings(
+            items, docs, term_index
+        )
+
+        # Postings of the other documents, their term is implied by the offsets
+        current_terms = np.repeat(
+            np.arange(len(current.terms), dtype=np.int64), np.diff(current.offsets)
+        )
+        kept = ~np.isin(current.doc_ids, docs)
+
+        return self._assemble(
+            item_ids=self._updated(current.item_ids, size, docs, [item["item_id"] for item in items]),
+            active=self._updated(
+                current.active, size, docs, [bool(item.get("active", True)) for item in items]
+            ),
+            categories=self._updated(
+                current.categories, size, docs, [item.get("category") or "" for item in items]
+            ),
+            providers=self._updated(
+                current.providers, size, docs, [item.get("provider") or "" for item in items]
+            ),
+            terms=np.array(list(term_index), dtype=str),
+            posting_terms=np.concatenate([current_terms[kept], posting_terms]),
+            posting_docs=np.concatenate([current.doc_ids[kept].astype(np.int64), posting_docs]),
+            frequencies=np.concatenate([current.frequencies[kept], frequencies]),
+            doc_lengths=self._updated(current.doc_lengths, size, docs, doc_lengths),
+            catalog_version=catalog_version,
+        )
+
+    @staticmethod
+    def _updated(array: np.ndarray, size: int, docs: np.ndarray, values) -> np.ndarray:
+        # Grown to size, then widened so longer strings are not truncated
+        values = np.asarray(values)
+        updated = np.concatenate([array, np.zeros(size - len(array), dtype=array.dtype)])
+        updated = updated.astype(np.result_type(updated, values))
+        updated[docs] = values
+        return updated
+
+    @staticmethod
+    def _postings(
+        items: list[dict], docs: np.ndarray, term_index: dict[str, int]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Tokenizes the items stored at positions docs. Returns the term,
+        document and term frequency of every posting, and the length of each
+        item. New terms are added to term_index.
+        """
+        texts = normalize_texts([f"{item['item_id']} {item.get('text') or ''}" for item in items])
+        doc_lengths = np.zeros(len(items), dtype=np.float32)
+        doc_terms: list[int] = []
+        doc_counts: list[int] = []
+
+        for position, text in enumerate(texts):
+            tokens = split_tokens(text)
+            doc_lengths[position] = len(tokens)
+            doc_counts.append(len(tokens))
+            doc_terms.extend([term_index.setdefault(token, len(term_index)) for token in tokens])
+
+        posting_docs = np.repeat(docs, doc_counts)
+
+        # Term frequency of every (term, document) pair, counted on a single
+        # int64 key, much faster than a unique over pairs
+        width = int(docs.max()) + 1 if len(docs) else 1
+        keys, frequencies = np.unique(
+            np.array(doc_terms, dtype=np.int64) * width + posting_docs, return_counts=True
+        )
+
+        return keys // width, keys % width, frequencies.astype(np.int32), doc_lengths
+
+    def _assemble(
+        self,
+        item_ids: np.ndarray,
+        active: np.ndarray,
+        categories: np.ndarray,
+        providers: np.ndarray,
+        terms: np.ndarray,
+        posting_terms: np.ndarray,
+        posting_docs: np.ndarray,
+        frequencies: np.ndarray,
+        doc_lengths: np.ndarray,
+        catalog_version: str | None,
+    ) -> _LexicalSnapshot:
+        # Postings sorted by term then document, so those of a term are contiguous
+        order = np.argsort(posting_terms * max(len(item_ids), 1) + posting_docs)
+        posting_terms = posting_terms[order]
+        posting_docs = posting_docs[order]
+        frequencies = frequencies[order]
+
+        document_frequency = np.bincount(posting_terms, minlength=len(terms))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(document_frequency, out=offsets[1:])
+
+        # idf and the average length are global: every weight is recomputed,
+        # which is a few vectorized passes over the postings
+        size = len(item_ids)
+        idf = np.log(1.0 + (size - document_frequency + 0.5) / (document_frequency + 0.5))
+        average_length = float(doc_lengths.mean()) if size else 0.0
+        norm = self.k1 * (1 - self.b + self.b * doc_lengths[posting_docs] / max(average_length, 1.0))
+        weights = idf[posting_terms] * frequencies * (self.k1 + 1) / (frequencies + norm)
+
+        return _LexicalSnapshot(
+            item_ids=item_ids,
+            active=active,
+            categories=categories,
+            providers=providers,
+            terms=terms,
+            offsets=offsets,
+            doc_ids=posting_docs.astype(np.int32),
+            weights=weights.astype(np.float32),
+            frequencies=frequencies.astype(np.int32),
+            doc_lengths=doc_lengths.astype(np.float32),
+            catalog_version=catalog_version,
+        )
+
+    @staticmethod
+    def _arrays(snapshot: _LexicalSnapshot) -> dict:
+        return {
+            "item_ids": snapshot.item_ids,
+            "active": snapshot.active,
+            "categories": snapshot.categories,
+            "providers": snapshot.providers,
+            "terms": snapshot.terms,
+            "offsets": snapshot.offsets,
+            "doc_ids": snapshot.doc_ids,
+            "weights": snapshot.weights,
+            "frequencies": snapshot.frequencies,
+            "doc_lengths": snapshot.doc_lengths,
+            "catalog_version": snapshot.catalog_version,
+        }
+
+    def _commit(self, snapshot: _LexicalSnapshot) -> None:
+        arrays = self._arrays(snapshot)
+        catalog_version = arrays.pop("catalog_version")
+
+        with atomic_write(self.path, "wb") as f:
+            np.savez(
+                f,
+                **arrays,
+                catalog_version=np.array("" if catalog_version is None else catalog_version),
+            )
+
+        self._snapshot = self._with_lookups(snapshot, self._stamp())
+
+    def _current(self) -> _LexicalSnapshot:
+        # Another process may have saved a newer index
+        if self._stamp() != self._snapshot.stamp:
+            with self._write_lock:
+                if self._stamp() != self._snapshot.stamp:
+                    self._snapshot = self._load()
+
+        return self._snapshot
+
+    def _stamp(self) -> tuple | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> _LexicalSnapshot:
+        stamp = self._stamp()
+
+        if stamp is None:
+            return _LexicalSnapshot.empty()
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except Exception as e:
+            raise LexicalRepositoryException(
+                f"Failed to load lexical index from {self.path}: {str(e)}"
+            ) from e
+
+        catalog_version = str(arrays.pop("catalog_version")) or None
+
+        # Written before term frequencies were stored: start empty and
+        # unversioned, so the next catalog upload rebuilds it whole
+        if "frequencies" not in arrays:
+            return replace(_LexicalSnapshot.empty(), stamp=stamp)
+
+        return self._with_lookups(
+            _LexicalSnapshot(**arrays, catalog_version=catalog_version), stamp
+        )
+
+    @staticmethod
+    def _with_lookups(snapshot: _LexicalSnapshot, stamp: tuple | None) -> _LexicalSnapshot:
+        return _LexicalSnapshot(
+            **LexicalRepositoryBM25._arrays(snapshot),
+            stamp=stamp,
+            term_index={str(term): position for position, term in enumerate(snapshot.terms)},
+            positions={str(item_id): position for position, item_id in enumerate(snapshot.item_ids)},
+            identifiers={
+                item_id: position
+                for position, item_id in enumerate(normalize_texts(snapshot.item_ids.tolist()))
+            },
+        )
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+
+from app.application.dto.match_dtos import MatchCacheStatsDTO
+from app.application.ports.match_cache import MatchCache
+from app.infrastructure.config import settings
+
+
+class InMemoryMatchCache(MatchCache):
+    """
+    Process local LRU of requirement candidates. Entries expire ttl_seconds
+    after they were stored, and the whole cache is dropped as soon as a
+    lookup or a store comes with another version, i.e. once the catalog or
+    its indexes changed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.MATCH_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = settings.MATCH_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        # key -> (expires_at, candidates), least recently used first
+        self._entries: OrderedDict[str, tuple[float, list[tuple[str, float, str]]]] = OrderedDict()
+        self._version: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_many(
+        self, keys: list[str], version: str
+    ) -> dict[str, list[tuple[str, float, str]]]:
+        found: dict[str, list[tuple[str, float, str]]] = {}
+        now = time.monotonic()
+
+        with self._lock:
+            self._check_version(version)
+
+            for key in keys:
+                entry = self._entries.get(key)
+
+                if entry is None or entry[0] <= now:
+                    if entry is not None:
+                        del self._entries[key]
+                    self._misses += 1
+                    continue
+
+                self._entries.move_to_end(key)
+                found[key] = list(entry[1])
+                self._hits += 1
+
+        return found
+
+    def set_many(
+        self, entries: dict[str, list[tuple[str, float, str]]], version: str
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._check_version(version)
+
+            for key, candidates in entries.items():
+                self._entries[key] = (expires_at, list(candidates))
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_stats(self) -> MatchCacheStatsDTO:
+        with self._lock:
+            lookups = self._hits + self._misses
+
+            return MatchCacheStatsDTO(
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=self._hits / lookups if lookups else None,
+                entries=len(self._entries),
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def _check_version(self, version: str) -> None:
+        if version == self._version:
+            return
+
+        if self._entries:
+            self._entries.clear()
+            self._invalidations += 1
+        self._version = version
@@ -0,0 +1,209 @@
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.vector_repository_validation_exception import (
+    VectorRepositoryValidationException,
+)
+
+INDEX_TYPES: tuple[str, ...] = ("flat", "hnsw", "ivf_flat", "ivf_pq")
+
+# FAISS warns below this many training points per IVF centroid
+_MIN_POINTS_PER_CENTROID: int = 39
+
+# An IVF index is retrained once the catalog would get this many times its
+# number of lists, so a catalog growing by small uploads retrains
+# O(log size) times
+_RETRAIN_GROWTH: int = 2
+
+
+@dataclass(frozen=True, slots=True)
+class FaissIndexConfig:
+    """
+    Index type and build/search knobs of the FAISS index.
+
+    - flat: exact brute force scan, 4 x dimension bytes per vector.
+    - hnsw: graph index, fast and accurate, no training, no removals.
+    - ivf_flat: inverted lists over full vectors, trained on the catalog.
+    - ivf_pq: inverted lists over product-quantized codes, pq_m bytes per vector.
+    """
+
+    index_type: str = settings.VECTOR_INDEX_TYPE
+    hnsw_m: int = settings.VECTOR_HNSW_M
+    hnsw_ef_construction: int = settings.VECTOR_HNSW_EF_CONSTRUCTION
+    hnsw_ef_search: int = settings.VECTOR_HNSW_EF_SEARCH
+    ivf_nlist: int = settings.VECTOR_IVF_NLIST
+    ivf_nprobe: int = settings.VECTOR_IVF_NPROBE
+    pq_m: int = settings.VECTOR_PQ_M
+    pq_nbits: int = settings.VECTOR_PQ_NBITS
+
+    def validate(self, dimension: int) -> None:
+        if self.index_type not in INDEX_TYPES:
+            raise VectorRepositoryValidationException(
+                f"Unknown FAISS index type '{self.index_type}'. Expected one of: {INDEX_TYPES}"
+            )
+
+        if self.index_type == "ivf_pq" and dimension % self.pq_m != 0:
+            raise VectorRepositoryValidationException(
+                f"VECTOR_PQ_M ({self.pq_m}) must divide the vector dimension ({dimension})"
+            )
+
+
+def create_index(
+    dimension: int, config: FaissIndexConfig, training_vectors: np.ndarray | None = None
+) -> faiss.Index:
+    """
+    Returns an empty index ready to receive vectors through add_with_ids.
+    IVF indexes are trained on training_vectors; their number of lists (and
+    PQ code size) is reduced when the catalog is too small to train the
+    configured values.
+    """
+    config.validate(dimension)
+
+    if config.index_type == "flat":
+        return faiss.IndexIDMap2(faiss.IndexFlatL2(dimension))
+
+    if config.index_type == "hnsw":
+        hnsw = faiss.IndexHNSWFlat(dimension, config.hnsw_m)
+        hnsw.hnsw.efConstruction = config.hnsw_ef_construction
+        return faiss.IndexIDMap2(hnsw)
+
+    if training_vectors is None or len(training_vectors) == 0:
+        # Untrained IVF placeholder, it is rebuilt on the first write
+        quantizer = faiss.IndexFlatL2(dimension)
+        return faiss.IndexIVFFlat(quantizer, dimension, 1)
+
+    nlist, nbits = _ivf_shape(config, len(training_vectors))
+
+    if config.index_type == "ivf_flat":
+        description = f"IVF{nlist},Flat"
+    else:
+        description = f"IVF{nlist},PQ{config.pq_m}x{nbits}"
+
+    index = faiss.index_factory(dimension, description)
+    index.train(training_vectors)
+
+    # IVF indexes store external ids natively, the hash table direct map
+    # makes removing or reconstructing one id O(1)
+    ivf = faiss.extract_index_ivf(index)
+    ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+
+    return index
+
+
+def _ivf_shape(config: FaissIndexConfig, train_size: int) -> tuple[int, int]:
+    # Number of lists and PQ bits per code the given training set can train
+    nlist = max(1, min(config.ivf_nlist, train_size // _MIN_POINTS_PER_CENTROID))
+    # Each sub-quantizer trains 2^nbits centroids on the same points
+    nbits = max(
+        1,
+        min(config.pq_nbits, int(math.log2(max(train_size // _MIN_POINTS_PER_CENTROID, 2)))),
+    )
+    return nlist, nbits
+
+
+def needs_retraining(index: faiss.Index, config: FaissIndexConfig, size: int) -> bool:
+    """
+    True when index is an IVF index trained on a catalog too small for size
+    vectors: the configured lists or PQ bits it had to give up can now be
+    trained, and keeping the coarse ones would make every list scan a large
+    share of the catalog.
+    """
+    index = _base_index(index)
+
+    if not isinstance(index, faiss.IndexIVF) or not index.is_trained:
+        return False
+
+    nlist, nbits = _ivf_shape(config, size)
+
+    if nlist >= _RETRAIN_GROWTH * index.nlist:
+        return True
+
+    return isinstance(index, faiss.IndexIVFPQ) and nbits > index.pq.nbits
+
+
+def _base_index(index: faiss.Index) -> faiss.Index:
+    index = faiss.downcast_index(index)
+
+    if isinstance(index, faiss.IndexIDMap):
+        return faiss.downcast_index(index.index)
+    return index
+
+
+def read_index(path: Path, use_mmap: bool = False) -> faiss.Index:
+    """
+    Reads an index file. With use_mmap the vector data stays in the file and
+    is mapped read-only, so every process reading the same file shares the
+    page cache instead of holding a private copy. A mapped index cannot be
+    modified, writers work on a private copy (see read_index without mmap).
+    """
+    if not use_mmap:
+        return faiss.read_index(str(path))
+
+    with open(path, "rb") as f:
+        fourcc = f.read(4)
+
+    # IVF indexes ("Iw..") map their inverted lists, flat and HNSW indexes
+    # map their flat code arrays
+    flag = faiss.IO_FLAG_MMAP if fourcc.startswith(b"Iw") else faiss.IO_FLAG_MMAP_IFC
+
+    return faiss.read_index(str(path), flag | faiss.IO_FLAG_READ_ONLY)
+
+
+def supports_removal(index: faiss.Index) -> bool:
+    # HNSW graphs cannot drop nodes, they have to be rebuilt or tombstoned
+    return not isinstance(_base_index(index), faiss.IndexHNSW)
+
+
+def tombstone(index: faiss.Index, ids: np.ndarray) -> None:
+    """
+    Hides the vectors of the given ids in an id-mapped index without
+    removing them: their nodes keep routing graph searches, but are
+    relabeled with negative ids, which live_ids_selector excludes. Vectors
+    added later under the same ids are not affected.
+    """
+    index = faiss.downcast_index(index)
+    id_map = faiss.vector_to_array(index.id_map)
+
+    nodes = np.flatnonzero(np.isin(id_map, ids))
+    id_map[nodes] = -2 - nodes
+
+    faiss.copy_array_to_vector(id_map, index.id_map)
+    index.construct_rev_map()
+
+
+def live_ids_selector() -> faiss.IDSelector:
+    # Every id but the negative ones given to tombstones
+    return faiss.IDSelectorRange(0, np.iinfo(np.int64).max)
+
+
+def build_search_parameters(
+    index: faiss.Index,
+    config: FaissIndexConfig,
+    selector: faiss.IDSelector | None = None,
+) -> faiss.SearchParameters | None:
+    """
+    Search time knobs for the given index: nprobe for IVF, efSearch for HNSW,
+    plus an optional selector restricting the candidate ids.
+    """
+    index = _base_index(index)
+
+    if isinstance(index, faiss.IndexHNSW):
+        params = faiss.SearchParametersHNSW()
+        params.efSearch = config.hnsw_ef_search
+    elif isinstance(index, faiss.IndexIVF):
+        params = faiss.SearchParametersIVF()
+        params.nprobe = min(config.ivf_nprobe, index.nlist)
+    elif selector is not None:
+        params = faiss.SearchParameters()
+    else:
+        return None
+
+    if selector is not None:
+        params.sel = selector
+
+    return params
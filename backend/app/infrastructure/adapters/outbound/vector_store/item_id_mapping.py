@@ -0,0 +1,340 @@
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.infrastructure.utils.atomic_files import atomic_write
+
+_MAGIC: bytes = b"CMAP"
+_FORMAT_VERSION: int = 1
+
+# magic, version, count, heap size, slot count, metadata size
+_HEADER = struct.Struct("<4sIQQQQ")
+_HEADER_SIZE: int = 64
+
+_MAX_FAISS_ID: int = (1 << 63) - 1
+_NO_CODE: int = -1
+
+
+def to_faiss_id(item_id: str) -> int:
+    digest = hashlib.blake2b(item_id.encode("utf-8"), digest_size=8).digest()
+    # FAISS ids are signed and -1 means "no result", keep 63 bits
+    return int.from_bytes(digest, "little") & _MAX_FAISS_ID
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _slot_count(count: int) -> int:
+    # Power of two with at most 50% load so probe chains stay short
+    return max(8, 1 << (2 * count - 1).bit_length()) if count else 8
+
+
+class ItemIdMapping:
+    """
+    Immutable FAISS id -> item metadata table stored as flat arrays:
+
+    - ids: FAISS id of each item.
+    - offsets + heap: item_id strings as one utf-8 byte heap, item i spans
+      heap[offsets[i]:offsets[i + 1]].
+    - slots: open addressing hash table FAISS id -> position, giving an O(1)
+      lookup from item_id (hashed to its FAISS id) to position.
+    - active, category_codes, provider_codes: per item search filters, codes
+      index the small categories/providers name lists.
+
+    On disk every array is stored raw and loaded with mmap, so opening the
+    mapping does not depend on the catalog size nor create a Python object
+    per item.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        heap: np.ndarray,
+        active: np.ndarray,
+        category_codes: np.ndarray,
+        provider_codes: np.ndarray,
+        categories: list[str],
+        providers: list[str],
+        slots: np.ndarray | None = None,
+    ):
+        self.ids = ids
+        self.offsets = offsets
+        self.heap = heap
+        self.active = active
+        self.category_codes = category_codes
+        self.provider_codes = provider_codes
+        self.categories = categories
+        self.providers = providers
+        self.slots = slots if slots is not None else self._build_slots(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def empty(cls) -> "ItemIdMapping":
+        return cls.from_items([])
+
+    @classmethod
+    def from_items(cls, items: list[dict[str, Any]]) -> "ItemIdMapping":
+        return cls._concat(cls._empty_arrays(), items)
+
+    def item_id(self, position: int) -> str:
+        start, end = self.offsets[position], self.offsets[position + 1]
+        return self.heap[start:end].tobytes().decode("utf-8")
+
+    def item_ids(self) -> list[str]:
+        return [self.item_id(position) for position in range(len(self))]
+
+    def position_of(self, item_id: str) -> int | None:
+        position = int(self.positions_of(np.array([to_faiss_id(item_id)], dtype=np.int64))[0])
+        return position if position >= 0 else None
+
+    def positions_of(self, faiss_ids: np.ndarray) -> np.ndarray:
+        """
+        Vectorized hash table lookup, -1 for ids that are not mapped.
+        """
+        faiss_ids = np.asarray(faiss_ids, dtype=np.int64)
+        result = np.full(len(faiss_ids), -1, dtype=np.int64)
+
+        if not len(self):
+            return result
+
+        mask = len(self.slots) - 1
+        pending = np.flatnonzero(faiss_ids >= 0)
+        slots = faiss_ids[pending] & mask
+
+        while pending.size:
+            positions = self.slots[slots]
+            occupied = positions >= 0
+            hit = occupied & (self.ids[np.where(occupied, positions, 0)] == faiss_ids[pending])
+            result[pending[hit]] = positions[hit]
+
+            # Keep probing the ids that met an occupied slot of another id
+            probing = occupied & ~hit
+            pending = pending[probing]
+            slots = (slots[probing] + 1) & mask
+
+        return result
+
+    def filter_mask(self, category: str | None = None, provider: str | None = None) -> np.ndarray:
+        allowed = self.active.astype(bool)
+
+        if category:
+            allowed &= self.category_codes == self._code(self.categories, category)
+        if provider:
+            allowed &= self.provider_codes == self._code(self.providers, provider)
+
+        return allowed
+
+    def with_active(self, positions: list[int], active: bool) -> "ItemIdMapping":
+        mask = np.array(self.active, dtype=np.uint8)
+        mask[positions] = active
+
+        return ItemIdMapping(
+            ids=self.ids,
+            offsets=self.offsets,
+            heap=self.heap,
+            active=mask,
+            category_codes=self.category_codes,
+            provider_codes=self.provider_codes,
+            categories=self.categories,
+            providers=self.providers,
+            slots=self.slots,
+        )
+
+    def replace_items(self, removed_positions: list[int], items: list[dict[str, Any]]) -> "ItemIdMapping":
+        """
+        Returns a mapping without the given positions and with items appended.
+        """
+        kept = np.ones(len(self), dtype=bool)
+        kept[removed_positions] = False
+
+        # Keep the heap bytes of the kept items without decoding them
+        lengths = np.diff(self.offsets).astype(np.int64)
+        heap = self.heap[np.repeat(kept, lengths)]
+        offsets = np.zeros(np.count_nonzero(kept) + 1, dtype=np.uint64)
+        np.cumsum(lengths[kept], out=offsets[1:])
+
+        arrays = {
+            "ids": self.ids[kept],
+            "offsets": offsets,
+            "heap": heap,
+            "active": self.active[kept],
+            "category_codes": self.category_codes[kept],
+            "provider_codes": self.provider_codes[kept],
+            "categories": list(self.categories),
+            "providers": list(self.providers),
+        }
+
+        return self._concat(arrays, items)
+
+    def write(self, path: Path) -> None:
+        metadata = json.dumps(
+            {"categories": self.categories, "providers": self.providers}
+        ).encode("utf-8")
+
+        sections = [
+            np.ascontiguousarray(self.ids, dtype=np.int64),
+            np.ascontiguousarray(self.offsets, dtype=np.uint64),
+            np.ascontiguousarray(self.slots, dtype=np.int64),
+            np.ascontiguousarray(self.category_codes, dtype=np.int32),
+            np.ascontiguousarray(self.provider_codes, dtype=np.int32),
+            np.ascontiguousarray(self.active, dtype=np.uint8),
+            np.ascontiguousarray(self.heap, dtype=np.uint8),
+        ]
+
+        with atomic_write(path, "wb") as f:
+            header = _HEADER.pack(
+                _MAGIC, _FORMAT_VERSION, len(self), len(self.heap), len(self.slots), len(metadata)
+            )
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+
+            for section in sections:
+                f.write(section.tobytes())
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+
+            f.write(metadata)
+
+    @classmethod
+    def load(cls, path: Path) -> "ItemIdMapping":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, heap_size, slot_count, metadata_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"{path} is not a catalog id mapping file")
+
+        offset = _HEADER_SIZE
+
+        def section(dtype: Any, length: int) -> np.ndarray:
+            nonlocal offset
+            array = np.frombuffer(buffer, dtype=dtype, count=length, offset=offset)
+            offset = _align(offset + array.nbytes)
+            return array
+
+        ids = section(np.int64, count)
+        offsets = section(np.uint64, count + 1)
+        slots = section(np.int64, slot_count)
+        category_codes = section(np.int32, count)
+        provider_codes = section(np.int32, count)
+        active = section(np.uint8, count)
+        heap = section(np.uint8, heap_size)
+        metadata = json.loads(bytes(buffer[offset : offset + metadata_size]))
+
+        return cls(
+            ids=ids,
+            offsets=offsets,
+            heap=heap,
+            active=active,
+            category_codes=category_codes,
+            provider_codes=provider_codes,
+            categories=metadata["categories"],
+            providers=metadata["providers"],
+            slots=slots,
+        )
+
+
+    @staticmethod
+    def _empty_arrays() -> dict[str, Any]:
+        return {
+            "ids": np.zeros(0, dtype=np.int64),
+            "offsets": np.zeros(1, dtype=np.uint64),
+            "heap": np.zeros(0, dtype=np.uint8),
+            "active": np.zeros(0, dtype=np.uint8),
+            "category_codes": np.zeros(0, dtype=np.int32),
+            "provider_codes": np.zeros(0, dtype=np.int32),
+            "categories": [],
+            "providers": [],
+        }
+
+    @classmethod
+    def _concat(cls, arrays: dict[str, Any], items: list[dict[str, Any]]) -> "ItemIdMapping":
+        categories: list[str] = arrays["categories"]
+        providers: list[str] = arrays["providers"]
+        category_index = {name: code for code, name in enumerate(categories)}
+        provider_index = {name: code for code, name in enumerate(providers)}
+
+        encoded = [item["item_id"].encode("utf-8") for item in items]
+        lengths = np.array([len(value) for value in encoded], dtype=np.uint64)
+        offsets = np.concatenate(
+            [arrays["offsets"], arrays["offsets"][-1] + np.cumsum(lengths, dtype=np.uint64)]
+        )
+
+        return cls(
+            ids=np.concatenate(
+                [arrays["ids"], np.array([to_faiss_id(item["item_id"]) for item in items], dtype=np.int64)]
+            ),
+            offsets=offsets,
+            heap=np.concatenate([arrays["heap"], np.frombuffer(b"".join(encoded), dtype=np.uint8)]),
+            active=np.concatenate(
+                [arrays["active"], np.array([bool(item.get("active", True)) for item in items], dtype=np.uint8)]
+            ),
+            category_codes=np.concatenate(
+                [
+                    arrays["category_codes"],
+                    np.array(
+                        [cls._encode(category_index, categories, item.get("category")) for item in items],
+                        dtype=np.int32,
+                    ),
+                ]
+            ),
+            provider_codes=np.concatenate(
+                [
+                    arrays["provider_codes"],
+                    np.array(
+                        [cls._encode(provider_index, providers, item.get("provider")) for item in items],
+                        dtype=np.int32,
+                    ),
+                ]
+            ),
+            categories=categories,
+            providers=providers,
+        )
+
+    @staticmethod
+    def _encode(index: dict[str, int], names: list[str], value: str | None) -> int:
+        if not value:
+            return _NO_CODE
+
+        if value not in index:
+            index[value] = len(names)
+            names.append(value)
+
+        return index[value]
+
+    @staticmethod
+    def _code(names: list[str], value: str) -> int:
+        try:
+            return names.index(value)
+        except ValueError:
+            # Unknown names match no item
+            return -2
+
+    @staticmethod
+    def _build_slots(ids: np.ndarray) -> np.ndarray:
+        slots = np.full(_slot_count(len(ids)), -1, dtype=np.int64)
+        mask = len(slots) - 1
+
+        pending = np.arange(len(ids), dtype=np.int64)
+        candidates = ids & mask
+
+        # Insert every id at once, colliding ids move to the next slot each round
+        while pending.size:
+            free = slots[candidates] == -1
+            free_slots, first = np.unique(candidates[free], return_index=True)
+            placed = np.flatnonzero(free)[first]
+            slots[free_slots] = pending[placed]
+
+            waiting = np.ones(pending.size, dtype=bool)
+            waiting[placed] = False
+            pending = pending[waiting]
+            candidates = (candidates[waiting] + 1) & mask
+
+        return slots
@@ -1,95 +1,646 @@
 import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 import faiss
 import numpy as np
-from faiss import IndexFlatL2
 
 from app.application.ports.vector_repository import VectorRepository
+from app.infrastructure.adapters.outbound.vector_store.faiss_index_factory import (
+    FaissIndexConfig,
+    build_search_parameters,
+    create_index,
+    live_ids_selector,
+    needs_retraining,
+    read_index,
+    supports_removal,
+    tombstone,
+)
+from app.infrastructure.adapters.outbound.vector_store.item_id_mapping import (
+    ItemIdMapping,
+    to_faiss_id,
+)
+from app.infrastructure.config import settings
 from app.infrastructure.exceptions.vector_repository_exception import (
     VectorRepositoryException,
 )
 from app.infrastructure.exceptions.vector_repository_validation_exception import VectorRepositoryValidationException
+from app.infrastructure.utils.atomic_files import atomic_write, fsync_file
+from app.infrastructure.utils.file_lock import interprocess_lock
+
+# Share of tombstoned HNSW nodes that triggers rebuilding the graph
+_MAX_TOMBSTONE_RATIO: float = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexSnapshot:
+    index: faiss.Index
+    mapping: ItemIdMapping
+    # Identity of the manifest the snapshot was loaded from or written to
+    stamp: tuple | None = None
+    # Manifest entry, i.e. the files this snapshot is read from
+    manifest: dict = field(default_factory=dict)
+
+    @property
+    def catalog_version(self) -> str | None:
+        return self.manifest.get("catalog_version")
+
+    @property
+    def tombstones(self) -> int:
+        # Vectors of the index no mapped item owns anymore
+        return self.index.ntotal - len(self.mapping)
 
 
 class VectorRepositoryFAISS(VectorRepository):
+    """
+    Keeps the index and its mapping in memory as one immutable snapshot.
+    Writers build a new snapshot and swap it in a single assignment, so
+    concurrent searches always see a consistent index and mapping.
+
+    Vectors are stored under a stable 63-bit id hashed from their item_id,
+    so a single item can be replaced or removed without rebuilding the index.
+    The mapping (see ItemIdMapping) translates those ids back to item_ids and
+    also stores the active flag, category and provider of each item, used to
+    restrict searches without touching the vectors.
 
-    def __init__(self, dimension: int, path: str | Path | None = None):
+    The index type (exact flat scan or approximate HNSW/IVF) comes from
+    index_config. HNSW graphs cannot drop vectors: replacing or removing
+    items tombstones their old nodes (see tombstone), which searches skip,
+    and the graph is rebuilt from the live vectors once tombstones exceed
+    _MAX_TOMBSTONE_RATIO of it. IVF indexes
+    are trained on the vectors of their first write, and retrained on every
+    stored vector when upserts grow the catalog past what they were sized
+    for (see needs_retraining).
+
+    Every write creates a new generation of index and mapping files, fsyncs
+    them and then atomically replaces a small manifest naming the current
+    generation and the catalog version it was built from. The manifest is
+    the commit point: a crash leaves the previous generation in place, and
+    readers always open an index and mapping that belong together. Writers
+    of every process hold a lock file while they reload, write, publish and
+    clean up a generation, so two processes never write the same generation
+    nor remove each other's files.
+
+    With use_mmap the index is mapped read-only from disk, so several worker
+    processes share the page cache instead of each holding a private copy;
+    writes then work on a private copy read from the file. Every search
+    checks, at most once per reload_interval seconds, whether another
+    process committed a new manifest.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        path: str | Path | None = None,
+        index_config: FaissIndexConfig | None = None,
+        use_mmap: bool = settings.VECTOR_INDEX_MMAP,
+        reload_interval: float = settings.VECTOR_INDEX_RELOAD_INTERVAL,
+    ):
         self.dimension = dimension
+        self.use_mmap = use_mmap
+        self.reload_interval = reload_interval
+        self.index_config = index_config or FaissIndexConfig()
+        self.index_config.validate(dimension)
         self.path = Path(path) if path else Path("data") / "vectors" / "catalog.index"
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.path.with_suffix(".manifest.json")
+        # Unversioned files written before the manifest, only read to migrate them
+        self.mapping_path = self.path.with_suffix(".mapping")
+        self.legacy_mapping_path = self.path.with_suffix(".json")
+        self.lock_path = self.path.with_suffix(".lock")
+
+        self._write_lock = threading.Lock()
+        self._next_reload_check = time.monotonic() + reload_interval
+
+        if (
+            not self.manifest_path.exists()
+            and self.legacy_mapping_path.exists()
+            and not self.mapping_path.exists()
+        ):
+            index = self._load_or_create_index(self.path, use_mmap=False)
+            self._snapshot = _IndexSnapshot(index=index, mapping=ItemIdMapping.empty())
+            self._migrate_legacy_mapping(index)
+        else:
+            self._snapshot = self._load_snapshot()
+
+    @property
+    def index(self) -> faiss.Index:
+        return self._snapshot.index
+
+    @property
+    def index_to_item_id(self) -> list[str]:
+        return self._snapshot.mapping.item_ids()
+
+    @staticmethod
+    def to_faiss_id(item_id: str) -> int:
+        return to_faiss_id(item_id)
 
-        self.index = self._load_or_create_index()
-        self.mapping_path = self.path.with_suffix(".json")
-        self.index_to_item_id = self._load_mapping()
+    def get_catalog_version(self) -> str | None:
+        return self._snapshot.catalog_version
 
-    def _load_or_create_index(self) -> IndexFlatL2:
+    def _load_or_create_index(self, path: Path, use_mmap: bool) -> faiss.Index:
         # If path exists try to read the index file
-        if self.path.exists():
+        if path.exists():
             try:
-                return faiss.read_index(str(self.path))
+                return read_index(path, use_mmap=use_mmap)
             except Exception as e:
                 raise VectorRepositoryException(
-                    f"Failed to load FAISS index from {self.path}: {str(e)}"
+                    f"Failed to load FAISS index from {path}: {str(e)}"
                 ) from e
 
-        return faiss.IndexFlatL2(self.dimension)
+        return create_index(self.dimension, self.index_config)
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _load_snapshot(self) -> _IndexSnapshot:
+        # Stamp first: a commit racing with the load is caught by the next check
+        stamp = self._stamp()
+        manifest = self._read_manifest()
+
+        if manifest:
+            index_path = self.path.parent / manifest["index"]
+            mapping_path = self.path.parent / manifest["mapping"]
+        else:
+            index_path, mapping_path = self.path, self.mapping_path
+
+        return _IndexSnapshot(
+            index=self._load_or_create_index(index_path, use_mmap=self.use_mmap),
+            mapping=self._load_mapping(mapping_path),
+            stamp=stamp,
+            manifest=manifest,
+        )
+
+    def _stamp(self) -> tuple | None:
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self) -> bool:
+        """
+        Reloads index and mapping when their files were replaced by another
+        process. Returns True when a new snapshot was loaded.
+        """
+        with self._write_lock:
+            return self._reload_if_stale()
+
+    def _reload_if_stale(self) -> bool:
+        if self._stamp() == self._snapshot.stamp:
+            return False
+
+        self._snapshot = self._load_snapshot()
+        return True
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Serializes writers, the threads of this process through _write_lock
+        and other processes through the lock file. The snapshot is reloaded
+        first, so the write starts from the last committed generation.
+        """
+        with self._write_lock, interprocess_lock(self.lock_path):
+            self._reload_if_stale()
+            yield
+
+    def _refresh_if_due(self) -> None:
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+
+        self._next_reload_check = now + self.reload_interval
+
+        # One stat call, the files are only reloaded when a new manifest exists
+        if self._stamp() != self._snapshot.stamp:
+            self.refresh()
+
+    def _load_mapping(self, path: Path) -> ItemIdMapping:
+        if not path.exists():
+            return ItemIdMapping.empty()
 
-    def _load_mapping(self):
-        if self.mapping_path.exists():
-            with open(self.mapping_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return []
+        try:
+            return ItemIdMapping.load(path)
+        except Exception as e:
+            raise VectorRepositoryException(
+                f"Failed to load FAISS mapping from {path}: {str(e)}"
+            ) from e
+
+    def _migrate_legacy_mapping(self, index: faiss.Index) -> None:
+        with open(self.legacy_mapping_path, "r", encoding="utf-8") as f:
+            mapping = json.load(f)
+
+        # The first mappings were a plain list of item ids without metadata
+        if isinstance(mapping, list):
+            mapping = {"item_ids": mapping}
+
+        size = len(mapping["item_ids"])
+        items = [
+            {
+                "item_id": item_id,
+                "active": (mapping.get("active") or [True] * size)[position],
+                "category": (mapping.get("categories") or [None] * size)[position],
+                "provider": (mapping.get("providers") or [None] * size)[position],
+            }
+            for position, item_id in enumerate(mapping["item_ids"])
+        ]
+
+        if "ids" in mapping or index.ntotal == 0:
+            with self._writing():
+                self._commit(ItemIdMapping.from_items(items), catalog_version=None, index=index)
+        else:
+            # Indexes written before stable ids address vectors by position
+            if isinstance(index, faiss.IndexIVF):
+                index.make_direct_map()
+            vectors = index.reconstruct_n(0, index.ntotal)
+
+            self.save(
+                [
+                    {**item, "embedding": vectors[position]}
+                    for position, item in enumerate(items)
+                    if item["item_id"] is not None
+                ]
+            )
+
+    def save(self, items: list[dict], catalog_version: str | None = None) -> None:
+        if not items:
+            return
+
+        self._validate_items(items)
+
+        # Last occurrence wins when the same item_id comes more than once
+        items = list({item["item_id"]: item for item in items}.values())
+
+        with self._writing():
+            try:
+                mapping = ItemIdMapping.from_items(items)
+                self._check_collisions(items, mapping.ids, None)
+
+                vectors = np.array([item["embedding"] for item in items], np.float32)
+
+                # Build a fresh index trained on the new vectors,
+                # the live one keeps serving searches
+                index = create_index(self.dimension, self.index_config, vectors)
+
+                # add embeddings
+                index.add_with_ids(vectors, mapping.ids)
+
+                # persist index and mapping to disk
+                self._commit(mapping, catalog_version, index=index)
+
+            except VectorRepositoryException:
+                raise
+            except Exception as e:
+                raise VectorRepositoryException(
+                    f"Failed to save FAISS index or mapping: {str(e)}"
+                ) from e
 
-    def save(self, items: list[dict]) -> None:
+    def upsert(self, items: list[dict], catalog_version: str | None = None) -> None:
         if not items:
             return
 
+        self._validate_items(items)
+
+        # Last occurrence wins when the same item_id comes more than once
+        new_items = list({item["item_id"]: item for item in items}.values())
+
+        with self._writing():
+            try:
+                current = self._snapshot
+                ids = np.array([to_faiss_id(item["item_id"]) for item in new_items], dtype=np.int64)
+                self._check_collisions(new_items, ids, current.mapping)
+
+                vectors = np.array([item["embedding"] for item in new_items], np.float32)
+
+                positions = current.mapping.positions_of(ids)
+                replaced_positions = positions[positions >= 0].tolist()
+
+                size = len(current.mapping) - len(replaced_positions) + len(new_items)
+
+                if not current.index.is_trained:
+                    # First write into an IVF index: train it on these vectors
+                    index = create_index(self.dimension, self.index_config, vectors)
+                elif needs_retraining(current.index, self.index_config, size):
+                    index = self._retrained(current, replaced_positions, vectors)
+                else:
+                    index = self._without(current, replaced_positions)
+
+                index.add_with_ids(vectors, ids)
+
+                self._commit(
+                    current.mapping.replace_items(replaced_positions, new_items),
+                    catalog_version,
+                    index=index,
+                )
+
+            except VectorRepositoryException:
+                raise
+            except Exception as e:
+                raise VectorRepositoryException(
+                    f"Failed to upsert FAISS index or mapping: {str(e)}"
+                ) from e
+
+    def remove(self, item_ids: list[str], catalog_version: str | None = None) -> None:
+        with self._writing():
+            current = self._snapshot
+            positions = current.mapping.positions_of(
+                np.array([to_faiss_id(item_id) for item_id in set(item_ids)], dtype=np.int64)
+            )
+            removed_positions = positions[positions >= 0].tolist()
+
+            if not removed_positions:
+                return
+
+            try:
+                index = self._without(current, removed_positions)
+                self._commit(
+                    current.mapping.replace_items(removed_positions, []),
+                    catalog_version,
+                    index=index,
+                )
+
+            except Exception as e:
+                raise VectorRepositoryException(
+                    f"Failed to remove from FAISS index or mapping: {str(e)}"
+                ) from e
+
+    def _without(self, current: _IndexSnapshot, positions: list[int]) -> faiss.Index:
+        """
+        Returns a copy of the current index without the vectors of the given
+        positions. The live index is never mutated.
+        """
+        if not positions:
+            return self._writable_copy(current)
+
+        removed_ids = current.mapping.ids[positions]
+
+        if supports_removal(current.index):
+            index = self._writable_copy(current)
+            index.remove_ids(removed_ids)
+            return index
+
+        if current.tombstones + len(positions) <= _MAX_TOMBSTONE_RATIO * current.index.ntotal:
+            index = self._writable_copy(current)
+            tombstone(index, removed_ids)
+            return index
+
+        # Too many tombstones: rebuild the graph from the live vectors only
+
+        kept = np.ones(len(current.mapping), dtype=bool)
+        kept[positions] = False
+        kept_ids = current.mapping.ids[kept]
+
+        index = create_index(self.dimension, self.index_config)
+        if len(kept_ids):
+            index.add_with_ids(current.index.reconstruct_batch(kept_ids), kept_ids)
+        return index
+
+    def _retrained(
+        self, current: _IndexSnapshot, positions: list[int], vectors: np.ndarray
+    ) -> faiss.Index:
+        """
+        Returns a new IVF index trained on the kept vectors of the current one
+        plus the given ones, holding the kept vectors. IVF-PQ only stores
+        codes, so kept vectors are re-encoded from their reconstruction.
+        """
+        kept = np.ones(len(current.mapping), dtype=bool)
+        kept[positions] = False
+        kept_ids = current.mapping.ids[kept]
+        kept_vectors = (
+            current.index.reconstruct_batch(kept_ids)
+            if len(kept_ids)
+            else np.zeros((0, self.dimension), dtype=np.float32)
+        )
+
+        index = create_index(
+            self.dimension, self.index_config, np.vstack([kept_vectors, vectors])
+        )
+        if len(kept_ids):
+            index.add_with_ids(kept_vectors, kept_ids)
+        return index
+
+    def _writable_copy(self, current: _IndexSnapshot) -> faiss.Index:
+        # A mapped index cannot be cloned nor modified, read a private copy
+        # of the file it was mapped from instead
+        if self.use_mmap:
+            if current.manifest:
+                return read_index(self.path.parent / current.manifest["index"])
+            if self.path.exists():
+                return read_index(self.path)
+        return faiss.clone_index(current.index)
+
+    @staticmethod
+    def _check_collisions(
+        items: list[dict], ids: np.ndarray, current: ItemIdMapping | None
+    ) -> None:
+        if len(np.unique(ids)) != len(ids):
+            raise VectorRepositoryException("FAISS id collision between different item_ids")
+
+        if current is None:
+            return
+
+        for item, position in zip(items, current.positions_of(ids).tolist()):
+            if position >= 0 and current.item_id(position) != item["item_id"]:
+                raise VectorRepositoryException(
+                    f"FAISS id collision between '{item['item_id']}' and '{current.item_id(position)}'"
+                )
+
+    def set_active(
+        self, item_ids: list[str], active: bool, catalog_version: str | None = None
+    ) -> None:
+        with self._writing():
+            current = self._snapshot
+            positions = current.mapping.positions_of(
+                np.array([to_faiss_id(item_id) for item_id in set(item_ids)], dtype=np.int64)
+            )
+            positions = positions[positions >= 0].tolist()
+
+            if positions:
+                # Only the mask changes, vectors are left untouched
+                mapping = current.mapping.with_active(positions, active)
+            elif catalog_version is not None and catalog_version != current.catalog_version:
+                # Nothing indexed changed, but the catalog did: record its
+                # version so the index is not taken for stale
+                mapping = current.mapping
+            else:
+                return
+
+            try:
+                # The index file is shared with the previous generation
+                self._commit(mapping, catalog_version)
+            except Exception as e:
+                raise VectorRepositoryException(
+                    f"Failed to save FAISS mapping: {str(e)}"
+                ) from e
+
+    def _validate_items(self, items: list[dict]) -> None:
         for item in items:
             if "embedding" not in item or "item_id" not in item:
                 raise VectorRepositoryValidationException("Each item must have 'embedding' and 'item_id' fields")
 
-        try:
-            # Reset index
-            self.index.reset()
+    def _commit(
+        self,
+        mapping: ItemIdMapping,
+        catalog_version: str | None,
+        index: faiss.Index | None = None,
+    ) -> None:
+        """
+        Writes a new generation and publishes it through the manifest. When
+        index is None only the mapping changed and the current index file is
+        kept. Callers hold both write locks.
+        """
+        previous = self._read_manifest()
+        generation = previous.get("generation", 0) + 1
 
-            # add embeddings
-            self.index.add(np.array([item["embedding"] for item in items], np.float32))
+        manifest = {
+            "generation": generation,
+            "index": previous.get("index"),
+            "mapping": self._generation_name(generation, ".mapping"),
+            "catalog_version": catalog_version,
+        }
 
-            # persist to disk
-            faiss.write_index(self.index, str(self.path))
+        # persist mapping to disk
+        mapping.write(self.path.parent / manifest["mapping"])
 
-            # extract item_ids
-            item_ids = [item["item_id"] for item in items]
+        if index is not None or not manifest["index"]:
+            index = index if index is not None else self._snapshot.index
+            manifest["index"] = self._generation_name(generation, ".index")
+            index_path = self.path.parent / manifest["index"]
 
-            # persist mapping to disk
-            with open(self.mapping_path, "w", encoding="utf-8") as f:
-                json.dump(item_ids, f)
+            # persist index to disk, a new file so processes that mapped the
+            # previous one keep reading a complete index
+            faiss.write_index(index, str(index_path))
+            fsync_file(index_path)
 
-            # sync memory with disk
-            self.index_to_item_id = item_ids
+        # Commit point: readers switch to the new generation here
+        with atomic_write(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
 
-        except Exception as e:
-            raise VectorRepositoryException(
-                f"Failed to save FAISS index or mapping: {str(e)}"
-            ) from e
+        if index is None:
+            index = self._snapshot.index
+        elif self.use_mmap:
+            index = read_index(self.path.parent / manifest["index"], use_mmap=True)
+
+        # swap memory with disk in one step
+        self._snapshot = _IndexSnapshot(
+            index=index, mapping=mapping, stamp=self._stamp(), manifest=manifest
+        )
+
+        self._remove_unused_files(
+            keep={manifest["index"], manifest["mapping"], previous.get("index"), previous.get("mapping")}
+        )
+
+    def _generation_name(self, generation: int, suffix: str) -> str:
+        return f"{self.path.stem}.{generation:08d}{suffix}"
+
+    def _remove_unused_files(self, keep: set[str | None]) -> None:
+        # The previous generation is kept for readers that opened its
+        # manifest just before the switch
+        candidates = [
+            *self.path.parent.glob(f"{self.path.stem}.*.index"),
+            *self.path.parent.glob(f"{self.path.stem}.*.mapping"),
+            self.path,
+            self.mapping_path,
+            self.legacy_mapping_path,
+        ]
+
+        for path in candidates:
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
 
     def search(
-        self, query_embedding: list[float], top_k: int
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        category: str | None = None,
+        provider: str | None = None,
     ) -> list[tuple[str, float]]:
+        filters = {"category": category, "provider": provider}
+        return self.search_batch([query_embedding], top_k, filters=[filters])[0]
 
-        if len(query_embedding) != self.dimension:
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        top_k: int,
+        filters: list[dict[str, str | None]] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        if len(query_embeddings) == 0:
+            return []
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+
+        if queries.ndim != 2 or queries.shape[1] != self.dimension:
+            raise VectorRepositoryValidationException(
+                f"Invalid Vector dimension. Expected dimension: {self.dimension}, got: {queries.shape[-1]}"
+            )
+
+        if filters is not None and len(filters) != len(queries):
             raise VectorRepositoryValidationException(
-                f"Invalid Vector dimension. Expected dimension: {self.dimension}, got: {len(query_embedding)}"
+                "filters must contain one entry per query embedding"
             )
 
-        q = np.array([query_embedding], dtype=np.float32)
-        distances, indices = self.index.search(q, top_k)
+        self._refresh_if_due()
+
+        # Pin the snapshot so a concurrent swap cannot mix index and mapping
+        snapshot = self._snapshot
+
+        # Queries sharing the same filters are searched together in one call
+        groups: dict[tuple[str | None, str | None], list[int]] = {}
+        for position in range(len(queries)):
+            query_filters = filters[position] if filters else {}
+            key = (query_filters.get("category"), query_filters.get("provider"))
+            groups.setdefault(key, []).append(position)
+
+        results: list[list[tuple[str, float]]] = [[] for _ in range(len(queries))]
 
-        results: list[tuple[str, float]] = []
+        for (category, provider), positions in groups.items():
+            allowed = snapshot.mapping.filter_mask(category, provider)
 
-        for idx, dist in zip(indices[0], distances[0]):
-            if 0 <= idx < len(self.index_to_item_id):
-                results.append((self.index_to_item_id[idx], float(dist)))
+            if not allowed.any():
+                continue
+
+            # Excluded items are skipped inside FAISS, so top_k is spent
+            # only on usable candidates
+            selector = self._build_selector(snapshot.mapping.ids, allowed)
+            if snapshot.tombstones:
+                selector = (
+                    faiss.IDSelectorAnd(live_ids_selector(), selector)
+                    if selector is not None
+                    else live_ids_selector()
+                )
+            params = build_search_parameters(snapshot.index, self.index_config, selector)
+
+            distances, labels = snapshot.index.search(
+                queries[positions], top_k, params=params
+            )
+            item_positions = snapshot.mapping.positions_of(labels.ravel()).reshape(labels.shape)
+
+            for row, position in enumerate(positions):
+                results[position] = [
+                    (snapshot.mapping.item_id(item_position), float(dist))
+                    for item_position, dist in zip(item_positions[row].tolist(), distances[row].tolist())
+                    if item_position >= 0
+                ]
 
         return results
+
+    @staticmethod
+    def _build_selector(ids: np.ndarray, allowed: np.ndarray) -> faiss.IDSelector | None:
+        if allowed.all():
+            return None
+
+        excluded = ~allowed
+
+        # Hash the smaller of both sets: a narrow filter lists what is allowed,
+        # a few inactive items list what is excluded
+        if np.count_nonzero(allowed) <= np.count_nonzero(excluded):
+            return faiss.IDSelectorBatch(ids[allowed])
+        return faiss.IDSelectorNot(faiss.IDSelectorBatch(ids[excluded]))
@@ -2,14 +2,66 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    OPENAI_API_KEY: str
-    OPENAI_MODEL: str
+    # Only needed by the openai embedding backend
+    OPENAI_API_KEY: str = ""
+    OPENAI_MODEL: str = "text-embedding-3-small"
     VECTOR_DIMENSION: int
     VECTOR_FILE_PATH: str
     REPOSITORY_FILE_PATH: str
     MAX_DISTANCE: float
     TEMPLATE_CATALOG: str
     TEMPLATE_REQUIREMENT: str
+    REPOSITORY_BACKEND: str = "csv"
+    REPOSITORY_SQLITE_PATH: str = "data/catalog/catalog.sqlite3"
+    CATALOG_CACHE_ENABLED: bool = True
+    # "openai" or "hashing" (local, offline, see HashingEmbeddingService)
+    EMBEDDING_BACKEND: str = "openai"
+    EMBEDDING_HASHING_NGRAM_MIN: int = 3
+    EMBEDDING_HASHING_NGRAM_MAX: int = 5
+    EMBEDDING_BATCH_SIZE: int = 512
+    EMBEDDING_BATCH_MAX_TOKENS: int = 250_000
+    EMBEDDING_MAX_CONCURRENCY: int = 8
+    EMBEDDING_REQUESTS_PER_MINUTE: int = 3_000
+    EMBEDDING_TOKENS_PER_MINUTE: int = 1_000_000
+    EMBEDDING_MAX_RETRIES: int = 6
+    EMBEDDING_RETRY_BASE_DELAY: float = 0.5
+    EMBEDDING_RETRY_MAX_DELAY: float = 30.0
+    # Texts embedded between two writes to the embedding cache
+    EMBEDDING_CHECKPOINT_SIZE: int = 4096
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "data/embeddings/embedding_cache.sqlite3"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 200_000
+    VECTOR_INDEX_TYPE: str = "flat"
+    VECTOR_HNSW_M: int = 32
+    VECTOR_HNSW_EF_CONSTRUCTION: int = 200
+    VECTOR_HNSW_EF_SEARCH: int = 64
+    VECTOR_IVF_NLIST: int = 4096
+    VECTOR_IVF_NPROBE: int = 16
+    VECTOR_PQ_M: int = 64
+    VECTOR_PQ_NBITS: int = 8
+    VECTOR_INDEX_MMAP: bool = False
+    VECTOR_INDEX_RELOAD_INTERVAL: float = 1.0
+    MATCH_FILTER_BY_CATEGORY: bool = False
+    MATCH_FILTER_BY_PROVIDER: bool = False
+    # Fuse BM25 lexical results with the vector results (reciprocal rank fusion)
+    MATCH_HYBRID_ENABLED: bool = True
+    MATCH_RRF_K: int = 60
+    # BM25 score a lexical candidate needs to be fused, so a single shared
+    # common term does not bring in unrelated items
+    MATCH_LEXICAL_MIN_SCORE: float = 1.0
+    LEXICAL_BM25_K1: float = 1.2
+    LEXICAL_BM25_B: float = 0.75
+    # Candidates of recently matched requirements, dropped when the catalog changes
+    MATCH_CACHE_ENABLED: bool = True
+    MATCH_CACHE_MAX_ENTRIES: int = 50_000
+    MATCH_CACHE_TTL_SECONDS: float = 3600.0
+    # Catalog uploads rewrite the whole catalog, keep one worker so they
+    # never run concurrently
+    CATALOG_JOB_WORKERS: int = 1
+    CATALOG_JOB_MAX_QUEUED: int = 10
+    CATALOG_JOB_HISTORY_SIZE: int = 100
+    # Match requests running at once on worker threads
+    MATCH_MAX_CONCURRENCY: int = 4
 
 
     model_config = SettingsConfigDict(
@@ -1 +1 @@
-ALLOWED_FILE_EXTENSIONS: set[str] = {".csv"}
\ No newline at end of file
+ALLOWED_FILE_EXTENSIONS: set[str] = {".csv", ".xlsx"}
\ No newline at end of file
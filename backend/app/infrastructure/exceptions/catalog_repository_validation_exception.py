@@ -0,0 +1,10 @@
+from app.infrastructure.exceptions.infrastructure_exception import (
+    InfrastructureException,
+)
+
+
+class CatalogRepositoryValidationException(InfrastructureException):
+    """Exception raised for validation errors in the Catalog Repository."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
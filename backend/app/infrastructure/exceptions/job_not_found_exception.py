@@ -0,0 +1,10 @@
+from app.infrastructure.exceptions.infrastructure_exception import (
+    InfrastructureException,
+)
+
+
+class JobNotFoundException(InfrastructureException):
+    """Raised when a job id is unknown or its status was already discarded."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
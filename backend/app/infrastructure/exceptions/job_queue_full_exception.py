@@ -0,0 +1,10 @@
+from app.infrastructure.exceptions.infrastructure_exception import (
+    InfrastructureException,
+)
+
+
+class JobQueueFullException(InfrastructureException):
+    """Raised when too many jobs are already waiting for a worker."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
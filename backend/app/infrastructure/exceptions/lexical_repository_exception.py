@@ -0,0 +1,10 @@
+from app.infrastructure.exceptions.infrastructure_exception import (
+    InfrastructureException,
+)
+
+
+class LexicalRepositoryException(InfrastructureException):
+    """Base exception for Lexical Repository errors."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
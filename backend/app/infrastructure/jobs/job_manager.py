@@ -0,0 +1,188 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable
+
+from app.application.dto.job_dtos import (
+    JobProgressDTO,
+    JobRatesDTO,
+    JobState,
+    JobStatusDTO,
+)
+from app.application.ports.progress_reporter import ProgressReporter
+from app.infrastructure.config import settings
+from app.infrastructure.exceptions.job_not_found_exception import JobNotFoundException
+from app.infrastructure.exceptions.job_queue_full_exception import JobQueueFullException
+
+
+class Job(ProgressReporter):
+    """
+    State of one background job. The worker thread reports progress into it
+    while request threads read it, every access goes through the job lock.
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.status: JobState = "queued"
+        self.created_at = datetime.now()
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.error: str | None = None
+
+        self._lock = threading.Lock()
+        self._parsed = 0
+        self._embedded = 0
+        self._indexed = 0
+        self._started: float | None = None
+        # Time of the last report of each stage
+        self._parsed_at: float | None = None
+        self._embedded_at: float | None = None
+        self._indexed_at: float | None = None
+
+    def rows_parsed(self, count: int) -> None:
+        with self._lock:
+            self._parsed += count
+            self._parsed_at = time.monotonic()
+
+    def rows_embedded(self, count: int) -> None:
+        with self._lock:
+            self._embedded += count
+            self._embedded_at = time.monotonic()
+
+    def rows_indexed(self, count: int) -> None:
+        with self._lock:
+            self._indexed += count
+            self._indexed_at = time.monotonic()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def start(self) -> None:
+        with self._lock:
+            self.status = "running"
+            self.started_at = datetime.now()
+            self._started = time.monotonic()
+
+    def finish(self, error: str | None = None) -> None:
+        with self._lock:
+            self.status = "failed" if error is not None else "succeeded"
+            self.error = error
+            self.finished_at = datetime.now()
+
+    def to_dto(self) -> JobStatusDTO:
+        with self._lock:
+            parsed_rate = self._rate(self._parsed, self._started, self._parsed_at)
+            embedded_rate = self._rate(
+                self._embedded, self._parsed_at or self._started, self._embedded_at
+            )
+            indexed_rate = self._rate(
+                self._indexed,
+                self._embedded_at or self._parsed_at or self._started,
+                self._indexed_at,
+            )
+
+            return JobStatusDTO(
+                job_id=self.job_id,
+                status=self.status,
+                progress=JobProgressDTO(
+                    rows_parsed=self._parsed,
+                    rows_embedded=self._embedded,
+                    rows_indexed=self._indexed,
+                ),
+                rows_per_second=JobRatesDTO(
+                    rows_parsed=parsed_rate,
+                    rows_embedded=embedded_rate,
+                    rows_indexed=indexed_rate,
+                ),
+                created_at=self.created_at,
+                started_at=self.started_at,
+                finished_at=self.finished_at,
+                error=self.error,
+            )
+
+
+    @staticmethod
+    def _rate(rows: int, since: float | None, until: float | None) -> float | None:
+        if since is None or until is None:
+            return None
+
+        elapsed = until - since
+        return rows / elapsed if elapsed > 0 else None
+
+
+class JobManager:
+    """
+    Runs tasks on a bounded thread pool and keeps their status in memory.
+
+    At most max_queued jobs wait for a worker, further submissions are
+    rejected instead of piling uploads up in memory. Only the last
+    history_size finished jobs are kept.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.CATALOG_JOB_WORKERS,
+        max_queued: int = settings.CATALOG_JOB_MAX_QUEUED,
+        history_size: int = settings.CATALOG_JOB_HISTORY_SIZE,
+    ):
+        self.max_queued = max_queued
+        self.history_size = history_size
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="catalog-job"
+        )
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+
+    def submit(self, task: Callable[[ProgressReporter], None]) -> JobStatusDTO:
+        """
+        Queues task, called with the job as its progress reporter, and
+        returns the status of the new job.
+        """
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if queued >= self.max_queued:
+                raise JobQueueFullException(
+                    f"Too many jobs waiting ({queued}), try again later."
+                )
+
+            job = Job(job_id=uuid.uuid4().hex)
+            self._jobs[job.job_id] = job
+            self._discard_finished_jobs()
+
+        self._executor.submit(self._run, job, task)
+
+        return job.to_dto()
+
+    def get(self, job_id: str) -> JobStatusDTO:
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+        if job is None:
+            raise JobNotFoundException(f"Job '{job_id}' not found.")
+
+        return job.to_dto()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: Job, task: Callable[[ProgressReporter], None]) -> None:
+        job.start()
+
+        try:
+            task(job)
+        except Exception as e:
+            job.finish(error=str(e) or type(e).__name__)
+        else:
+            job.finish()
+
+    def _discard_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+
+        # Oldest first, the dict keeps submission order
+        for job_id in finished[: max(0, len(finished) - self.history_size)]:
+            del self._jobs[job_id]
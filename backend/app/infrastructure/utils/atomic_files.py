@@ -0,0 +1,48 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+
+def fsync_file(path: Path) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def fsync_directory(path: Path) -> None:
+    # Makes a rename or a new file in the directory durable
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "w", **kwargs: Any) -> Iterator[IO]:
+    """
+    Opens a temporary file next to path and, once the block completes,
+    flushes it to disk and renames it over path. Readers see either the old
+    or the new file, never a partial one; if the block raises, path is left
+    untouched.
+    """
+    # Unique per call, concurrent writers of one path never share a file
+    descriptor, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    tmp_path = Path(tmp_name)
+
+    try:
+        with open(descriptor, mode, **kwargs) as f:
+            # mkstemp creates the file owner-only, keep the mode of the replaced one
+            os.fchmod(f.fileno(), path.stat().st_mode & 0o777 if path.exists() else 0o644)
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+        fsync_directory(path.parent)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
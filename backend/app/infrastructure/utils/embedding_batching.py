@@ -0,0 +1,36 @@
+from typing import Iterator
+
+# OpenAI tokenizers average roughly 4 characters per token for latin text.
+_CHARS_PER_TOKEN: int = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def build_embedding_batches(
+    texts: list[str], max_items: int, max_tokens: int
+) -> Iterator[list[str]]:
+    """
+    Splits texts into contiguous batches that respect both the item count and
+    the estimated token budget of a single embedding request.
+    A text that exceeds the token budget on its own is sent alone.
+    """
+    batch: list[str] = []
+    batch_tokens = 0
+
+    for text in texts:
+        tokens = estimate_tokens(text)
+
+        if batch and (
+            len(batch) >= max_items or batch_tokens + tokens > max_tokens
+        ):
+            yield batch
+            batch = []
+            batch_tokens = 0
+
+        batch.append(text)
+        batch_tokens += tokens
+
+    if batch:
+        yield batch
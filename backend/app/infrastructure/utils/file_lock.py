@@ -0,0 +1,43 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def interprocess_lock(path: Path) -> Iterator[None]:
+    """
+    Holds an exclusive lock on path, created if missing, for the duration of
+    the block. It serializes writers living in different processes; threads
+    of one process must still share their own lock, as a second lock taken
+    by the same process on the same file blocks.
+    """
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        else:
+            # Blocks, retrying every second, until the first byte is locked
+            while True:
+                try:
+                    msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+        try:
+            yield
+        finally:
+            if fcntl is None:
+                os.lseek(descriptor, 0, os.SEEK_SET)
+                msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+    finally:
+        # Closing the descriptor releases a flock
+        os.close(descriptor)
@@ -0,0 +1,105 @@
+import asyncio
+import re
+import time
+from typing import Mapping
+
+# Durations as sent in rate limit headers, e.g. "20ms", "1s", "6m0s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS: dict[str, float] = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: str | None) -> float | None:
+    if not value:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+class _Bucket:
+    """Token bucket refilled continuously up to one minute of budget."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        missing = amount - self.available
+        return missing / self.rate if missing > 0 else 0.0
+
+    def sync(self, remaining: float) -> None:
+        # Trust the provider when it has less budget left than we think
+        self.available = min(self.available, remaining)
+
+
+class AsyncRateLimiter:
+    """
+    Limits requests per minute and tokens per minute of an API. acquire waits
+    until both budgets allow one more request of the given size. Callers are
+    served in arrival order, so a large request is not starved by small ones.
+
+    The local budgets are corrected with the provider rate limit headers
+    (update_from_headers), and pause holds every caller back after a 429.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._requests = _Bucket(requests_per_minute)
+        self._tokens = _Bucket(tokens_per_minute)
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        now = time.monotonic()
+
+        for bucket, kind in ((self._requests, "requests"), (self._tokens, "tokens")):
+            try:
+                remaining = float(headers[f"x-ratelimit-remaining-{kind}"])
+            except (KeyError, ValueError):
+                continue
+
+            bucket.refill(now)
+            bucket.sync(remaining)
+
+            # Budget exhausted on the provider side: wait for its window reset
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if remaining <= 0 and reset:
+                self.pause(reset)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, tokens: int) -> None:
+        # A request larger than the whole budget waits for a full bucket
+        tokens = min(float(tokens), self._tokens.capacity)
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._requests.refill(now)
+                self._tokens.refill(now)
+
+                delay = max(
+                    self._paused_until - now,
+                    self._requests.wait_time(1.0),
+                    self._tokens.wait_time(tokens),
+                )
+                if delay <= 0:
+                    break
+
+                await asyncio.sleep(delay)
+
+            self._requests.available -= 1.0
+            self._tokens.available -= tokens
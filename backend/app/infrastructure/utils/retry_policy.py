@@ -0,0 +1,24 @@
+import random
+from dataclasses import dataclass
+
+from app.infrastructure.config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the n-th retry waits a random time
+    between 0 and min(max_delay, base_delay * 2 ** n), unless the provider
+    asked for a longer wait.
+    """
+
+    max_retries: int = settings.EMBEDDING_MAX_RETRIES
+    base_delay: float = settings.EMBEDDING_RETRY_BASE_DELAY
+    max_delay: float = settings.EMBEDDING_RETRY_MAX_DELAY
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+        if retry_after is not None:
+            return max(backoff, min(retry_after, self.max_delay))
+        return backoff
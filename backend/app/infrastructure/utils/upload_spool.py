@@ -0,0 +1,29 @@
+import os
+import tempfile
+from pathlib import Path
+
+from fastapi import UploadFile
+
+# Bytes copied per read, the upload is never held whole in memory
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+async def spool_upload(file: UploadFile) -> Path:
+    """
+    Copies an upload into a temporary file that outlives the request, for
+    work that runs after the response (the upload itself is closed then).
+    The caller owns the returned file and removes it.
+    """
+    descriptor, name = tempfile.mkstemp(
+        prefix="upload-", suffix=Path(file.filename or "").suffix.lower()
+    )
+
+    try:
+        with os.fdopen(descriptor, "wb") as spool:
+            while chunk := await file.read(_COPY_CHUNK_SIZE):
+                spool.write(chunk)
+    except BaseException:
+        os.unlink(name)
+        raise
+
+    return Path(name)
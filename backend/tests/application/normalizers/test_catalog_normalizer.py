@@ -109,4 +109,51 @@ def test_normalize_unknown_field():
             "description": "desc",
             "active": True,
             "campo_invalido": "valor"
-        }])
\ No newline at end of file
+        }])
+
+def _tabular_rows(count: int) -> list[dict]:
+    names = [" Tornillo ", "CAÑERÍÁ", "Ｔｕｅｒｃａ", "", "  ", "ǅemal", "İstanbul", "ﬁltro"]
+    return [
+        {
+            " Item_ID ": f" ITEM-{i:03d} ",
+            "Name": names[i % len(names)],
+            "Category": " Ferretería " if i % 2 else "Eléctrico",
+            "Description": f"Descripción ñ {i % 3}",
+            "Attributes": {"Medida": " M6 "},
+            "Active": i % 2 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def test_normalize_columns_should_match_row_by_row_output():
+    normalizer = CatalogNormalizer()
+    rows = _tabular_rows(40)
+
+    columnar = normalizer.normalize(rows, start=10)
+    row_by_row = normalizer._normalize_rows(rows, start=10)
+
+    assert columnar == row_by_row
+    assert [list(item) for item in columnar] == [list(item) for item in row_by_row]
+
+
+def test_normalize_columns_should_raise_like_row_by_row():
+    normalizer = CatalogNormalizer()
+    unknown = [{**row, "Color": "rojo"} for row in _tabular_rows(3)]
+    missing = [{k: v for k, v in row.items() if k != "Name"} for row in _tabular_rows(3)]
+
+    for rows in (unknown, missing):
+        with pytest.raises(CatalogNormalizationException) as columnar:
+            normalizer.normalize(rows, start=5)
+        with pytest.raises(CatalogNormalizationException) as row_by_row:
+            normalizer._normalize_rows(rows, start=5)
+
+        assert str(columnar.value) == str(row_by_row.value)
+
+
+def test_normalize_mixed_headers_should_fall_back_to_rows():
+    normalizer = CatalogNormalizer()
+    rows = _tabular_rows(2)
+    del rows[1]["Attributes"]
+
+    assert normalizer.normalize(rows) == normalizer._normalize_rows(rows)
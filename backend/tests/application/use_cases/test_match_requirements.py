@@ -3,6 +3,14 @@ from unittest.mock import Mock, patch
 
 from app.application.use_cases.match_requirements import MatchRequirements
 from app.application.exceptions.empty_requirement_file_exception import EmptyRequirementFileException
+from app.application.utils.catalog_helpers import convert_to_catalog_items
+from app.infrastructure.adapters.outbound.match_cache.match_cache_memory import InMemoryMatchCache
+
+
+def _serve_catalog(catalog_repository, catalog_items):
+    catalog_repository.get_items_by_id.side_effect = lambda item_ids: {
+        item.item_id: item for item in catalog_items if item.item_id in item_ids
+    }
 
 
 def test_execute_single_requirement_with_matches():
@@ -21,10 +29,10 @@ def test_execute_single_requirement_with_matches():
         "description": "work laptop"
     }]
 
-    file_reader.read_requirements.return_value = raw_requirements
+    file_reader.iter_requirements.return_value = raw_requirements
     normalizer.normalize.return_value = normalized_requirements
 
-    catalog_repository.get.return_value = [{
+    _serve_catalog(catalog_repository, convert_to_catalog_items([{
         "item_id": "item-1",
         "name": "Laptop Dell",
         "category": "electronics",
@@ -33,10 +41,10 @@ def test_execute_single_requirement_with_matches():
         "provider": "dell",
         "active": True,
         "attributes": {"ram": "16gb"}
-    }]
+    }]))
 
-    embedding_service.get_embedding.return_value = [0.1, 0.2, 0.3]
-    vector_repository.search.return_value = [("item-1", 0.05)]
+    embedding_service.get_embeddings.return_value = [[0.1, 0.2, 0.3]]
+    vector_repository.search_batch.return_value = [[("item-1", 0.05)]]
 
     with patch('app.application.use_cases.match_requirements.settings') as mock_settings:
         mock_settings.MAX_DISTANCE = 0.5
@@ -66,6 +74,10 @@ def test_execute_single_requirement_with_matches():
     assert match.category == "electronics"
     assert match.score == 0.05
 
+    # Only the candidates are looked up, the catalog is not loaded
+    catalog_repository.get_items_by_id.assert_called_once_with(["item-1"])
+    catalog_repository.get_catalog_items.assert_not_called()
+
 
 def test_execute_multiple_requirements():
     # Arrange
@@ -75,15 +87,15 @@ def test_execute_multiple_requirements():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = [{}, {}]
+    file_reader.iter_requirements.return_value = [{}, {}]
     normalizer.normalize.return_value = [
         {"name": "item1", "quantity": "1", "unit": "u"},
         {"name": "item2", "quantity": "2", "unit": "u"},
     ]
 
-    catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1]
-    vector_repository.search.return_value = []
+    _serve_catalog(catalog_repository, [])
+    embedding_service.get_embeddings.return_value = [[0.1], [0.2]]
+    vector_repository.search_batch.return_value = [[], []]
 
     use_case = MatchRequirements(
         file_reader,
@@ -98,6 +110,7 @@ def test_execute_multiple_requirements():
 
     # Assert
     assert len(result.results) == 2
+    embedding_service.get_embeddings.assert_called_once()
 
 
 def test_execute_calls_embedding_with_composed_text():
@@ -108,7 +121,7 @@ def test_execute_calls_embedding_with_composed_text():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = [{}]
+    file_reader.iter_requirements.return_value = [{}]
     normalizer.normalize.return_value = [{
         "name": "hammer",
         "quantity": "2",
@@ -116,9 +129,9 @@ def test_execute_calls_embedding_with_composed_text():
         "attributes": {"material": "steel"}
     }]
 
-    catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1]
-    vector_repository.search.return_value = []
+    _serve_catalog(catalog_repository, [])
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[]]
 
     use_case = MatchRequirements(
         file_reader,
@@ -132,8 +145,8 @@ def test_execute_calls_embedding_with_composed_text():
     use_case.execute(b"content")
 
     # Assert
-    embedding_service.get_embedding.assert_called_once()
-    called_text = embedding_service.get_embedding.call_args[0][0]
+    embedding_service.get_embeddings.assert_called_once()
+    called_text = embedding_service.get_embeddings.call_args[0][0][0]
     assert "name: hammer" in called_text
     assert "attributes: material:steel" in called_text
 
@@ -146,7 +159,7 @@ def test_execute_empty_file_raises_exception():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = []
+    file_reader.iter_requirements.return_value = []
 
     use_case = MatchRequirements(
         file_reader,
@@ -169,16 +182,16 @@ def test_execute_no_vector_matches_returns_empty():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = [{}]
+    file_reader.iter_requirements.return_value = [{}]
     normalizer.normalize.return_value = [{
         "name": "chair",
         "quantity": "1",
         "unit": "unit"
     }]
 
-    catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1]
-    vector_repository.search.return_value = []
+    _serve_catalog(catalog_repository, [])
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[]]
 
     use_case = MatchRequirements(
         file_reader,
@@ -195,7 +208,7 @@ def test_execute_no_vector_matches_returns_empty():
     assert result.results[0].matches == []
 
 
-def test_execute_calls_vector_repository_with_embedding_and_top_k():
+def test_execute_searches_all_requirements_in_one_batch_call():
     # Arrange
     file_reader = Mock()
     normalizer = Mock()
@@ -203,18 +216,18 @@ def test_execute_calls_vector_repository_with_embedding_and_top_k():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = [{}]
+    file_reader.iter_requirements.return_value = [{}]
     normalizer.normalize.return_value = [{
         "name": "monitor",
         "quantity": "1",
         "unit": "unit"
     }]
 
-    catalog_repository.get.return_value = []
+    _serve_catalog(catalog_repository, [])
 
     fake_embedding = [0.9, 0.8, 0.7]
-    embedding_service.get_embedding.return_value = fake_embedding
-    vector_repository.search.return_value = []
+    embedding_service.get_embeddings.return_value = [fake_embedding]
+    vector_repository.search_batch.return_value = [[]]
 
     use_case = MatchRequirements(
         file_reader=file_reader,
@@ -229,11 +242,56 @@ def test_execute_calls_vector_repository_with_embedding_and_top_k():
     use_case.execute(b"content")
 
     # Assert
-    vector_repository.search.assert_called_once_with(
-        query_embedding=fake_embedding,
+    vector_repository.search_batch.assert_called_once_with(
+        query_embeddings=[fake_embedding],
+        top_k=5,
+        filters=[{}],
+    )
+
+
+def test_execute_passes_requirement_filters_when_enabled():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{
+        "name": "monitor",
+        "quantity": "1",
+        "unit": "unit",
+        "category": "pantallas",
+        "provider": "acme",
+    }]
+
+    _serve_catalog(catalog_repository, [])
+    embedding_service.get_embeddings.return_value = [[0.9]]
+    vector_repository.search_batch.return_value = [[]]
+
+    use_case = MatchRequirements(
+        file_reader=file_reader,
+        normalizer=normalizer,
+        catalog_repository=catalog_repository,
+        embedding_service=embedding_service,
+        vector_repository=vector_repository,
         top_k=5
     )
 
+    # Act
+    with patch('app.application.use_cases.match_requirements.settings') as mock_settings:
+        mock_settings.MATCH_FILTER_BY_CATEGORY = True
+        mock_settings.MATCH_FILTER_BY_PROVIDER = False
+        use_case.execute(b"content")
+
+    # Assert
+    vector_repository.search_batch.assert_called_once_with(
+        query_embeddings=[[0.9]],
+        top_k=5,
+        filters=[{"category": "pantallas"}],
+    )
+
 
 def test_execute_filters_by_max_distance():
     # Arrange
@@ -243,10 +301,10 @@ def test_execute_filters_by_max_distance():
     embedding_service = Mock()
     vector_repository = Mock()
 
-    file_reader.read_requirements.return_value = [{}]
+    file_reader.iter_requirements.return_value = [{}]
     normalizer.normalize.return_value = [{"name": "item", "unit": "u"}]
 
-    catalog_repository.get.return_value = [
+    _serve_catalog(catalog_repository, convert_to_catalog_items([
         {
             "item_id": "1",
             "name": "a",
@@ -261,10 +319,10 @@ def test_execute_filters_by_max_distance():
             "description": "desc2",
             "active": True
         }
-    ]
+    ]))
 
-    embedding_service.get_embedding.return_value = [0.1]
-    vector_repository.search.return_value = [("1", 0.05), ("2", 0.9)]
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[("1", 0.05), ("2", 0.9)]]
 
     with patch('app.application.use_cases.match_requirements.settings') as mock_settings:
         mock_settings.MAX_DISTANCE = 0.5
@@ -279,4 +337,253 @@ def test_execute_filters_by_max_distance():
 
     # Assert
     assert len(result.results[0].matches) == 1
-    assert result.results[0].matches[0].catalog_item_id == "1"
\ No newline at end of file
+    assert result.results[0].matches[0].catalog_item_id == "1"
+
+def test_execute_skips_candidates_missing_from_catalog():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "item", "unit": "u"}]
+
+    _serve_catalog(catalog_repository, convert_to_catalog_items([
+        {
+            "item_id": "1",
+            "name": "a",
+            "category": "c",
+            "description": "desc1",
+            "active": True
+        }
+    ]))
+
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    # "2" belongs to an index generation newer than the catalog that was read
+    vector_repository.search_batch.return_value = [[("2", 0.01), ("1", 0.05)]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository
+    )
+
+    # Act
+    result = use_case.execute(b"content")
+
+    # Assert
+    assert [match.catalog_item_id for match in result.results[0].matches] == ["1"]
+
+
+def _hybrid_catalog():
+    return convert_to_catalog_items([
+        {"item_id": item_id, "name": item_id, "category": "c", "description": "d", "active": True}
+        for item_id in ("1", "2", "3")
+    ])
+
+
+def test_execute_exact_identifier_should_skip_embedding():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+    lexical_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "bolt ab12c3", "unit": "u"}]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    catalog_repository.get_version.return_value = "1"
+    lexical_repository.get_catalog_version.return_value = "1"
+    lexical_repository.find_exact.return_value = [["2"]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository, lexical_repository=lexical_repository
+    )
+
+    # Act
+    result = use_case.execute(b"content")
+
+    # Assert
+    lexical_repository.find_exact.assert_called_once_with(["bolt ab12c3 u"], top_k=5, filters=[{}])
+    embedding_service.get_embeddings.assert_not_called()
+    vector_repository.search_batch.assert_not_called()
+    assert [(m.catalog_item_id, m.score) for m in result.results[0].matches] == [("2", 0.0)]
+    assert result.results[0].matches[0].match_type == "exact"
+
+
+def test_execute_hybrid_should_fuse_vector_and_lexical_rankings():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+    lexical_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "steel bolt", "unit": "u"}]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    catalog_repository.get_version.return_value = "1"
+    lexical_repository.get_catalog_version.return_value = "1"
+    lexical_repository.find_exact.return_value = [[]]
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[("1", 0.1), ("2", 0.2)]]
+    lexical_repository.search_batch.return_value = [[("2", 7.5), ("3", 1.0)]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository, lexical_repository=lexical_repository
+    )
+
+    # Act
+    result = use_case.execute(b"content")
+
+    # Assert
+    matches = result.results[0].matches
+    # "2" is ranked by both retrievers, so it comes first
+    assert [m.catalog_item_id for m in matches] == ["2", "1", "3"]
+    assert all(0.0 <= m.score < 1.0 for m in matches)
+    assert {m.match_type for m in matches} == {"hybrid"}
+
+
+def test_execute_hybrid_should_drop_weak_lexical_candidates():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+    lexical_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "steel bolt", "unit": "u"}]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    catalog_repository.get_version.return_value = "1"
+    lexical_repository.get_catalog_version.return_value = "1"
+    lexical_repository.find_exact.return_value = [[]]
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[("1", 0.1), ("2", 0.9)]]
+    lexical_repository.search_batch.return_value = [[("3", 2.5), ("2", 0.3)]]
+
+    with patch('app.application.use_cases.match_requirements.settings') as mock_settings:
+        mock_settings.MAX_DISTANCE = 0.5
+        mock_settings.MATCH_LEXICAL_MIN_SCORE = 1.0
+        mock_settings.MATCH_RRF_K = 60
+
+        use_case = MatchRequirements(
+            file_reader, normalizer, catalog_repository,
+            embedding_service, vector_repository, lexical_repository=lexical_repository
+        )
+
+        # Act
+        result = use_case.execute(b"content")
+
+    # Assert: "2" is too far for the vectors and too weak for BM25
+    assert sorted(m.catalog_item_id for m in result.results[0].matches) == ["1", "3"]
+
+
+def test_execute_lexical_index_behind_catalog_should_match_on_vectors_only():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+    lexical_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "steel bolt", "unit": "u"}]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    catalog_repository.get_version.return_value = "2"
+    lexical_repository.get_catalog_version.return_value = "1"
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[("1", 0.1)]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository, lexical_repository=lexical_repository
+    )
+
+    # Act
+    result = use_case.execute(b"content")
+
+    # Assert
+    lexical_repository.find_exact.assert_not_called()
+    lexical_repository.search_batch.assert_not_called()
+    assert [(m.catalog_item_id, m.score) for m in result.results[0].matches] == [("1", 0.1)]
+    assert result.results[0].matches[0].match_type == "vector"
+
+
+def test_execute_repeated_requirements_should_be_served_from_match_cache():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+    match_cache = InMemoryMatchCache(max_entries=10, ttl_seconds=60)
+
+    file_reader.iter_requirements.return_value = [{}]
+    normalizer.normalize.return_value = [{"name": "steel bolt", "unit": "u"}]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    catalog_repository.get_version.return_value = "1"
+    vector_repository.get_catalog_version.return_value = "1"
+    embedding_service.get_embeddings.return_value = [[0.1]]
+    vector_repository.search_batch.return_value = [[("1", 0.1)]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository, match_cache=match_cache
+    )
+
+    # Act
+    first = use_case.execute(b"content")
+    second = use_case.execute(b"content")
+
+    # Assert
+    assert first == second
+    embedding_service.get_embeddings.assert_called_once()
+    vector_repository.search_batch.assert_called_once()
+    assert match_cache.get_stats().hits == 1
+
+    # A new catalog version invalidates the cached candidates
+    catalog_repository.get_version.return_value = "2"
+    use_case.execute(b"content")
+    assert embedding_service.get_embeddings.call_count == 2
+
+
+def test_execute_duplicated_requirements_should_be_embedded_and_searched_once():
+    # Arrange
+    file_reader = Mock()
+    normalizer = Mock()
+    catalog_repository = Mock()
+    embedding_service = Mock()
+    vector_repository = Mock()
+
+    file_reader.iter_requirements.return_value = [{}, {}, {}]
+    normalizer.normalize.return_value = [
+        {"name": "steel bolt", "unit": "u", "quantity": "10"},
+        {"name": "cable", "unit": "m", "quantity": "5"},
+        {"name": "steel bolt", "unit": "u", "quantity": "20", "priority": "high"},
+    ]
+    _serve_catalog(catalog_repository, _hybrid_catalog())
+    embedding_service.get_embeddings.return_value = [[0.1], [0.2]]
+    vector_repository.search_batch.return_value = [[("1", 0.1)], [("2", 0.2)]]
+
+    use_case = MatchRequirements(
+        file_reader, normalizer, catalog_repository,
+        embedding_service, vector_repository
+    )
+
+    # Act
+    result = use_case.execute(b"content")
+
+    # Assert
+    assert len(embedding_service.get_embeddings.call_args.args[0]) == 2
+    assert len(vector_repository.search_batch.call_args.kwargs["query_embeddings"]) == 2
+    assert [entry.requirement["quantity"] for entry in result.results] == ["10", "5", "20"]
+    assert [entry.matches[0].catalog_item_id for entry in result.results] == ["1", "2", "1"]
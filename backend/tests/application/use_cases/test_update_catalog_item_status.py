@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+import pytest
+
+from app.application.use_cases.update_catalog_item_status import UpdateCatalogItemStatus
+from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
+
+
+# HAppy path
+def test_update_catalog_item_deactivate_happy_path():
+    # Arrange
+    repo = Mock()
+    repo.get_version.return_value = "2"
+    vector_repo = Mock()
+    use_case = UpdateCatalogItemStatus(catalog_repository=repo, vector_repository=vector_repo)
+
+    # Act
+    use_case.execute("ITEM-001", active=False)
+
+    # Assert
+    repo.update_item.assert_called_once_with(item_id="ITEM-001", fields={"active": False})
+    vector_repo.set_active.assert_called_once_with(
+        item_ids=["ITEM-001"], active=False, catalog_version="2"
+    )
+
+
+def test_update_catalog_item_activate_happy_path():
+    # Arrange
+    repo = Mock()
+    repo.get_version.return_value = "2"
+    vector_repo = Mock()
+    use_case = UpdateCatalogItemStatus(catalog_repository=repo, vector_repository=vector_repo)
+
+    # Act
+    use_case.execute("ITEM-001", active=True)
+
+    # Assert
+    repo.update_item.assert_called_once_with(item_id="ITEM-001", fields={"active": True})
+    vector_repo.set_active.assert_called_once_with(
+        item_ids=["ITEM-001"], active=True, catalog_version="2"
+    )
+
+
+# error path
+def test_update_catalog_item_not_found():
+    # Arrange
+    repo = Mock()
+    repo.update_item.side_effect = ItemNotFoundException()
+    vector_repo = Mock()
+
+    use_case = UpdateCatalogItemStatus(catalog_repository=repo, vector_repository=vector_repo)
+
+    # Act & Assert
+    with pytest.raises(ItemNotFoundException):
+        use_case.execute("ITEM-404", active=False)
+
+    vector_repo.set_active.assert_not_called()
+
+
+def test_update_catalog_item_does_not_load_or_save_whole_catalog():
+    # Arrange
+    repo = Mock()
+    vector_repo = Mock()
+    use_case = UpdateCatalogItemStatus(catalog_repository=repo, vector_repository=vector_repo)
+
+    # Act
+    use_case.execute("ITEM-001", active=False)
+
+    # Assert
+    repo.get.assert_not_called()
+    repo.get_catalog_items.assert_not_called()
+    repo.save.assert_not_called()
+    vector_repo.upsert.assert_not_called()
+
+
+def test_update_catalog_item_should_update_lexical_index():
+    # Arrange
+    repo = Mock()
+    repo.get_version.return_value = "3"
+    lexical_repo = Mock()
+    use_case = UpdateCatalogItemStatus(
+        catalog_repository=repo, vector_repository=Mock(), lexical_repository=lexical_repo
+    )
+
+    # Act
+    use_case.execute("ITEM-001", active=False)
+
+    # Assert
+    lexical_repo.set_active.assert_called_once_with(
+        item_ids=["ITEM-001"], active=False, catalog_version="3"
+    )
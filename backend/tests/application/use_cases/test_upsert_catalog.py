@@ -1,10 +1,22 @@
+from array import array
+from io import BytesIO
 from unittest.mock import Mock
 import pytest
 
+from app.application.normalizers.catalog_normalizer import CatalogNormalizer
+from app.application.use_cases.update_catalog_item_status import UpdateCatalogItemStatus
 from app.application.use_cases.upsert_catalog import UpsertCatalog
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_csv import CatalogRepositoryCSV
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_hashing import HashingEmbeddingService
+from app.infrastructure.adapters.outbound.files.file_reader_csv import FileReaderCSV
+from app.infrastructure.adapters.outbound.lexical_store.lexical_repository_bm25 import LexicalRepositoryBM25
+from app.infrastructure.adapters.outbound.vector_store.vector_repository_faiss import VectorRepositoryFAISS
 from app.application.exceptions.empty_catalog_file_exception import EmptyCatalogFileException
 from app.application.exceptions.catalog_normalization_exception import CatalogNormalizationException
-from app.application.constants import BATCH_SIZE
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
+from app.application.constants import BATCH_SIZE, CATALOG_SAVE_ATTEMPTS, READ_CHUNK_SIZE
 
 
 @pytest.fixture
@@ -19,12 +31,17 @@ def normalizer():
 
 @pytest.fixture
 def catalog_repository():
-    return Mock()
+    catalog_repository = Mock()
+    catalog_repository.get_version.return_value = "1"
+    return catalog_repository
 
 
 @pytest.fixture
 def vector_repository():
-    return Mock()
+    vector_repository = Mock()
+    # Index committed with the current catalog version
+    vector_repository.get_catalog_version.return_value = "1"
+    return vector_repository
 
 
 @pytest.fixture
@@ -77,17 +94,17 @@ def test_execute_valid_catalog_should_append_and_persist(
         }
     ]
 
-    file_reader.read_catalog.return_value = raw_items
+    file_reader.iter_catalog.return_value = raw_items
     normalizer.normalize.return_value = normalized_items
     catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1, 0.2, 0.3]
+    embedding_service.get_embeddings.return_value = [[0.1, 0.2, 0.3]]
 
     # Act
     use_case.execute(b"file content")
 
     # Assert — lectura y normalización
-    file_reader.read_catalog.assert_called_once_with(b"file content")
-    normalizer.normalize.assert_called_once_with(raw_items)
+    file_reader.iter_catalog.assert_called_once_with(b"file content")
+    normalizer.normalize.assert_called_once_with(raw_items, start=0)
 
     # Assert — persistencia de catálogo
     catalog_repository.get.assert_called_once()
@@ -98,12 +115,96 @@ def test_execute_valid_catalog_should_append_and_persist(
     assert saved_items[0]["item_id"] == "a1"
 
     # Assert — embeddings
-    embedding_service.get_embedding.assert_called_once()
-    vector_repository.save.assert_called_once()
+    embedding_service.get_embeddings.assert_called_once()
+    vector_repository.upsert.assert_called_once()
 
-    vector_items = vector_repository.save.call_args.args[0]
+    vector_items = vector_repository.upsert.call_args.args[0]
     assert vector_items[0]["item_id"] == "a1"
-    assert vector_items[0]["embedding"] == [0.1, 0.2, 0.3]
+    assert vector_items[0]["embedding"] == array("f", [0.1, 0.2, 0.3])
+
+
+def test_execute_should_save_over_the_version_it_merged_from(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+):
+    # Arrange
+    file_reader.iter_catalog.return_value = [{"item_id": "b1"}]
+    normalizer.normalize.return_value = [
+        {"item_id": "b1", "name": "mouse", "category": "hardware", "description": "usb"}
+    ]
+    catalog_repository.get.return_value = []
+    embedding_service.get_embeddings.return_value = [[0.1, 0.2, 0.3]]
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    assert catalog_repository.save.call_args.kwargs == {"expected_version": "1"}
+
+
+def test_execute_on_version_conflict_should_keep_concurrent_status_and_retry(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+):
+    # Arrange: a1 is deactivated while the upload of b1 is being merged
+    persisted = {"item_id": "a1", "name": "laptop", "category": "hardware", "description": "portable"}
+    file_reader.iter_catalog.return_value = [{"item_id": "b1"}]
+    normalizer.normalize.return_value = [
+        {"item_id": "b1", "name": "mouse", "category": "hardware", "description": "usb"}
+    ]
+    catalog_repository.get.side_effect = [
+        [{**persisted, "active": True}],
+        [{**persisted, "active": False}],
+    ]
+    # The version moves on with every save attempt
+    catalog_repository.get_version.side_effect = lambda: str(
+        catalog_repository.save.call_count + 1
+    )
+    catalog_repository.save.side_effect = [
+        CatalogVersionConflictException("The catalog was modified since it was read."),
+        None,
+    ]
+    embedding_service.get_embeddings.return_value = [[0.1, 0.2, 0.3]]
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    assert catalog_repository.save.call_count == 2
+    retried = catalog_repository.save.call_args
+    assert retried.kwargs == {"expected_version": "2"}
+    saved = {item["item_id"]: item for item in retried.args[0]}
+    assert saved["a1"]["active"] is False
+    assert saved["b1"]["active"] is True
+
+
+def test_execute_should_fail_when_the_catalog_keeps_changing(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+):
+    # Arrange
+    file_reader.iter_catalog.return_value = [{"item_id": "b1"}]
+    normalizer.normalize.return_value = [
+        {"item_id": "b1", "name": "mouse", "category": "hardware", "description": "usb"}
+    ]
+    catalog_repository.get.return_value = []
+    catalog_repository.save.side_effect = CatalogVersionConflictException(
+        "The catalog was modified since it was read."
+    )
+
+    # Act / Assert
+    with pytest.raises(CatalogVersionConflictException):
+        use_case.execute(b"content")
+
+    assert catalog_repository.save.call_count == CATALOG_SAVE_ATTEMPTS
 
 
 def test_execute_empty_file_should_fail(
@@ -111,13 +212,13 @@ def test_execute_empty_file_should_fail(
     file_reader,
 ):
     # Arrange
-    file_reader.read_catalog.return_value = []
+    file_reader.iter_catalog.return_value = []
 
     # Act / Assert
     with pytest.raises(EmptyCatalogFileException):
         use_case.execute(b"content")
 
-    file_reader.read_catalog.assert_called_once()
+    file_reader.iter_catalog.assert_called_once()
 
 
 def test_execute_normalizer_fails_should_propagate(
@@ -130,7 +231,7 @@ def test_execute_normalizer_fails_should_propagate(
         {"item_id": "1", "name": "x", "category": "y", "description": "z"}
     ]
 
-    file_reader.read_catalog.return_value = raw_items
+    file_reader.iter_catalog.return_value = raw_items
     normalizer.normalize.side_effect = CatalogNormalizationException(
         "invalid catalog"
     )
@@ -139,8 +240,74 @@ def test_execute_normalizer_fails_should_propagate(
     with pytest.raises(CatalogNormalizationException):
         use_case.execute(b"content")
 
-    file_reader.read_catalog.assert_called_once()
-    normalizer.normalize.assert_called_once_with(raw_items)
+    file_reader.iter_catalog.assert_called_once()
+    normalizer.normalize.assert_called_once_with(raw_items, start=0)
+
+
+def test_validate_empty_file_should_fail(
+    use_case,
+    file_reader,
+    catalog_repository,
+    vector_repository,
+):
+    # Arrange
+    file_reader.iter_catalog.return_value = []
+
+    # Act / Assert
+    with pytest.raises(EmptyCatalogFileException):
+        use_case.validate(b"content")
+
+    catalog_repository.save.assert_not_called()
+    vector_repository.upsert.assert_not_called()
+
+
+def test_validate_normalizer_fails_should_propagate_without_persisting(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    vector_repository,
+):
+    # Arrange
+    raw_items = [
+        {"item_id": "1", "name": "x", "category": "y", "description": "z"}
+    ]
+
+    file_reader.iter_catalog.return_value = raw_items
+    normalizer.normalize.side_effect = CatalogNormalizationException(
+        "invalid catalog"
+    )
+
+    # Act / Assert
+    with pytest.raises(CatalogNormalizationException):
+        use_case.validate(b"content")
+
+    normalizer.normalize.assert_called_once_with(raw_items, start=0)
+    catalog_repository.get_version.assert_not_called()
+    catalog_repository.save.assert_not_called()
+    vector_repository.upsert.assert_not_called()
+
+
+def test_validate_should_only_normalize_the_first_chunk(
+    use_case,
+    file_reader,
+    normalizer,
+):
+    # Arrange
+    raw_items = [
+        {"item_id": str(i), "name": "x", "category": "y", "description": "z"}
+        for i in range(READ_CHUNK_SIZE + 5)
+    ]
+
+    file_reader.iter_catalog.return_value = iter(raw_items)
+
+    # Act
+    use_case.validate(b"content")
+
+    # Assert
+    normalizer.normalize.assert_called_once_with(
+        raw_items[:READ_CHUNK_SIZE], start=0
+    )
 
 
 def test_execute_persisted_items_exist_should_merge(
@@ -180,10 +347,10 @@ def test_execute_persisted_items_exist_should_merge(
         }
     ]
 
-    file_reader.read_catalog.return_value = raw_items
+    file_reader.iter_catalog.return_value = raw_items
     normalizer.normalize.return_value = normalized_items
     catalog_repository.get.return_value = persisted_items
-    embedding_service.get_embedding.return_value = [0.1]
+    embedding_service.get_embeddings.return_value = [[0.1]]
 
     # Act
     use_case.execute(b"content")
@@ -224,10 +391,10 @@ def test_execute_items_exceed_batch_size_should_batch(
         for i in range(BATCH_SIZE + 1)
     ]
 
-    file_reader.read_catalog.return_value = raw_items
+    file_reader.iter_catalog.return_value = raw_items
     normalizer.normalize.return_value = normalized_items
     catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1]
+    embedding_service.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
 
     # Act
     use_case.execute(b"content")
@@ -265,20 +432,28 @@ def test_execute_should_generate_embeddings_for_all_items(
         }
     ]
 
-    file_reader.read_catalog.return_value = raw_items
+    file_reader.iter_catalog.return_value = raw_items
     normalizer.normalize.return_value = normalized_items
     catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.9]
+    embedding_service.get_embeddings.return_value = [[0.5]]
 
     # Act
     use_case.execute(b"content")
 
     # Assert
-    embedding_service.get_embedding.assert_called_once()
-    vector_repository.save.assert_called_once()
+    embedding_service.get_embeddings.assert_called_once()
+    vector_repository.upsert.assert_called_once()
 
-    vectors = vector_repository.save.call_args.args[0]
-    assert vectors == [{"item_id": "1", "embedding": [0.9]}]
+    vectors = vector_repository.upsert.call_args.args[0]
+    assert vectors == [
+        {
+            "item_id": "1",
+            "embedding": array("f", [0.5]),
+            "active": True,
+            "category": "cat",
+            "provider": None,
+        }
+    ]
 
 
 def test_execute_should_not_return_any_value(
@@ -289,7 +464,7 @@ def test_execute_should_not_return_any_value(
     embedding_service,
 ):
     # Arrange
-    file_reader.read_catalog.return_value = [
+    file_reader.iter_catalog.return_value = [
         {
             "item_id": "1",
             "name": "item",
@@ -310,10 +485,255 @@ def test_execute_should_not_return_any_value(
 
     normalizer.normalize.return_value = normalized_items
     catalog_repository.get.return_value = []
-    embedding_service.get_embedding.return_value = [0.1]
+    embedding_service.get_embeddings.return_value = [[0.1]]
 
     # Act
     result = use_case.execute(b"content")
 
     # Assert
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+def test_execute_should_only_embed_new_and_changed_items(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+    vector_repository,
+):
+    # Arrange
+    persisted_items = [
+        {"item_id": "same", "name": "same", "category": "cat", "description": "desc", "active": True},
+        {"item_id": "changed", "name": "old name", "category": "cat", "description": "desc", "active": True},
+    ]
+    normalized_items = [
+        {"item_id": "same", "name": "same", "category": "cat", "description": "desc", "active": True},
+        {"item_id": "changed", "name": "new name", "category": "cat", "description": "desc", "active": True},
+        {"item_id": "new", "name": "new", "category": "cat", "description": "desc", "active": True},
+    ]
+
+    file_reader.iter_catalog.return_value = normalized_items
+    normalizer.normalize.return_value = normalized_items
+    catalog_repository.get.return_value = persisted_items
+    embedding_service.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    embedded_texts = embedding_service.get_embeddings.call_args.args[0]
+    assert len(embedded_texts) == 2
+    assert "name: new name" in embedded_texts[0]
+
+    vectors = vector_repository.upsert.call_args.args[0]
+    assert [vector["item_id"] for vector in vectors] == ["changed", "new"]
+
+    saved_items = catalog_repository.save.call_args.args[0]
+    assert {item["item_id"] for item in saved_items} == {"same", "changed", "new"}
+
+
+def test_execute_unchanged_catalog_should_not_persist_nor_embed(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+    vector_repository,
+):
+    # Arrange
+    items = [
+        {"item_id": "1", "name": "item", "category": "cat", "description": "desc", "active": True}
+    ]
+
+    file_reader.iter_catalog.return_value = items
+    normalizer.normalize.return_value = items
+    catalog_repository.get.return_value = items
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    catalog_repository.save.assert_not_called()
+    embedding_service.get_embeddings.assert_not_called()
+    vector_repository.upsert.assert_not_called()
+
+
+def test_execute_index_behind_catalog_should_reindex_whole_catalog(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+    vector_repository,
+):
+    # Arrange
+    persisted_items = [
+        {"item_id": "1", "name": "item", "category": "cat", "description": "desc", "active": True},
+        {"item_id": "2", "name": "other", "category": "cat", "description": "desc", "active": True},
+    ]
+
+    file_reader.iter_catalog.return_value = persisted_items[:1]
+    normalizer.normalize.return_value = persisted_items[:1]
+    catalog_repository.get.return_value = persisted_items
+    # A previous upload saved the catalog but died before committing the index
+    vector_repository.get_catalog_version.return_value = "0"
+    embedding_service.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    catalog_repository.save.assert_not_called()
+
+    vectors = vector_repository.upsert.call_args.args[0]
+    assert [vector["item_id"] for vector in vectors] == ["1", "2"]
+    assert vector_repository.upsert.call_args.kwargs["catalog_version"] == "1"
+
+
+def test_execute_should_report_progress_per_stage(
+    use_case,
+    file_reader,
+    normalizer,
+    catalog_repository,
+    embedding_service,
+):
+    # Arrange
+    items = [
+        {"item_id": f"id_{i}", "name": f"name_{i}", "category": "cat", "description": "desc", "active": True}
+        for i in range(3)
+    ]
+    progress = Mock()
+
+    file_reader.iter_catalog.return_value = items
+    normalizer.normalize.return_value = items
+    catalog_repository.get.return_value = []
+    embedding_service.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+
+    # Act
+    use_case.execute(b"content", progress_reporter=progress)
+
+    # Assert
+    progress.rows_parsed.assert_called_once_with(3)
+    progress.rows_embedded.assert_called_once_with(3)
+    progress.rows_indexed.assert_called_once_with(3)
+
+
+def test_execute_should_update_lexical_index_with_changed_items_only(
+    file_reader,
+    normalizer,
+    catalog_repository,
+    vector_repository,
+    embedding_service,
+):
+    # Arrange
+    lexical_repository = Mock()
+    lexical_repository.get_catalog_version.return_value = "1"
+    use_case = UpsertCatalog(
+        file_reader=file_reader,
+        normalizer=normalizer,
+        catalog_repository=catalog_repository,
+        vector_repository=vector_repository,
+        embedding_service=embedding_service,
+        lexical_repository=lexical_repository,
+    )
+    persisted_items = [
+        {"item_id": "1", "name": "item", "category": "cat", "description": "desc", "active": True},
+    ]
+    new_items = [
+        {"item_id": "2", "name": "bolt", "category": "cat", "description": "m6 steel", "active": True},
+    ]
+
+    file_reader.iter_catalog.return_value = new_items
+    normalizer.normalize.return_value = new_items
+    catalog_repository.get.return_value = persisted_items
+    embedding_service.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    lexical_repository.save.assert_not_called()
+    lexical_items = lexical_repository.upsert.call_args.args[0]
+    assert [item["item_id"] for item in lexical_items] == ["2"]
+    assert lexical_items[0]["text"] == "bolt cat m6 steel"
+    assert lexical_repository.upsert.call_args.kwargs["catalog_version"] == "1"
+
+
+def test_execute_lexical_index_behind_should_rebuild_without_embedding(
+    file_reader,
+    normalizer,
+    catalog_repository,
+    vector_repository,
+    embedding_service,
+):
+    # Arrange
+    lexical_repository = Mock()
+    lexical_repository.get_catalog_version.return_value = None
+    use_case = UpsertCatalog(
+        file_reader=file_reader,
+        normalizer=normalizer,
+        catalog_repository=catalog_repository,
+        vector_repository=vector_repository,
+        embedding_service=embedding_service,
+        lexical_repository=lexical_repository,
+    )
+    items = [
+        {"item_id": "1", "name": "item", "category": "cat", "description": "desc", "active": True}
+    ]
+
+    file_reader.iter_catalog.return_value = items
+    normalizer.normalize.return_value = items
+    catalog_repository.get.return_value = items
+
+    # Act
+    use_case.execute(b"content")
+
+    # Assert
+    embedding_service.get_embeddings.assert_not_called()
+    vector_repository.upsert.assert_not_called()
+    lexical_repository.upsert.assert_not_called()
+    assert [item["item_id"] for item in lexical_repository.save.call_args.args[0]] == ["1"]
+
+
+def test_execute_should_keep_deactivated_items_inactive(tmp_path):
+    # Arrange: real adapters, deactivate a1 then upload an unrelated item
+    catalog_repository = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    vector_repository = VectorRepositoryFAISS(dimension=64, path=tmp_path / "catalog.index")
+    lexical_repository = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+    embedding_service = HashingEmbeddingService(dimension=64)
+
+    def upload(rows: str) -> None:
+        UpsertCatalog(
+            file_reader=FileReaderCSV(),
+            normalizer=CatalogNormalizer(),
+            catalog_repository=catalog_repository,
+            vector_repository=vector_repository,
+            embedding_service=embedding_service,
+            lexical_repository=lexical_repository,
+        ).execute(
+            BytesIO(
+                (
+                    "item_id,name,category,subcategory,description,unit,provider,active\n" + rows
+                ).encode("utf-8")
+            )
+        )
+
+    upload("a1,Tornillo acero M6,ferreteria,pernos,tornillo de acero,u,acme,true\n")
+    UpdateCatalogItemStatus(
+        catalog_repository=catalog_repository,
+        vector_repository=vector_repository,
+        lexical_repository=lexical_repository,
+    ).execute("a1", active=False)
+
+    # Act
+    upload("c1,Cable UTP,redes,cables,cable de red,m,acme,true\n")
+
+    # Assert
+    rows = {row["item_id"]: row for row in catalog_repository.get()}
+    assert rows["a1"]["active"] is False
+
+    position = vector_repository._snapshot.mapping.position_of("a1")
+    assert not vector_repository._snapshot.mapping.active[position]
+
+    assert lexical_repository.search_batch(["tornillo acero m6"], top_k=5) == [[]]
@@ -3,6 +3,7 @@ from datetime import datetime
 import pytest
 
 from app.domain.entities.catalog import Catalog
+from app.domain.entities.catalog_change_set import CatalogChangeSet
 from app.domain.enums.catalog_sources import CatalogSource
 from app.domain.exceptions.invalid_catalog_item_exception import (
     InvalidCatalogItemException,
@@ -115,4 +116,47 @@ def test_update_item_attributes(valid_item_dict):
     catalog = Catalog()
     catalog.add_or_update_item(**valid_item_dict)
     catalog.update_item_attributes(valid_item_dict["item_id"], {"color": "azul"})
-    assert catalog.get_item(valid_item_dict["item_id"]).attributes == {"color": "azul"}
\ No newline at end of file
+    assert catalog.get_item(valid_item_dict["item_id"]).attributes == {"color": "azul"}
+
+def test_batch_upsert_reports_inserted_updated_and_unchanged(valid_item_obj, valid_item_dict):
+    catalog = Catalog()
+    catalog.add_or_update_item(**valid_item_dict)
+    catalog.batch_upsert([valid_item_obj])
+
+    change_set = CatalogChangeSet()
+    changed_item = CatalogItem(**{**valid_item_dict, "name": "WD40 PRO"})
+    new_item = CatalogItem(**{**valid_item_dict, "item_id": "3"})
+    errors = catalog.batch_upsert([valid_item_obj, changed_item, new_item], change_set=change_set)
+
+    assert errors == {}
+    assert change_set.unchanged == [valid_item_obj.item_id]
+    assert change_set.updated == [valid_item_dict["item_id"]]
+    assert change_set.inserted == ["3"]
+    assert change_set.get_changed_ids() == [valid_item_dict["item_id"], "3"]
+    assert change_set.has_changes() is True
+
+def test_batch_upsert_without_changes_reports_nothing_changed(valid_item_obj):
+    catalog = Catalog()
+    catalog.batch_upsert([valid_item_obj])
+
+    change_set = CatalogChangeSet()
+    catalog.batch_upsert([valid_item_obj], change_set=change_set)
+
+    assert change_set.unchanged == [valid_item_obj.item_id]
+    assert change_set.has_changes() is False
+
+def test_batch_upsert_repeated_item_keeps_strongest_change(valid_item_obj):
+    catalog = Catalog()
+    change_set = CatalogChangeSet()
+    catalog.batch_upsert([valid_item_obj, valid_item_obj], change_set=change_set)
+
+    assert change_set.inserted == [valid_item_obj.item_id]
+    assert change_set.unchanged == []
+
+def test_batch_upsert_new_item_keeps_active_flag(valid_item_obj):
+    catalog = Catalog()
+    inactive = valid_item_obj.update_status(active=False)
+
+    catalog.batch_upsert([inactive])
+
+    assert catalog.get_item(inactive.item_id).active is False
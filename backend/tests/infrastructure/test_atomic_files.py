@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.utils.atomic_files import atomic_write
+
+
+def test_atomic_write_replaces_file_content(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "data.txt"
+    path.write_text("old", encoding="utf-8")
+
+    # Act
+    with atomic_write(path, "w", encoding="utf-8") as f:
+        f.write("new")
+
+    # Assert
+    assert path.read_text(encoding="utf-8") == "new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_write_failure_keeps_previous_file(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "data.txt"
+    path.write_text("old", encoding="utf-8")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with atomic_write(path, "w", encoding="utf-8") as f:
+            f.write("partial")
+            raise RuntimeError("crash")
+
+    # Assert
+    assert path.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_write_concurrent_writers_use_their_own_temp_file(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "data.txt"
+
+    # Act: the inner writer renames its file while the outer one is open
+    with atomic_write(path, "w", encoding="utf-8") as outer:
+        outer.write("outer")
+        with atomic_write(path, "w", encoding="utf-8") as inner:
+            inner.write("inner")
+        assert path.read_text(encoding="utf-8") == "inner"
+
+    # Assert
+    assert path.read_text(encoding="utf-8") == "outer"
+    assert list(tmp_path.iterdir()) == [path]
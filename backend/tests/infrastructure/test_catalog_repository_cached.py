@@ -0,0 +1,162 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_cached import (
+    CachedCatalogRepository,
+)
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_csv import CatalogRepositoryCSV
+
+
+ROWS = [
+    {
+        "item_id": "1",
+        "name": "item",
+        "category": "cat",
+        "subcategory": "sub",
+        "description": "desc",
+        "provider": "acme",
+        "attributes": {},
+        "active": True,
+    }
+]
+
+
+@pytest.fixture
+def inner_repository():
+    repository = Mock()
+    repository.get.return_value = ROWS
+    repository.get_version.return_value = "v1"
+    return repository
+
+
+def test_get_reads_inner_repository_once_while_version_is_unchanged(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+
+    # Act
+    first = repository.get()
+    second = repository.get()
+
+    # Assert
+    assert first == ROWS
+    assert second == ROWS
+    inner_repository.get.assert_called_once()
+
+
+def test_get_mutating_returned_rows_does_not_change_the_cache(inner_repository):
+    # Arrange
+    inner_repository.get.return_value = [{**ROWS[0], "attributes": {"size": "m6"}}]
+    repository = CachedCatalogRepository(inner_repository)
+
+    # Act
+    rows = repository.get()
+    rows[0]["name"] = "changed"
+    rows[0]["attributes"]["size"] = "m8"
+
+    # Assert
+    row = repository.get()[0]
+    assert row["name"] == "item"
+    assert row["attributes"] == {"size": "m6"}
+
+
+def test_get_reloads_when_version_changes(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+    repository.get()
+
+    # Act
+    inner_repository.get_version.return_value = "v2"
+    repository.get()
+
+    # Assert
+    assert inner_repository.get.call_count == 2
+
+
+def test_get_catalog_items_are_built_once_per_version(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+
+    # Act
+    first = repository.get_catalog_items()
+    second = repository.get_catalog_items()
+
+    # Assert
+    assert [item.item_id for item in first] == ["1"]
+    assert first[0] is second[0]
+
+
+def test_get_items_by_id_reuses_the_items_of_the_version(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+    items = repository.get_catalog_items()
+
+    # Act
+    found = repository.get_items_by_id(["1", "missing"])
+
+    # Assert
+    assert list(found) == ["1"]
+    assert found["1"] is items[0]
+    inner_repository.get.assert_called_once()
+
+
+def test_save_delegates_and_invalidates_cache(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+    repository.get()
+
+    # Act
+    repository.save(ROWS, expected_version="7")
+    repository.get()
+
+    # Assert
+    inner_repository.save.assert_called_once_with(ROWS, expected_version="7")
+    assert inner_repository.get.call_count == 2
+
+
+def test_list_methods_use_cached_rows(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+
+    # Act
+    categories = repository.list_catagories()
+    providers = repository.list_providers()
+    subcategories = repository.list_subcategories("cat")
+
+    # Assert
+    assert categories == ["cat"]
+    assert providers == ["acme"]
+    assert subcategories == ["sub"]
+    inner_repository.get.assert_called_once()
+
+
+def test_csv_changes_on_disk_are_picked_up(tmp_path: Path):
+    # Arrange
+    csv_repository = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    csv_repository.save(ROWS)
+    repository = CachedCatalogRepository(csv_repository)
+    repository.get()
+
+    # Act
+    CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv").save(
+        ROWS + [{**ROWS[0], "item_id": "2"}]
+    )
+    rows = repository.get()
+
+    # Assert
+    assert [row["item_id"] for row in rows] == ["1", "2"]
+
+
+def test_update_item_delegates_and_invalidates_cache(inner_repository):
+    # Arrange
+    repository = CachedCatalogRepository(inner_repository)
+    repository.get()
+
+    # Act
+    repository.update_item("1", {"active": False})
+    repository.get()
+
+    # Assert
+    inner_repository.update_item.assert_called_once_with("1", {"active": False})
+    assert inner_repository.get.call_count == 2
@@ -1,10 +1,19 @@
 import csv
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
+from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
 from app.infrastructure.adapters.outbound.catalog.catalog_repository_csv import CatalogRepositoryCSV
+from app.infrastructure.exceptions.catalog_repository_validation_exception import (
+    CatalogRepositoryValidationException,
+)
 
 
 def test_get_when_file_does_not_exist_returns_empty(tmp_path: Path):
@@ -218,4 +227,136 @@ def test_save_handles_none_attributes(tmp_path: Path):
     repo.save(catalog)
     rows = repo.get()
 
-    assert rows[0]["attributes"] == {}
\ No newline at end of file
+    assert rows[0]["attributes"] == {}
+
+def test_get_version_when_file_does_not_exist_returns_empty(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+
+    assert repo.get_version() == ""
+
+
+def test_get_version_changes_after_save(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    repo.save([])
+    version = repo.get_version()
+
+    repo.save([{"item_id": "1", "name": "item", "category": "cat", "description": "desc"}])
+
+    assert repo.get_version() != version
+
+
+def test_get_version_changes_after_same_size_save_with_same_mtime(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    repo.save([{"item_id": "1", "name": "item a", "category": "cat", "description": "desc"}])
+    mtime_ns = repo.csv_path.stat().st_mtime_ns
+    version = repo.get_version()
+
+    repo.save([{"item_id": "1", "name": "item b", "category": "cat", "description": "desc"}])
+    # As if both writes fell within the timestamp granularity
+    os.utime(repo.csv_path, ns=(mtime_ns, mtime_ns))
+
+    assert repo.get_version() != version
+
+
+def test_get_items_by_id_returns_only_known_items(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    repo.save(
+        [
+            {
+                "item_id": "1",
+                "name": "item 1",
+                "category": "cat",
+                "subcategory": "sub",
+                "description": "desc",
+                "unit": "u",
+                "provider": "p",
+            },
+            {
+                "item_id": "2",
+                "name": "item 2",
+                "category": "cat",
+                "subcategory": "sub",
+                "description": "desc",
+                "unit": "u",
+                "provider": "p",
+            },
+        ]
+    )
+
+    items = repo.get_items_by_id(["2", "missing"])
+
+    assert list(items) == ["2"]
+    assert items["2"].name == "item 2"
+
+
+def test_update_item_changes_only_the_given_row(tmp_path: Path):
+    csv_path = tmp_path / "catalog.csv"
+    repo = CatalogRepositoryCSV(csv_path=csv_path)
+    repo.save(
+        [
+            {"item_id": "1", "name": "A", "attributes": {"color": "red"}},
+            {"item_id": "2", "name": "B"},
+        ]
+    )
+
+    repo.update_item("1", {"active": False})
+
+    result = repo.get()
+    assert result[0]["active"] is False
+    assert result[0]["attributes"] == {"color": "red"}
+    assert result[1]["active"] is True
+
+
+def test_update_item_when_item_does_not_exist_raises_and_keeps_file(tmp_path: Path):
+    csv_path = tmp_path / "catalog.csv"
+    repo = CatalogRepositoryCSV(csv_path=csv_path)
+    repo.save([{"item_id": "1", "name": "A"}])
+    before = csv_path.read_text(encoding="utf-8")
+
+    with pytest.raises(ItemNotFoundException):
+        repo.update_item("404", {"active": False})
+
+    assert csv_path.read_text(encoding="utf-8") == before
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+def test_update_item_with_unknown_field_raises(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    repo.save([{"item_id": "1", "name": "A"}])
+
+    with pytest.raises(CatalogRepositoryValidationException):
+        repo.update_item("1", {"unknown": "x"})
+
+
+def test_save_with_stale_expected_version_raises_and_keeps_file(tmp_path: Path):
+    csv_path = tmp_path / "catalog.csv"
+    repo = CatalogRepositoryCSV(csv_path=csv_path)
+    repo.save([{"item_id": "1", "name": "A"}])
+    version = repo.get_version()
+    repo.update_item("1", {"active": False})
+    before = csv_path.read_text(encoding="utf-8")
+
+    with pytest.raises(CatalogVersionConflictException):
+        repo.save([{"item_id": "1", "name": "A", "active": True}], expected_version=version)
+
+    assert csv_path.read_text(encoding="utf-8") == before
+
+
+def test_save_with_current_expected_version_writes(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    repo.save([{"item_id": "1", "name": "A"}])
+
+    repo.save([{"item_id": "2", "name": "B"}], expected_version=repo.get_version())
+
+    assert [row["item_id"] for row in repo.get()] == ["2"]
+
+
+def test_concurrent_update_item_calls_keep_every_change(tmp_path: Path):
+    repo = CatalogRepositoryCSV(csv_path=tmp_path / "catalog.csv")
+    item_ids = [str(index) for index in range(30)]
+    repo.save([{"item_id": item_id, "name": item_id} for item_id in item_ids])
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda item_id: repo.update_item(item_id, {"active": False}), item_ids))
+
+    assert all(row["active"] is False for row in repo.get())
@@ -0,0 +1,158 @@
+from pathlib import Path
+
+import pytest
+
+from app.application.exceptions.catalog_version_conflict_exception import (
+    CatalogVersionConflictException,
+)
+from app.domain.exceptions.item_not_found_exception import ItemNotFoundException
+from app.infrastructure.adapters.outbound.catalog.catalog_repository_sqlite import (
+    CatalogRepositorySQLite,
+)
+from app.infrastructure.exceptions.catalog_repository_validation_exception import (
+    CatalogRepositoryValidationException,
+)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> CatalogRepositorySQLite:
+    return CatalogRepositorySQLite(db_path=tmp_path / "catalog.sqlite3")
+
+
+@pytest.fixture
+def catalog() -> list[dict]:
+    return [
+        {
+            "item_id": "1",
+            "name": "tornillo",
+            "category": "ferreteria",
+            "subcategory": "fijaciones",
+            "description": "tornillo de acero",
+            "unit": "unidad",
+            "provider": "acme",
+            "attributes": {"medida": "m6"},
+            "active": True,
+        },
+        {
+            "item_id": "2",
+            "name": "martillo",
+            "category": "herramientas",
+            "subcategory": "manuales",
+            "description": "martillo de carpintero",
+            "provider": "delta",
+            "active": False,
+        },
+    ]
+
+
+def test_get_when_database_is_empty_returns_empty(repo):
+    assert repo.get() == []
+
+
+def test_save_then_get_returns_deserialized_rows(repo, catalog):
+    repo.save(catalog)
+
+    rows = repo.get()
+
+    assert [row["item_id"] for row in rows] == ["1", "2"]
+    assert rows[0]["attributes"] == {"medida": "m6"}
+    assert rows[0]["active"] is True
+    assert rows[1]["attributes"] == {}
+    assert rows[1]["active"] is False
+    assert rows[1]["unit"] is None
+
+
+def test_save_updates_existing_rows_and_removes_missing_ones(repo, catalog):
+    repo.save(catalog)
+
+    repo.save([{**catalog[0], "name": "tornillo largo"}])
+
+    rows = repo.get()
+    assert len(rows) == 1
+    assert rows[0]["name"] == "tornillo largo"
+
+
+def test_save_should_default_active_to_true(repo):
+    repo.save([{"item_id": "1", "name": "item", "category": "cat", "description": "desc"}])
+
+    assert repo.get()[0]["active"] is True
+
+
+def test_get_version_changes_after_every_write(repo, catalog):
+    initial = repo.get_version()
+
+    repo.save(catalog)
+    after_save = repo.get_version()
+    repo.update_item("1", {"active": False})
+
+    assert len({initial, after_save, repo.get_version()}) == 3
+
+
+def test_update_item_changes_a_single_row(repo, catalog):
+    repo.save(catalog)
+
+    repo.update_item("1", {"active": False, "attributes": {"medida": "m8"}})
+
+    rows = {row["item_id"]: row for row in repo.get()}
+    assert rows["1"]["active"] is False
+    assert rows["1"]["attributes"] == {"medida": "m8"}
+    assert rows["2"]["name"] == "martillo"
+
+
+def test_update_item_not_found_raises(repo, catalog):
+    repo.save(catalog)
+
+    with pytest.raises(ItemNotFoundException):
+        repo.update_item("404", {"active": False})
+
+
+def test_update_item_unknown_field_raises(repo, catalog):
+    repo.save(catalog)
+
+    with pytest.raises(CatalogRepositoryValidationException):
+        repo.update_item("1", {"unknown": "value"})
+
+
+def test_list_methods_return_distinct_values(repo, catalog):
+    repo.save(catalog + [{**catalog[0], "item_id": "3"}])
+
+    assert sorted(repo.list_catagories()) == ["ferreteria", "herramientas"]
+    assert sorted(repo.list_providers()) == ["acme", "delta"]
+    assert sorted(repo.list_subcategories()) == ["fijaciones", "manuales"]
+    assert repo.list_subcategories("herramientas") == ["manuales"]
+
+
+def test_get_catalog_items_returns_domain_items(repo, catalog):
+    repo.save(catalog)
+
+    items = repo.get_catalog_items()
+
+    assert [item.item_id for item in items] == ["1", "2"]
+
+
+def test_get_items_by_id_returns_only_known_items(repo, catalog):
+    repo.save(catalog)
+
+    items = repo.get_items_by_id(["2", "missing", "2"])
+
+    assert list(items) == ["2"]
+    assert items["2"].item_id == "2"
+
+
+def test_save_with_stale_expected_version_raises_and_keeps_rows(repo, catalog):
+    repo.save(catalog)
+    version = repo.get_version()
+    repo.update_item("1", {"active": False})
+
+    with pytest.raises(CatalogVersionConflictException):
+        repo.save(catalog, expected_version=version)
+
+    assert repo.get()[0]["active"] is False
+
+
+def test_save_with_current_expected_version_writes(repo, catalog):
+    repo.save(catalog)
+
+    repo.save(catalog[:1], expected_version=repo.get_version())
+
+    assert [row["item_id"] for row in repo.get()] == ["1"]
@@ -0,0 +1,188 @@
+import sqlite3
+from array import array
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_cached import (
+    CachedEmbeddingService,
+)
+
+
+@pytest.fixture
+def inner_service():
+    service = Mock()
+    service.get_embeddings.side_effect = lambda texts: [
+        [float(len(text)), 0.5] for text in texts
+    ]
+    return service
+
+
+@pytest.fixture
+def cached_service(inner_service, tmp_path: Path):
+    return CachedEmbeddingService(
+        embedding_service=inner_service,
+        model="test-model",
+        path=tmp_path / "cache.sqlite3",
+    )
+
+
+def test_get_embeddings_first_call_delegates_and_counts_misses(cached_service, inner_service):
+    # Act
+    result = cached_service.get_embeddings(["abc", "de"])
+
+    # Assert
+    assert result == [[3.0, 0.5], [2.0, 0.5]]
+    inner_service.get_embeddings.assert_called_once_with(["abc", "de"])
+    assert cached_service.misses == 2
+    assert cached_service.hits == 0
+
+
+def test_get_embeddings_second_call_is_served_from_cache(cached_service, inner_service):
+    # Arrange
+    cached_service.get_embeddings(["abc", "de"])
+
+    # Act
+    result = cached_service.get_embeddings(["de", "abc"])
+
+    # Assert
+    assert result == [[2.0, 0.5], [3.0, 0.5]]
+    inner_service.get_embeddings.assert_called_once()
+    assert cached_service.hits == 2
+
+
+def test_get_embeddings_only_embeds_missing_texts(cached_service, inner_service):
+    # Arrange
+    cached_service.get_embeddings(["abc"])
+
+    # Act
+    result = cached_service.get_embeddings(["abc", "new text"])
+
+    # Assert
+    assert result == [[3.0, 0.5], [8.0, 0.5]]
+    assert inner_service.get_embeddings.call_args_list[-1].args[0] == ["new text"]
+
+
+def test_get_embeddings_duplicated_texts_are_embedded_once(cached_service, inner_service):
+    # Act
+    result = cached_service.get_embeddings(["same", "same", "same"])
+
+    # Assert
+    assert result == [[4.0, 0.5]] * 3
+    inner_service.get_embeddings.assert_called_once_with(["same"])
+
+
+def test_cache_persists_across_instances(inner_service, tmp_path: Path):
+    # Arrange
+    path = tmp_path / "cache.sqlite3"
+    CachedEmbeddingService(inner_service, model="test-model", path=path).get_embeddings(["abc"])
+
+    # Act
+    service = CachedEmbeddingService(inner_service, model="test-model", path=path)
+    service.get_embeddings(["abc"])
+
+    # Assert
+    inner_service.get_embeddings.assert_called_once()
+    assert service.hits == 1
+
+
+def test_cache_stores_float32_embeddings(cached_service):
+    # Act
+    cached_service.get_embeddings(["abc"])
+
+    # Assert
+    (blob,) = cached_service._connection.execute("SELECT embedding FROM embeddings").fetchone()
+    assert len(blob) == 2 * array("f").itemsize
+
+
+def test_cache_of_a_previous_format_is_dropped(inner_service, tmp_path: Path):
+    # Arrange
+    path = tmp_path / "cache.sqlite3"
+    CachedEmbeddingService(inner_service, model="test-model", path=path).get_embeddings(["abc"])
+    with sqlite3.connect(path) as connection:
+        connection.execute("PRAGMA user_version = 0")
+
+    # Act
+    service = CachedEmbeddingService(inner_service, model="test-model", path=path)
+    result = service.get_embeddings(["abc"])
+
+    # Assert
+    assert result == [[3.0, 0.5]]
+    assert inner_service.get_embeddings.call_count == 2
+    assert service.misses == 1
+
+
+def test_cache_key_includes_model(inner_service, tmp_path: Path):
+    # Arrange
+    path = tmp_path / "cache.sqlite3"
+    CachedEmbeddingService(inner_service, model="model-a", path=path).get_embeddings(["abc"])
+
+    # Act
+    CachedEmbeddingService(inner_service, model="model-b", path=path).get_embeddings(["abc"])
+
+    # Assert
+    assert inner_service.get_embeddings.call_count == 2
+
+
+def test_cache_evicts_least_recently_used_entries(inner_service, tmp_path: Path):
+    # Arrange
+    service = CachedEmbeddingService(
+        inner_service, model="test-model", path=tmp_path / "cache.sqlite3", max_entries=2
+    )
+    service.get_embeddings(["a"])
+    service.get_embeddings(["bb"])
+    service.get_embeddings(["a"])  # refresh "a"
+
+    # Act
+    service.get_embeddings(["ccc"])
+    inner_service.get_embeddings.reset_mock()
+    service.get_embeddings(["a", "bb"])
+
+    # Assert
+    inner_service.get_embeddings.assert_called_once_with(["bb"])
+
+
+def test_get_embedding_uses_cache(cached_service, inner_service):
+    # Arrange
+    cached_service.get_embedding("abc")
+
+    # Act
+    result = cached_service.get_embedding("abc")
+
+    # Assert
+    assert result == [3.0, 0.5]
+    inner_service.get_embeddings.assert_called_once()
+
+
+def test_get_stats_reports_hit_rate(cached_service):
+    # Arrange
+    cached_service.get_embeddings(["abc"])
+    cached_service.get_embeddings(["abc"])
+
+    # Act
+    stats = cached_service.get_stats()
+
+    # Assert
+    assert stats == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_failed_call_resumes_after_last_checkpoint(inner_service, tmp_path: Path):
+    # Arrange
+    service = CachedEmbeddingService(
+        inner_service, model="test-model", path=tmp_path / "cache.sqlite3", checkpoint_size=2
+    )
+    embed = inner_service.get_embeddings.side_effect
+    inner_service.get_embeddings.side_effect = [embed(["a", "bb"]), RuntimeError("provider down")]
+
+    with pytest.raises(RuntimeError):
+        service.get_embeddings(["a", "bb", "ccc", "dddd"])
+
+    # Act
+    inner_service.get_embeddings.side_effect = embed
+    inner_service.get_embeddings.reset_mock()
+    result = service.get_embeddings(["a", "bb", "ccc", "dddd"])
+
+    # Assert
+    inner_service.get_embeddings.assert_called_once_with(["ccc", "dddd"])
+    assert result == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5], [4.0, 0.5]]
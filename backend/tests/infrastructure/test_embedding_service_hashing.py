@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_hashing import (
+    HashingEmbeddingService,
+)
+from app.infrastructure.exceptions.embedding_service_validation_exception import (
+    EmbeddingServiceValidationException,
+)
+
+
+@pytest.fixture
+def embedding_service():
+    return HashingEmbeddingService(dimension=256, ngram_min=3, ngram_max=5)
+
+
+def test_get_embeddings_returns_normalized_vectors_of_given_dimension(embedding_service):
+    # Act
+    result = embedding_service.get_embeddings(["tornillo de acero", "martillo"])
+
+    # Assert
+    assert len(result) == 2
+    assert all(len(vector) == 256 for vector in result)
+    assert np.allclose(np.linalg.norm(result, axis=1), 1.0)
+
+
+def test_get_embeddings_is_deterministic(embedding_service):
+    first = embedding_service.get_embeddings(["Tornillo de acero"])
+    second = HashingEmbeddingService(dimension=256).get_embeddings(["Tornillo de acero"])
+
+    assert first == second
+
+
+def test_similar_texts_are_closer_than_unrelated_ones(embedding_service):
+    # Act
+    query, similar, unrelated = np.array(
+        embedding_service.get_embeddings(
+            ["tornillo acero inoxidable", "tornillos de acero", "pantalla led 24 pulgadas"]
+        )
+    )
+
+    # Assert
+    assert np.linalg.norm(query - similar) < np.linalg.norm(query - unrelated)
+
+
+def test_get_embedding_matches_batch_result(embedding_service):
+    assert embedding_service.get_embedding("cable") == embedding_service.get_embeddings(["cable"])[0]
+
+
+def test_empty_text_raises(embedding_service):
+    with pytest.raises(EmbeddingServiceValidationException):
+        embedding_service.get_embeddings(["valid", ""])
+
+
+def test_model_name_identifies_the_vector_space():
+    assert HashingEmbeddingService(dimension=64).model != HashingEmbeddingService(dimension=128).model
@@ -0,0 +1,187 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import openai
+import pytest
+
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_open_ai_async import (
+    AsyncOpenAIEmbeddingService,
+)
+from app.infrastructure.adapters.outbound.embeddings.embedding_service_sync_bridge import (
+    SyncEmbeddingServiceBridge,
+)
+from app.infrastructure.exceptions.embedding_service_exception import EmbeddingServiceException
+from app.infrastructure.exceptions.embedding_service_validation_exception import (
+    EmbeddingServiceValidationException,
+)
+from app.infrastructure.utils.rate_limiter import AsyncRateLimiter, parse_duration
+from app.infrastructure.utils.retry_policy import RetryPolicy
+
+
+class _FakeEmbeddings:
+    """
+    Answers after a short delay and records how many calls overlap. The
+    first len(failures) calls raise the given errors.
+    """
+
+    def __init__(self, failures: list[Exception] | None = None):
+        self.calls = 0
+        self.completed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures = list(failures or [])
+        self.with_raw_response = self
+
+    async def create(self, model, input):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.completed += 1
+
+        response = MagicMock()
+        # Reversed to check that entries are put back in input order
+        response.data = [
+            MagicMock(embedding=[float(ord(text[0]))], index=i)
+            for i, text in reversed(list(enumerate(input)))
+        ]
+
+        raw_response = MagicMock()
+        raw_response.headers = {"x-ratelimit-remaining-requests": "100"}
+        raw_response.parse.return_value = response
+        return raw_response
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(429, headers={"retry-after-ms": "10"}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _service(failures=None, **kwargs) -> tuple[AsyncOpenAIEmbeddingService, _FakeEmbeddings]:
+    client = MagicMock()
+    client.embeddings = _FakeEmbeddings(failures)
+    client.close = AsyncMock()
+    defaults = {
+        "model": "test-model",
+        "batch_size": 2,
+        "batch_max_tokens": 1000,
+        "max_concurrency": 2,
+        "requests_per_minute": 10_000,
+        "tokens_per_minute": 1_000_000,
+        "retry_policy": RetryPolicy(max_retries=2, base_delay=0.001, max_delay=0.05),
+    }
+    return AsyncOpenAIEmbeddingService(client=client, **{**defaults, **kwargs}), client.embeddings
+
+
+def test_get_embeddings_sends_batches_concurrently_and_keeps_order():
+    # Arrange
+    service, embeddings = _service()
+    texts = ["a", "b", "c", "d", "e", "f", "g"]
+
+    # Act
+    result = asyncio.run(service.get_embeddings(texts))
+
+    # Assert
+    assert result == [[float(ord(text))] for text in texts]
+    assert embeddings.calls == 4
+    assert embeddings.max_in_flight == 2
+
+
+def test_get_embeddings_with_empty_text_raises():
+    service, embeddings = _service()
+
+    with pytest.raises(EmbeddingServiceValidationException):
+        asyncio.run(service.get_embeddings(["valid", ""]))
+
+    assert embeddings.calls == 0
+
+
+def test_rate_limiter_waits_for_token_budget():
+    # Arrange: 600 tokens per minute refill 10 tokens per second
+    limiter = AsyncRateLimiter(requests_per_minute=1_000, tokens_per_minute=600)
+
+    async def acquire_twice():
+        await limiter.acquire(600)
+        start = time.monotonic()
+        await limiter.acquire(3)
+        return time.monotonic() - start
+
+    # Act
+    waited = asyncio.run(acquire_twice())
+
+    # Assert
+    assert waited >= 0.25
+
+
+def test_sync_bridge_serves_many_threads_through_one_loop():
+    # Arrange
+    service, embeddings = _service(max_concurrency=3)
+    bridge = SyncEmbeddingServiceBridge(service)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(bridge.get_embeddings, [["a", "b", "c"]] * 4))
+    bridge.close()
+
+    # Assert
+    assert results == [[[97.0], [98.0], [99.0]]] * 4
+    assert bridge.model == "test-model"
+    assert embeddings.max_in_flight <= 3
+
+
+def test_throttled_batch_is_retried_alone():
+    # Arrange
+    service, embeddings = _service(failures=[_rate_limit_error()], batch_size=10)
+
+    # Act
+    result = asyncio.run(service.get_embeddings(["a", "b"]))
+
+    # Assert
+    assert result == [[97.0], [98.0]]
+    assert embeddings.calls == 2
+
+
+def test_retries_stop_after_max_retries():
+    # Arrange
+    service, embeddings = _service(failures=[_rate_limit_error() for _ in range(3)])
+
+    # Act / Assert
+    with pytest.raises(EmbeddingServiceException, match="after 3 attempts"):
+        asyncio.run(service.get_embeddings(["a"]))
+
+    assert embeddings.calls == 3
+
+
+def test_failing_batch_cancels_pending_batches():
+    # Arrange
+    service, embeddings = _service(
+        failures=[openai.OpenAIError("invalid request")], batch_size=1, max_concurrency=1
+    )
+
+    async def embed_then_wait():
+        with pytest.raises(EmbeddingServiceException):
+            await service.get_embeddings(["a", "b", "c", "d"])
+        # Leaves time to any batch left running
+        await asyncio.sleep(0.1)
+
+    # Act
+    asyncio.run(embed_then_wait())
+
+    # Assert
+    assert embeddings.completed == 0
+
+
+def test_parse_duration_reads_rate_limit_header_formats():
+    assert parse_duration("1s") == 1.0
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("2.5") == 2.5
+    assert parse_duration(None) is None
@@ -0,0 +1,252 @@
+from pathlib import Path
+
+import faiss
+import numpy as np
+import pytest
+
+from app.infrastructure.adapters.outbound.vector_store.faiss_index_factory import (
+    FaissIndexConfig,
+    build_search_parameters,
+    create_index,
+    live_ids_selector,
+    needs_retraining,
+    read_index,
+    supports_removal,
+    tombstone,
+)
+from app.infrastructure.adapters.outbound.vector_store.vector_repository_faiss import (
+    VectorRepositoryFAISS,
+)
+from app.infrastructure.exceptions.vector_repository_validation_exception import (
+    VectorRepositoryValidationException,
+)
+
+DIMENSION = 16
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).random((500, DIMENSION), dtype=np.float32)
+
+
+def _config(index_type: str) -> FaissIndexConfig:
+    return FaissIndexConfig(
+        index_type=index_type,
+        hnsw_m=8,
+        hnsw_ef_construction=40,
+        hnsw_ef_search=32,
+        ivf_nlist=8,
+        ivf_nprobe=8,
+        pq_m=4,
+        pq_nbits=4,
+    )
+
+
+def test_create_index_flat_is_exact():
+    index = create_index(DIMENSION, _config("flat"))
+
+    assert isinstance(faiss.downcast_index(index.index), faiss.IndexFlatL2)
+    assert supports_removal(index)
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivf_flat", "ivf_pq"])
+def test_create_index_approximate_types_are_trained(index_type, vectors):
+    index = create_index(DIMENSION, _config(index_type), vectors)
+
+    assert index.is_trained
+    assert supports_removal(index) == (index_type != "hnsw")
+
+
+def test_create_index_reduces_nlist_for_small_catalogs(vectors):
+    index = create_index(DIMENSION, _config("ivf_flat"), vectors[:50])
+
+    assert faiss.extract_index_ivf(index).nlist == 1
+
+
+def test_create_index_unknown_type_raises():
+    with pytest.raises(VectorRepositoryValidationException):
+        create_index(DIMENSION, _config("annoy"))
+
+
+def test_create_index_pq_m_must_divide_dimension():
+    config = FaissIndexConfig(index_type="ivf_pq", pq_m=5)
+
+    with pytest.raises(VectorRepositoryValidationException):
+        config.validate(DIMENSION)
+
+
+def test_build_search_parameters_sets_nprobe_and_ef_search(vectors):
+    ivf = create_index(DIMENSION, _config("ivf_flat"), vectors)
+    hnsw = create_index(DIMENSION, _config("hnsw"))
+
+    assert build_search_parameters(ivf, _config("ivf_flat")).nprobe == 8
+    assert build_search_parameters(hnsw, _config("hnsw")).efSearch == 32
+    assert build_search_parameters(create_index(DIMENSION, _config("flat")), _config("flat")) is None
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivf_flat", "ivf_pq"])
+def test_repository_upsert_and_search_with_approximate_index(index_type, vectors, tmp_path: Path):
+    # Arrange
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config(index_type)
+    )
+    items = [{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors)]
+
+    # Act
+    repository.upsert(items)
+    results = repository.search(vectors[42].tolist(), top_k=1)
+
+    # Assert
+    assert results[0][0] == "42"
+
+
+def test_needs_retraining_once_the_catalog_outgrows_the_trained_lists(vectors):
+    index = create_index(DIMENSION, _config("ivf_flat"), vectors[:50])
+
+    assert not needs_retraining(index, _config("ivf_flat"), 60)
+    assert needs_retraining(index, _config("ivf_flat"), 80)
+    assert not needs_retraining(create_index(DIMENSION, _config("flat")), _config("flat"), 10_000)
+
+
+def test_needs_retraining_when_pq_codes_can_get_more_bits(vectors):
+    # 39 points per centroid: 100 vectors only train 1 bit codes, 156 train 2
+    index = create_index(DIMENSION, _config("ivf_pq"), vectors[:100])
+
+    assert not needs_retraining(index, _config("ivf_pq"), 155)
+    assert needs_retraining(index, _config("ivf_pq"), 156)
+
+
+# From 78 vectors on, below it even 1 bit codes lack points
+@pytest.mark.parametrize("train_size", [100, 320, 500])
+def test_create_index_pq_bits_are_trainable_without_warnings(train_size, vectors, capfd):
+    # Act
+    index = create_index(DIMENSION, _config("ivf_pq"), vectors[:train_size])
+
+    # Assert
+    nbits = faiss.downcast_index(faiss.extract_index_ivf(index)).pq.nbits
+    assert (1 << nbits) * 39 <= train_size
+    assert "WARNING" not in capfd.readouterr().err
+
+
+@pytest.mark.parametrize("index_type", ["ivf_flat", "ivf_pq"])
+def test_repository_upsert_retrains_ivf_index_when_catalog_grows(index_type, vectors, tmp_path: Path):
+    # Arrange: the first upload is too small to train more than one list
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config(index_type)
+    )
+    items = [{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors)]
+    repository.upsert(items[:40])
+    assert faiss.extract_index_ivf(repository.index).nlist == 1
+
+    # Act
+    repository.upsert(items[40:])
+
+    # Assert
+    ivf = faiss.extract_index_ivf(repository.index)
+    assert ivf.nlist == 8
+    assert repository.index.ntotal == len(vectors)
+    # PQ codes are approximate, the vector is among the nearest ones
+    for position in (3, 420):
+        results = repository.search(vectors[position].tolist(), top_k=10)
+        assert str(position) in [item_id for item_id, _ in results]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf_flat"])
+def test_repository_upsert_replaces_vector_of_existing_item(index_type, vectors, tmp_path: Path):
+    # Arrange
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config(index_type)
+    )
+    repository.upsert([{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors)])
+
+    # Act
+    repository.upsert([{"item_id": "0", "embedding": vectors[1]}])
+
+    # Assert: HNSW keeps the replaced vector as a tombstone
+    assert len(repository.index_to_item_id) == len(vectors)
+    assert "0" not in [item_id for item_id, _ in repository.search(vectors[0].tolist(), top_k=1)]
+    assert sorted(i for i, _ in repository.search(vectors[1].tolist(), top_k=2)) == ["0", "1"]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf_flat"])
+def test_repository_remove_drops_items(index_type, vectors, tmp_path: Path):
+    # Arrange
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config(index_type)
+    )
+    repository.upsert([{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors)])
+
+    # Act
+    repository.remove(["7", "unknown"])
+
+    # Assert
+    assert len(repository.index_to_item_id) == len(vectors) - 1
+    assert "7" not in repository.index_to_item_id
+    assert "7" not in [item_id for item_id, _ in repository.search(vectors[7].tolist(), top_k=3)]
+
+
+def test_tombstone_hides_vectors_from_live_ids_searches(vectors):
+    index = create_index(DIMENSION, _config("hnsw"))
+    index.add_with_ids(vectors[:10], np.arange(10, dtype=np.int64))
+
+    tombstone(index, np.array([3], dtype=np.int64))
+    index.add_with_ids(vectors[20:21], np.array([3], dtype=np.int64))
+
+    params = build_search_parameters(index, _config("hnsw"), live_ids_selector())
+    _, labels = index.search(vectors[3:4], 3, params=params)
+    assert index.ntotal == 11
+    assert (labels >= 0).all()
+    assert np.allclose(index.reconstruct(3), vectors[20])
+
+
+def test_repository_hnsw_updates_tombstone_then_compact(vectors, tmp_path: Path):
+    # Arrange
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config("hnsw")
+    )
+    repository.upsert([{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors[:100])])
+
+    # Act: 20 replacements fit in the 20% tombstone budget, 5 more removals do not
+    repository.upsert([{"item_id": str(i), "embedding": vectors[200 + i]} for i in range(20)])
+    tombstoned = repository.index.ntotal
+    repository.remove(["50", "51", "52", "53", "54"])
+
+    # Assert
+    assert tombstoned == 120
+    assert repository.index.ntotal == 95
+    assert repository.search(vectors[205].tolist(), top_k=1)[0][0] == "5"
+    assert "50" not in [item_id for item_id, _ in repository.search(vectors[50].tolist(), top_k=3)]
+
+
+def test_repository_hnsw_search_never_returns_tombstones(vectors, tmp_path: Path):
+    # Arrange
+    repository = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=tmp_path / "index.index", index_config=_config("hnsw")
+    )
+    repository.upsert([{"item_id": str(i), "embedding": vector} for i, vector in enumerate(vectors[:100])])
+
+    # Act
+    repository.upsert([{"item_id": "5", "embedding": vectors[300]}])
+    results = repository.search(vectors[5].tolist(), top_k=10)
+
+    # Assert: the old vector of "5", the nearest one, does not take a slot
+    assert repository.index.ntotal == 101
+    assert len(results) == 10
+    assert len({item_id for item_id, _ in results}) == 10
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf_flat"])
+def test_read_index_with_mmap_returns_searchable_index(index_type, vectors, tmp_path: Path):
+    # Arrange
+    path = tmp_path / "index.index"
+    index = create_index(DIMENSION, _config(index_type), vectors)
+    index.add_with_ids(vectors, np.arange(len(vectors), dtype=np.int64))
+    faiss.write_index(index, str(path))
+
+    # Act
+    mapped = read_index(path, use_mmap=True)
+
+    # Assert
+    assert mapped.ntotal == len(vectors)
+    params = build_search_parameters(mapped, _config(index_type))
+    assert mapped.search(vectors[:1], 1, params=params)[1][0][0] == 0
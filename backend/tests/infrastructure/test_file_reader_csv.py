@@ -1,10 +1,12 @@
 from csv import DictWriter
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 
 from app.application.ports.file_reader import FileReader
 from app.infrastructure.adapters.outbound.files.file_reader_csv import FileReaderCSV
+from app.infrastructure.exceptions.invalid_file_type_exception import InvalidFileTypeException
 
 
 @pytest.fixture
@@ -83,7 +85,7 @@ def test_read_requirements_file_empty_should_return_empty(file_reader, tmp_path)
     assert result == []
 
 
-def test_read_file_returns_dict_rows(file_reader, tmp_path):
+def test_iter_file_returns_dict_rows(file_reader, tmp_path):
     # Arrange
     file_path = tmp_path / "file.csv"
     rows = [{"item_id": "1", "name": "A", "category": "C", "description": "D"}]
@@ -91,14 +93,14 @@ def test_read_file_returns_dict_rows(file_reader, tmp_path):
 
     # Act
     with open(file_path, "rb") as f:
-        result = file_reader._read_file(f.read())
+        result = list(file_reader.iter_catalog(f))
 
     # Assert
     assert all(isinstance(row, dict) for row in result)
     assert result == rows
 
 
-def test_read_file_parses_attributes_json(file_reader, tmp_path):
+def test_iter_file_parses_attributes_json(file_reader, tmp_path):
     # Arrange
     file_path = tmp_path / "file.csv"
     rows = [{"item_id": "1", "name": "A", "attributes": '{"key": "value"}'}]
@@ -106,13 +108,13 @@ def test_read_file_parses_attributes_json(file_reader, tmp_path):
 
     # Act
     with open(file_path, "rb") as f:
-        result = file_reader._read_file(f.read())
+        result = list(file_reader.iter_catalog(f))
 
     # Assert
     assert result[0]["attributes"] == {"key": "value"}
 
 
-def test_read_file_parses_active_boolean(file_reader, tmp_path):
+def test_iter_file_parses_active_boolean(file_reader, tmp_path):
     # Arrange
     file_path = tmp_path / "file.csv"
     rows = [{"item_id": "1", "active": "true"}]
@@ -120,7 +122,26 @@ def test_read_file_parses_active_boolean(file_reader, tmp_path):
 
     # Act
     with open(file_path, "rb") as f:
-        result = file_reader._read_file(f.read())
+        result = list(file_reader.iter_catalog(f))
 
     # Assert
-    assert result[0]["active"] is True
\ No newline at end of file
+    assert result[0]["active"] is True
+
+def test_iter_requirements_should_leave_file_open(file_reader, tmp_path):
+    # Arrange
+    file_path = tmp_path / "file.csv"
+    write_csv_file(file_path, [{"name": "A", "quantity": "1", "unit": "u"}])
+
+    # Act
+    with open(file_path, "rb") as f:
+        result = list(file_reader.iter_requirements(f))
+
+        # Assert
+        assert not f.closed
+
+    assert result == [{"name": "A", "quantity": "1", "unit": "u"}]
+
+
+def test_iter_catalog_invalid_encoding_should_raise(file_reader):
+    with pytest.raises(InvalidFileTypeException):
+        list(file_reader.iter_catalog(BytesIO(b"name\n\xff\xfe\n")))
@@ -0,0 +1,113 @@
+from csv import DictWriter
+from io import BytesIO
+from pathlib import Path
+import re
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+from app.application.ports.file_reader import FileReader
+from app.infrastructure.adapters.outbound.files.file_reader_csv import FileReaderCSV
+from app.infrastructure.adapters.outbound.files.file_reader_xlsx import FileReaderXLSX
+from app.infrastructure.exceptions.invalid_file_type_exception import InvalidFileTypeException
+
+
+@pytest.fixture
+def file_reader() -> FileReader:
+    return FileReaderXLSX()
+
+
+def write_xlsx_file(path: Path, rows: list[list]) -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def test_iter_catalog_should_return_rows_like_csv(file_reader, tmp_path):
+    # Arrange
+    rows = [
+        ["item_id", "name", "category", "description", "unit", "attributes", "active"],
+        ["1", "Item 1", "Cat A", "Desc", "u", '{"size": "m6"}', "TRUE"],
+        ["2", "Item 2", "Cat B", "Desc", None, None, "false"],
+    ]
+    xlsx_path = tmp_path / "catalog.xlsx"
+    csv_path = tmp_path / "catalog.csv"
+    write_xlsx_file(xlsx_path, rows)
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = DictWriter(f, fieldnames=rows[0])
+        writer.writeheader()
+        writer.writerows([dict(zip(rows[0], [v or "" for v in row])) for row in rows[1:]])
+
+    # Act
+    with open(xlsx_path, "rb") as f:
+        result = list(file_reader.iter_catalog(f))
+    with open(csv_path, "rb") as f:
+        expected = list(FileReaderCSV().iter_catalog(f))
+
+    # Assert
+    assert result == expected
+    assert result[0]["attributes"] == {"size": "m6"}
+    assert result[0]["active"] is True
+
+
+def test_iter_requirements_should_convert_cells_to_text(file_reader, tmp_path):
+    # Arrange
+    file_path = tmp_path / "requirements.xlsx"
+    write_xlsx_file(
+        file_path,
+        [["name", "quantity", "unit", "priority"], ["Bolt", 10, "u", 1.5], [], [None, None]],
+    )
+
+    # Act
+    with open(file_path, "rb") as f:
+        result = list(file_reader.iter_requirements(f))
+
+    # Assert
+    # Blank lines are skipped and whole numbers keep no decimals
+    assert result == [{"name": "Bolt", "quantity": "10", "unit": "u", "priority": "1.5"}]
+
+
+def test_read_catalog_empty_sheet_should_return_empty_list(file_reader, tmp_path):
+    # Arrange
+    file_path = tmp_path / "empty.xlsx"
+    write_xlsx_file(file_path, [])
+
+    # Act
+    result = file_reader.read_catalog(file_path.read_bytes())
+
+    # Assert
+    assert result == []
+
+
+def test_iter_catalog_invalid_file_should_raise(file_reader):
+    with pytest.raises(InvalidFileTypeException):
+        list(file_reader.iter_catalog(BytesIO(b"item_id,name\n1,a\n")))
+
+
+def test_iter_catalog_should_ignore_a_wrong_stored_dimension(file_reader, tmp_path):
+    # Arrange
+    rows = [
+        ["item_id", "name", "category", "description"],
+        ["1", "Item 1", "Cat A", "Desc"],
+        ["2", "Item 2", "Cat B", "Desc"],
+    ]
+    written_path = tmp_path / "written.xlsx"
+    xlsx_path = tmp_path / "catalog.xlsx"
+    write_xlsx_file(written_path, rows)
+    # Writers sometimes store a dimension smaller than the data, e.g. A1:A1
+    with zipfile.ZipFile(written_path) as source, zipfile.ZipFile(xlsx_path, "w") as target:
+        for entry in source.infolist():
+            content = source.read(entry)
+            if entry.filename == "xl/worksheets/sheet1.xml":
+                content = re.sub(rb'<dimension ref="[^"]+"', b'<dimension ref="A1:A1"', content)
+            target.writestr(entry, content)
+
+    # Act
+    with open(xlsx_path, "rb") as f:
+        result = list(file_reader.iter_catalog(f))
+
+    # Assert
+    assert result == [dict(zip(rows[0], row)) for row in rows[1:]]
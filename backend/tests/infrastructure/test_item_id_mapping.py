@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.infrastructure.adapters.outbound.vector_store.item_id_mapping import (
+    ItemIdMapping,
+    to_faiss_id,
+)
+
+
+def _items(count: int) -> list[dict]:
+    return [
+        {
+            "item_id": f"ITEM-{i:05d}",
+            "active": i % 3 != 0,
+            "category": f"cat-{i % 4}",
+            "provider": None if i % 2 else "acme",
+        }
+        for i in range(count)
+    ]
+
+
+def test_position_of_finds_every_item():
+    # Arrange
+    mapping = ItemIdMapping.from_items(_items(2_000))
+
+    # Act & Assert
+    assert mapping.position_of("ITEM-01234") == 1234
+    assert mapping.item_id(1234) == "ITEM-01234"
+    assert mapping.position_of("missing") is None
+    assert mapping.positions_of(mapping.ids).tolist() == list(range(2_000))
+
+
+def test_positions_of_ignores_faiss_no_result_label():
+    mapping = ItemIdMapping.from_items(_items(3))
+
+    assert mapping.positions_of(np.array([-1, to_faiss_id("ITEM-00001")])).tolist() == [-1, 1]
+
+
+def test_write_and_load_round_trip_uses_mmap(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "catalog.mapping"
+    mapping = ItemIdMapping.from_items(_items(100) + [{"item_id": "ñandú-ü"}])
+
+    # Act
+    mapping.write(path)
+    loaded = ItemIdMapping.load(path)
+
+    # Assert
+    assert loaded.item_ids() == mapping.item_ids()
+    assert loaded.position_of("ñandú-ü") == 100
+    assert np.array_equal(loaded.filter_mask("cat-1", "acme"), mapping.filter_mask("cat-1", "acme"))
+    assert not loaded.ids.flags.writeable
+
+
+def test_load_empty_mapping(tmp_path: Path):
+    path = tmp_path / "catalog.mapping"
+    ItemIdMapping.empty().write(path)
+
+    loaded = ItemIdMapping.load(path)
+
+    assert len(loaded) == 0
+    assert loaded.position_of("ITEM-00001") is None
+
+
+def test_filter_mask_combines_active_category_and_provider():
+    mapping = ItemIdMapping.from_items(_items(8))
+
+    assert np.flatnonzero(mapping.filter_mask()).tolist() == [1, 2, 4, 5, 7]
+    assert np.flatnonzero(mapping.filter_mask(category="cat-1")).tolist() == [1, 5]
+    assert np.flatnonzero(mapping.filter_mask(category="cat-2", provider="acme")).tolist() == [2]
+    assert not mapping.filter_mask(category="unknown").any()
+
+
+def test_replace_items_drops_positions_and_appends_items():
+    # Arrange
+    mapping = ItemIdMapping.from_items(_items(4))
+
+    # Act
+    updated = mapping.replace_items([1, 2], [{"item_id": "ITEM-00002", "category": "new"}])
+
+    # Assert
+    assert updated.item_ids() == ["ITEM-00000", "ITEM-00003", "ITEM-00002"]
+    assert updated.position_of("ITEM-00001") is None
+    assert updated.categories[updated.category_codes[2]] == "new"
+    assert mapping.item_ids() == ["ITEM-00000", "ITEM-00001", "ITEM-00002", "ITEM-00003"]
+
+
+def test_with_active_copies_only_the_mask():
+    mapping = ItemIdMapping.from_items(_items(3))
+
+    updated = mapping.with_active([1], active=False)
+
+    assert updated.active.tolist() == [0, 0, 1]
+    assert mapping.active.tolist() == [0, 1, 1]
+    assert updated.slots is mapping.slots
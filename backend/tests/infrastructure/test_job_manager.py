@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.exceptions.job_not_found_exception import JobNotFoundException
+from app.infrastructure.exceptions.job_queue_full_exception import JobQueueFullException
+from app.infrastructure.jobs.job_manager import JobManager
+
+
+def _wait(job_manager: JobManager, job_id: str):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        job = job_manager.get(job_id)
+        if job.status in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_submit_runs_task_and_reports_progress():
+    # Arrange
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=10)
+
+    def task(progress):
+        time.sleep(0.01)
+        progress.rows_parsed(10)
+        time.sleep(0.01)
+        progress.rows_embedded(4)
+        time.sleep(0.01)
+        progress.rows_indexed(4)
+
+    # Act
+    submitted = job_manager.submit(task)
+    job = _wait(job_manager, submitted.job_id)
+
+    # Assert
+    assert job.status == "succeeded"
+    assert job.progress.rows_parsed == 10
+    assert job.progress.rows_embedded == 4
+    assert job.progress.rows_indexed == 4
+    assert job.rows_per_second.rows_parsed > 0
+    assert job.rows_per_second.rows_embedded > 0
+    assert job.rows_per_second.rows_indexed > 0
+    assert job.finished_at is not None
+
+
+def test_rates_are_only_reported_for_stages_that_progressed():
+    # Arrange
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=10)
+
+    def task(progress):
+        time.sleep(0.01)
+        progress.rows_parsed(10)
+        raise ValueError("embedding service down")
+
+    # Act
+    job = _wait(job_manager, job_manager.submit(task).job_id)
+
+    # Assert
+    assert job.rows_per_second.rows_parsed > 0
+    assert job.rows_per_second.rows_embedded is None
+    assert job.rows_per_second.rows_indexed is None
+
+
+def test_failed_task_records_error():
+    # Arrange
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=10)
+
+    def task(progress):
+        raise ValueError("broken file")
+
+    # Act
+    job = _wait(job_manager, job_manager.submit(task).job_id)
+
+    # Assert
+    assert job.status == "failed"
+    assert job.error == "broken file"
+
+
+def test_submit_rejects_jobs_beyond_queue_limit():
+    # Arrange
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=10)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_task(progress):
+        started.set()
+        release.wait()
+
+    job_manager.submit(blocking_task)
+    started.wait()
+    job_manager.submit(blocking_task)
+
+    # Act / Assert
+    with pytest.raises(JobQueueFullException):
+        job_manager.submit(blocking_task)
+
+    release.set()
+    job_manager.shutdown(wait=True)
+
+
+def test_get_unknown_job_should_raise():
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=10)
+
+    with pytest.raises(JobNotFoundException):
+        job_manager.get("missing")
+
+
+def test_only_last_finished_jobs_are_kept():
+    # Arrange
+    job_manager = JobManager(max_workers=1, max_queued=1, history_size=1)
+    first = job_manager.submit(lambda progress: None)
+    _wait(job_manager, first.job_id)
+    second = job_manager.submit(lambda progress: None)
+    _wait(job_manager, second.job_id)
+
+    # Act
+    third = job_manager.submit(lambda progress: None)
+    _wait(job_manager, third.job_id)
+
+    # Assert
+    with pytest.raises(JobNotFoundException):
+        job_manager.get(first.job_id)
+    assert job_manager.get(third.job_id).status == "succeeded"
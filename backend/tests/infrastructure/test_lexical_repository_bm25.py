@@ -0,0 +1,190 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.infrastructure.adapters.outbound.lexical_store.lexical_repository_bm25 import (
+    LexicalRepositoryBM25,
+    is_identifier,
+    tokenize,
+)
+from app.infrastructure.exceptions.lexical_repository_exception import LexicalRepositoryException
+
+
+@pytest.fixture
+def items():
+    return [
+        {"item_id": "BLT-M6-20", "text": "Perno acero M6 x 20", "active": True, "category": "ferreteria", "provider": "acme"},
+        {"item_id": "BLT-M8-30", "text": "Perno acero M8 x 30", "active": True, "category": "ferreteria", "provider": "bolts"},
+        {"item_id": "CBL-UTP6", "text": "Cable UTP categoria 6", "active": True, "category": "redes", "provider": "acme"},
+        {"item_id": "LAP-0001", "text": "Notebook 16GB RAM", "active": False, "category": "computacion", "provider": "acme"},
+    ]
+
+
+@pytest.fixture
+def repository(tmp_path: Path, items):
+    repository = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+    repository.save(items, catalog_version="1")
+    return repository
+
+
+def test_tokenize_should_keep_compounds_and_their_parts():
+    assert tokenize("Perno ABC-123") == ["perno", "abc-123", "abc", "123"]
+
+
+def test_is_identifier_should_need_letters_and_digits():
+    assert is_identifier("abc-123")
+    assert not is_identifier("1000")
+    assert not is_identifier("perno")
+    assert not is_identifier("m6")
+
+
+def test_search_batch_should_rank_best_match_first(repository):
+    results = repository.search_batch(["perno m8"], top_k=5)
+
+    assert [item_id for item_id, _ in results[0]][:2] == ["BLT-M8-30", "BLT-M6-20"]
+    assert results[0][0][1] > results[0][1][1]
+
+
+def test_search_batch_should_ignore_stopwords(tmp_path: Path):
+    repository = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+    repository.save(
+        [
+            {"item_id": "CBL-01", "text": "Cable de red"},
+            {"item_id": "CAJ-01", "text": "Caja de herramientas"},
+        ]
+    )
+
+    results = repository.search_batch(["tornillo de acero", "caja para cable"], top_k=5)
+
+    # Sharing "de" with every item does not make them candidates
+    assert results[0] == []
+    assert sorted(item_id for item_id, _ in results[1]) == ["CAJ-01", "CBL-01"]
+
+
+def test_search_batch_should_skip_inactive_items(repository):
+    assert repository.search_batch(["notebook"], top_k=5) == [[]]
+
+
+def test_search_batch_should_apply_filters(repository):
+    results = repository.search_batch(
+        ["acero categoria"], top_k=5, filters=[{"provider": "bolts"}]
+    )
+
+    assert [item_id for item_id, _ in results[0]] == ["BLT-M8-30"]
+
+
+def test_search_batch_should_limit_to_top_k(repository):
+    results = repository.search_batch(["perno cable"], top_k=1)
+
+    assert len(results[0]) == 1
+
+
+def test_find_exact_should_return_items_named_by_identifier(repository):
+    results = repository.find_exact(
+        ["necesito el blt-m6-20", "perno m6", "notebook lap-0001"], top_k=5
+    )
+
+    # Plain words never hit, inactive items neither
+    assert results == [["BLT-M6-20"], [], []]
+
+
+def test_find_exact_should_return_at_most_top_k_items(repository):
+    results = repository.find_exact(["blt-m8-30 blt-m6-20 cbl-utp6"], top_k=2)
+
+    assert results == [["BLT-M8-30", "BLT-M6-20"]]
+
+
+def test_set_active_should_update_and_persist(repository, tmp_path: Path):
+    repository.set_active(["LAP-0001"], active=True, catalog_version="2")
+
+    reloaded = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+
+    assert reloaded.get_catalog_version() == "2"
+    assert [item_id for item_id, _ in reloaded.search_batch(["notebook"], top_k=5)[0]] == [
+        "LAP-0001"
+    ]
+
+
+def test_set_active_on_unindexed_item_should_record_catalog_version(repository, tmp_path: Path):
+    repository.set_active(["MISSING-0001"], active=False, catalog_version="2")
+
+    reloaded = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+
+    assert reloaded.get_catalog_version() == "2"
+    assert [item_id for item_id, _ in reloaded.search_batch(["perno"], top_k=5)[0]] == [
+        "BLT-M6-20",
+        "BLT-M8-30",
+    ]
+
+
+def test_save_should_be_visible_to_other_instances(repository, tmp_path: Path):
+    other = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+
+    repository.save(
+        [{"item_id": "NEW-0001", "text": "Taladro", "active": True}], catalog_version="3"
+    )
+
+    assert other.get_catalog_version() == "3"
+    assert other.find_exact(["new-0001"], top_k=5) == [["NEW-0001"]]
+
+
+def test_upsert_should_match_a_full_rebuild(repository, items, tmp_path: Path):
+    # Arrange: one item replaced by a longer text, one added
+    changes = [
+        {"item_id": "BLT-M8-30", "text": "Perno hexagonal galvanizado M8 x 30", "active": True, "category": "ferreteria", "provider": "bolts"},
+        {"item_id": "CBL-UTP6A-LSZH", "text": "Cable UTP categoria 6A libre de halogenos", "active": True, "category": "redes", "provider": "acme"},
+    ]
+    rebuilt = LexicalRepositoryBM25(path=tmp_path / "rebuilt.lexical.npz")
+    rebuilt.save([items[0], changes[0], items[2], items[3], changes[1]], catalog_version="2")
+
+    # Act
+    repository.upsert(changes, catalog_version="2")
+
+    # Assert
+    queries = ["perno galvanizado m8", "cable utp 6a", "perno acero", "cbl-utp6a-lszh"]
+    for updated, expected in zip(
+        repository.search_batch(queries, top_k=5), rebuilt.search_batch(queries, top_k=5)
+    ):
+        assert [item_id for item_id, _ in updated] == [item_id for item_id, _ in expected]
+        assert [score for _, score in updated] == pytest.approx([score for _, score in expected])
+
+    assert repository.find_exact(["cbl-utp6a-lszh"], top_k=5) == [["CBL-UTP6A-LSZH"]]
+    assert repository.get_catalog_version() == "2"
+
+
+def test_upsert_should_be_persisted(repository, tmp_path: Path):
+    repository.upsert([{"item_id": "NEW-0001", "text": "Martillo carpintero"}], catalog_version="2")
+
+    reloaded = LexicalRepositoryBM25(path=tmp_path / "catalog.lexical.npz")
+
+    assert [item_id for item_id, _ in reloaded.search_batch(["martillo"], top_k=5)[0]] == ["NEW-0001"]
+    assert reloaded.get_catalog_version() == "2"
+
+
+def test_save_empty_catalog_should_clear_index(repository):
+    repository.save([], catalog_version="4")
+
+    assert repository.get_catalog_version() == "4"
+    assert repository.search_batch(["perno"], top_k=5) == [[]]
+
+
+def test_load_corrupted_file_should_raise(tmp_path: Path):
+    path = tmp_path / "catalog.lexical.npz"
+    path.write_bytes(b"not an npz")
+
+    with pytest.raises(LexicalRepositoryException):
+        LexicalRepositoryBM25(path=path)
+
+
+def test_load_file_without_term_frequencies_should_start_unversioned(repository, tmp_path: Path):
+    # Files written before upsert existed only hold the final weights
+    path = tmp_path / "catalog.lexical.npz"
+    with np.load(path) as data:
+        arrays = {name: data[name] for name in data.files if name not in ("frequencies", "doc_lengths")}
+    np.savez(path, **arrays)
+
+    reloaded = LexicalRepositoryBM25(path=path)
+
+    assert reloaded.get_catalog_version() is None
+    assert reloaded.search_batch(["perno"], top_k=5) == [[]]
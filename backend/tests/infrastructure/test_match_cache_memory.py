@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from app.infrastructure.adapters.outbound.match_cache.match_cache_memory import (
+    InMemoryMatchCache,
+)
+
+
+def test_get_many_should_return_stored_entries_and_count_hits():
+    cache = InMemoryMatchCache(max_entries=10, ttl_seconds=60)
+    cache.set_many({"a": [("1", 0.1)]}, version="v1")
+
+    found = cache.get_many(["a", "b"], version="v1")
+
+    assert found == {"a": [("1", 0.1)]}
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+
+
+def test_new_version_should_drop_every_entry():
+    cache = InMemoryMatchCache(max_entries=10, ttl_seconds=60)
+    cache.set_many({"a": [("1", 0.1)]}, version="v1")
+
+    assert cache.get_many(["a"], version="v2") == {}
+    assert cache.get_stats().entries == 0
+    assert cache.get_stats().invalidations == 1
+
+
+def test_set_many_should_evict_least_recently_used():
+    cache = InMemoryMatchCache(max_entries=2, ttl_seconds=60)
+    cache.set_many({"a": [], "b": []}, version="v1")
+    # "a" becomes the most recently used
+    cache.get_many(["a"], version="v1")
+
+    cache.set_many({"c": []}, version="v1")
+
+    assert set(cache.get_many(["a", "b", "c"], version="v1")) == {"a", "c"}
+    assert cache.get_stats().evictions == 1
+
+
+def test_get_many_should_skip_expired_entries():
+    cache = InMemoryMatchCache(max_entries=10, ttl_seconds=60)
+
+    with patch(
+        "app.infrastructure.adapters.outbound.match_cache.match_cache_memory.time.monotonic",
+        side_effect=[0.0, 61.0],
+    ):
+        cache.set_many({"a": []}, version="v1")
+        found = cache.get_many(["a"], version="v1")
+
+    assert found == {}
+    assert cache.get_stats().entries == 0
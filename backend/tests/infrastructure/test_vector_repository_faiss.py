@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import faiss
@@ -50,7 +51,7 @@ def test_save_should_add_embeddings_and_persist(tmp_path: Path, raw_catalog_item
 
     assert vector_repo.index.d == DIMENSION
     assert vector_repo.index.ntotal == len(raw_catalog_items_valid)
-    assert index_path.exists() == True
+    assert index_path.with_suffix(".manifest.json").exists() == True
 
 
 def test_save_with_empty_list_should_do_nothing(tmp_path: Path):
@@ -175,4 +176,398 @@ def test_search_returns_results_ordered_by_similarity(tmp_path: Path):
     assert results[1][0] == "close"
     assert results[2][0] == "far"
     
-    assert results[0][1] < results[1][1] < results[2][1]
\ No newline at end of file
+    assert results[0][1] < results[1][1] < results[2][1]
+
+
+def test_upsert_should_append_new_items_and_keep_existing(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.save([{"item_id": "A", "embedding": np.zeros(DIMENSION, dtype=np.float32)}])
+
+    # Act
+    vector_repo.upsert([{"item_id": "B", "embedding": np.ones(DIMENSION, dtype=np.float32)}])
+
+    # Assert
+    assert vector_repo.index.ntotal == 2
+    assert vector_repo.index_to_item_id == ["A", "B"]
+
+
+def test_upsert_should_replace_vector_of_existing_item(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.save([
+        {"item_id": "A", "embedding": np.zeros(DIMENSION, dtype=np.float32)},
+        {"item_id": "B", "embedding": np.ones(DIMENSION, dtype=np.float32)},
+    ])
+    moved = np.full(DIMENSION, 5.0, dtype=np.float32)
+
+    # Act
+    vector_repo.upsert([{"item_id": "A", "embedding": moved}])
+
+    # Assert
+    assert vector_repo.index.ntotal == 2
+    results = vector_repo.search(moved.tolist(), top_k=1)
+    assert results[0][0] == "A"
+    assert results[0][1] < 0.01
+
+
+def test_upsert_should_persist_index_and_mapping(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+
+    # Act
+    vector_repo.upsert([{"item_id": "A", "embedding": np.zeros(DIMENSION, dtype=np.float32)}])
+
+    # Assert
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert reloaded.index.ntotal == 1
+    assert reloaded.index_to_item_id == ["A"]
+
+
+def test_upsert_without_item_id_should_raise(tmp_path: Path):
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+
+    with pytest.raises(VectorRepositoryValidationException):
+        vector_repo.upsert([{"embedding": np.zeros(DIMENSION, dtype=np.float32)}])
+
+
+
+def test_upsert_should_swap_in_new_index_without_mutating_previous_one(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    vector_repo.save([{"item_id": "A", "embedding": np.zeros(DIMENSION, dtype=np.float32)}])
+    previous_index = vector_repo.index
+    previous_mapping = vector_repo.index_to_item_id
+
+    # Act
+    vector_repo.upsert([{"item_id": "B", "embedding": np.ones(DIMENSION, dtype=np.float32)}])
+
+    # Assert
+    assert previous_index.ntotal == 1
+    assert previous_mapping == ["A"]
+    assert vector_repo.index is not previous_index
+    assert vector_repo.index.ntotal == 2
+
+
+def _vector(value: float) -> np.ndarray:
+    return np.full(DIMENSION, value, dtype=np.float32)
+
+
+def test_search_should_skip_inactive_items(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0), "active": False},
+            {"item_id": "B", "embedding": _vector(1.0)},
+            {"item_id": "C", "embedding": _vector(2.0)},
+        ]
+    )
+
+    # Act
+    results = vector_repo.search(query_embedding=_vector(0.0).tolist(), top_k=2)
+
+    # Assert
+    assert [item_id for item_id, _ in results] == ["B", "C"]
+
+
+def test_set_active_should_update_mask_without_reindexing(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0)},
+            {"item_id": "B", "embedding": _vector(1.0)},
+        ]
+    )
+    index = vector_repo.index
+
+    # Act
+    vector_repo.set_active(["A"], active=False)
+
+    # Assert
+    assert vector_repo.index is index
+    assert [i for i, _ in vector_repo.search(_vector(0.0).tolist(), top_k=2)] == ["B"]
+
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert [i for i, _ in reloaded.search(_vector(0.0).tolist(), top_k=2)] == ["B"]
+
+    vector_repo.set_active(["A"], active=True)
+    assert [i for i, _ in vector_repo.search(_vector(0.0).tolist(), top_k=2)] == ["A", "B"]
+
+
+def test_set_active_on_unindexed_item_should_record_catalog_version(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.save([{"item_id": "A", "embedding": _vector(0.0)}], catalog_version="1")
+    index = vector_repo.index
+
+    # Act
+    vector_repo.set_active(["never-indexed"], active=False, catalog_version="2")
+
+    # Assert
+    assert vector_repo.index is index
+    assert vector_repo.get_catalog_version() == "2"
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert reloaded.get_catalog_version() == "2"
+    assert [i for i, _ in reloaded.search(_vector(0.0).tolist(), top_k=1)] == ["A"]
+
+
+def test_search_should_filter_by_category_and_provider(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0), "category": "x", "provider": "p1"},
+            {"item_id": "B", "embedding": _vector(1.0), "category": "y", "provider": "p1"},
+            {"item_id": "C", "embedding": _vector(2.0), "category": "y", "provider": "p2"},
+        ]
+    )
+    query = _vector(0.0).tolist()
+
+    # Act & Assert
+    assert [i for i, _ in vector_repo.search(query, top_k=3, category="y")] == ["B", "C"]
+    assert [i for i, _ in vector_repo.search(query, top_k=3, provider="p2")] == ["C"]
+    assert vector_repo.search(query, top_k=3, category="x", provider="p2") == []
+
+
+def test_upsert_should_keep_metadata_of_untouched_items(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0), "active": False},
+            {"item_id": "B", "embedding": _vector(1.0), "category": "y"},
+        ]
+    )
+
+    # Act
+    vector_repo.upsert([{"item_id": "B", "embedding": _vector(3.0), "category": "z"}])
+
+    # Assert
+    assert vector_repo.search(_vector(0.0).tolist(), top_k=2) == [("B", 9.0 * DIMENSION)]
+    assert vector_repo.search(_vector(0.0).tolist(), top_k=2, category="y") == []
+
+
+def test_legacy_list_mapping_is_loaded_as_active(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    index = faiss.IndexFlatL2(DIMENSION)
+    index.add(np.stack([_vector(0.0), _vector(1.0)]))
+    faiss.write_index(index, str(index_path))
+    index_path.with_suffix(".json").write_text('["A", "B"]', encoding="utf-8")
+
+    # Act
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+
+    # Assert
+    assert [i for i, _ in vector_repo.search(_vector(0.0).tolist(), top_k=2)] == ["A", "B"]
+
+
+def test_search_batch_returns_one_result_list_per_query(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0), "category": "x"},
+            {"item_id": "B", "embedding": _vector(1.0), "category": "y"},
+        ]
+    )
+    queries = np.stack([_vector(0.0), _vector(1.0), _vector(0.0)])
+
+    # Act
+    results = vector_repo.search_batch(
+        queries,
+        top_k=1,
+        filters=[{}, {}, {"category": "y"}],
+    )
+
+    # Assert
+    assert [[item_id for item_id, _ in result] for result in results] == [["A"], ["B"], ["B"]]
+
+
+def test_search_batch_matches_single_searches(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+    embeddings = np.random.rand(20, DIMENSION).astype(np.float32)
+    vector_repo.save(
+        [{"item_id": str(i), "embedding": embedding} for i, embedding in enumerate(embeddings)]
+    )
+    queries = np.random.rand(5, DIMENSION).astype(np.float32)
+
+    # Act
+    batch = vector_repo.search_batch(queries, top_k=3)
+
+    # Assert
+    assert batch == [vector_repo.search(query.tolist(), top_k=3) for query in queries]
+
+
+def test_search_batch_with_wrong_dimension_should_raise(tmp_path: Path):
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+
+    with pytest.raises(VectorRepositoryValidationException):
+        vector_repo.search_batch([[0.1, 0.2]], top_k=1)
+
+
+def test_to_faiss_id_is_stable_and_non_negative():
+    first = VectorRepositoryFAISS.to_faiss_id("ITEM-001")
+
+    assert first == VectorRepositoryFAISS.to_faiss_id("ITEM-001")
+    assert first != VectorRepositoryFAISS.to_faiss_id("ITEM-002")
+    assert 0 <= first < 2**63
+
+
+def test_upsert_should_store_vectors_under_item_id_hash(tmp_path: Path):
+    # Arrange
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=tmp_path / "index.index")
+
+    # Act
+    vector_repo.upsert([{"item_id": "A", "embedding": _vector(2.0)}])
+
+    # Assert
+    stored = vector_repo.index.reconstruct(VectorRepositoryFAISS.to_faiss_id("A"))
+    assert np.allclose(stored, _vector(2.0))
+
+
+def test_remove_should_drop_only_given_items_and_persist(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0)},
+            {"item_id": "B", "embedding": _vector(1.0)},
+        ]
+    )
+
+    # Act
+    vector_repo.remove(["A"])
+
+    # Assert
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert reloaded.index.ntotal == 1
+    assert reloaded.index_to_item_id == ["B"]
+    assert [i for i, _ in reloaded.search(_vector(0.0).tolist(), top_k=2)] == ["B"]
+
+
+def test_mmap_mode_searches_and_writes(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    VectorRepositoryFAISS(dimension=DIMENSION, path=index_path).save(
+        [
+            {"item_id": "A", "embedding": _vector(0.0)},
+            {"item_id": "B", "embedding": _vector(1.0)},
+        ]
+    )
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path, use_mmap=True)
+
+    # Act
+    vector_repo.upsert([{"item_id": "C", "embedding": _vector(0.1)}])
+    vector_repo.remove(["B"])
+    vector_repo.set_active(["A"], active=False)
+
+    # Assert
+    assert vector_repo.index.ntotal == 2
+    assert [i for i, _ in vector_repo.search(_vector(0.0).tolist(), top_k=3)] == ["C"]
+
+
+def test_search_reloads_files_replaced_by_another_process(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    writer = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    writer.save([{"item_id": "A", "embedding": _vector(0.0)}])
+    reader = VectorRepositoryFAISS(
+        dimension=DIMENSION, path=index_path, use_mmap=True, reload_interval=0.0
+    )
+
+    # Act
+    writer.upsert([{"item_id": "B", "embedding": _vector(0.0)}])
+    results = reader.search(_vector(0.0).tolist(), top_k=2)
+
+    # Assert
+    assert sorted(i for i, _ in results) == ["A", "B"]
+
+
+def test_search_checks_for_new_files_at_most_once_per_interval(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    writer = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    writer.save([{"item_id": "A", "embedding": _vector(0.0)}])
+    reader = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path, reload_interval=3600)
+
+    # Act
+    writer.upsert([{"item_id": "B", "embedding": _vector(0.0)}])
+
+    # Assert
+    assert [i for i, _ in reader.search(_vector(0.0).tolist(), top_k=2)] == ["A"]
+    assert reader.refresh() is True
+    assert reader.refresh() is False
+    assert len(reader.search(_vector(0.0).tolist(), top_k=2)) == 2
+
+
+def test_commit_records_catalog_version_and_keeps_two_generations(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+
+    # Act
+    vector_repo.save([{"item_id": "A", "embedding": _vector(0.0)}], catalog_version="v1")
+    vector_repo.upsert([{"item_id": "B", "embedding": _vector(1.0)}], catalog_version="v2")
+    vector_repo.set_active(["A"], active=False, catalog_version="v3")
+
+    # Assert
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert reloaded.get_catalog_version() == "v3"
+    assert sorted(p.name for p in tmp_path.glob("index.*.index")) == ["index.00000002.index"]
+    assert sorted(p.name for p in tmp_path.glob("index.*.mapping")) == [
+        "index.00000002.mapping",
+        "index.00000003.mapping",
+    ]
+
+
+def test_interrupted_commit_leaves_previous_generation_readable(tmp_path: Path):
+    # Arrange
+    index_path = tmp_path / "index.index"
+    VectorRepositoryFAISS(dimension=DIMENSION, path=index_path).save(
+        [{"item_id": "A", "embedding": _vector(0.0)}], catalog_version="v1"
+    )
+
+    # A writer died after writing its files but before the manifest
+    (tmp_path / "index.00000002.index").write_bytes(b"partial")
+    (tmp_path / "index.00000002.mapping").write_bytes(b"partial")
+
+    # Act
+    vector_repo = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    vector_repo.upsert([{"item_id": "B", "embedding": _vector(1.0)}], catalog_version="v2")
+
+    # Assert
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert reloaded.get_catalog_version() == "v2"
+    assert sorted(reloaded.index_to_item_id) == ["A", "B"]
+
+
+def test_writers_of_different_processes_do_not_lose_each_other_commits(tmp_path: Path):
+    # Arrange: two repositories on one path stand for two processes, they
+    # share no in-process lock, only the lock file
+    index_path = tmp_path / "index.index"
+    writers = [
+        VectorRepositoryFAISS(dimension=DIMENSION, path=index_path) for _ in range(2)
+    ]
+
+    def write(position: int) -> None:
+        writer = writers[position % 2]
+        writer.upsert([{"item_id": f"item-{position}", "embedding": _vector(position)}])
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(write, range(20)))
+
+    # Assert
+    reloaded = VectorRepositoryFAISS(dimension=DIMENSION, path=index_path)
+    assert sorted(reloaded.index_to_item_id) == sorted(f"item-{i}" for i in range(20))
+    assert len(list(tmp_path.glob("index.*.index"))) == 2
@@ -1,4 +1,5 @@
 import type { MatchesListProps } from '../../../types';
+import { formatMatchScore } from '../../../utils';
 import RequirementItemCard from '../RequirementItemCard/RequirementItemCard';
 
 const MatchList = ({ matches }: MatchesListProps) => {
@@ -35,7 +36,7 @@ const MatchList = ({ matches }: MatchesListProps) => {
                   <td>{item.category ? item.category : '-'}</td>
                   <td>{item.subcategory ? item.subcategory : '-'}</td>
                   <td>{item.provider ? item.provider : '-'}</td>
-                  <td>{item.score.toFixed(2)}</td>
+                  <td>{formatMatchScore(item)}</td>
                 </tr>
               ))}
             </tbody>
@@ -3,6 +3,7 @@ import type {
   CatalogCategoriesResponse,
   CatalogItem,
   CatalogItemsResponse,
+  CatalogJobResponse,
   CatalogList,
   CatalogProvidersResponse,
   CatalogSubcategoriesResponse,
@@ -12,6 +13,27 @@ import type {
 } from '../types';
 import HttpClient from './httpClient';
 
+// Delay between two status requests of a catalog upload job
+const JOB_POLL_INTERVAL_MS = 1000;
+
+// Resolves after ms, rejects with an AbortError as fetch does when aborted
+const wait = (ms: number, signal?: AbortSignal): Promise<void> =>
+  new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(new DOMException('Aborted', 'AbortError'));
+      return;
+    }
+    const timeout = setTimeout(resolve, ms);
+    signal?.addEventListener(
+      'abort',
+      () => {
+        clearTimeout(timeout);
+        reject(new DOMException('Aborted', 'AbortError'));
+      },
+      { once: true },
+    );
+  });
+
 export class CatalogService {
   // Download catalog template
   async downloadCatalogTemplate(
@@ -36,7 +58,7 @@ export class CatalogService {
     return { data: response.data };
   }
 
-  // Upload catalog CSV
+  // Upload catalog CSV, resolves once the upload job has finished
   async uploadCsv(
     file: File,
     signal?: AbortSignal,
@@ -49,10 +71,47 @@ export class CatalogService {
       body: formData,
     });
 
-    const response = await client.request<void>(signal);
+    const response = await client.request<CatalogJobResponse>(signal);
     if (response.error) {
       return { error: response.error };
     }
+
+    if (!response.data?.job_id) {
+      return {
+        error: {
+          code: 'invalid_response',
+          message: 'Invalid response format: missing job_id',
+        },
+      };
+    }
+
+    return this.waitForJob(response.data, signal);
+  }
+
+  // Poll an upload job: the file is embedded and indexed after the response
+  private async waitForJob(
+    job: CatalogJobResponse,
+    signal?: AbortSignal,
+  ): Promise<{ error?: ApiError } | void> {
+    while (job.status === 'queued' || job.status === 'running') {
+      await wait(JOB_POLL_INTERVAL_MS, signal);
+
+      const client = new HttpClient(`/api/catalog/jobs/${job.job_id}`, 'json');
+      const response = await client.request<CatalogJobResponse>(signal);
+      if (response.error) {
+        return { error: response.error };
+      }
+      job = response.data!;
+    }
+
+    if (job.status === 'failed') {
+      return {
+        error: {
+          code: 'catalog_job_failed',
+          message: job.error ?? 'The catalog upload failed',
+        },
+      };
+    }
     return;
   }
 
@@ -12,6 +12,13 @@ export type CatalogItemsResponse = {
   }[];
 };
 
+// Status of a catalog upload job, see GET /api/catalog/jobs/{job_id}
+export type CatalogJobResponse = {
+  job_id: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  error?: string | null;
+};
+
 export type CatalogCategoriesResponse = {
   categories: Categories;
 };
@@ -17,6 +17,7 @@ export type MatchItem = {
   provider?: string;
   attributes?: Record<string, string>;
   score: number;
+  matchType: 'exact' | 'vector' | 'hybrid';
 };
 
 type RequirementBase = {
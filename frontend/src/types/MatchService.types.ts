@@ -18,7 +18,8 @@
           "attributes": {
             "additionalProp1": {}
           },
-          "score": 0
+          "score": 0,
+          "match_type": "hybrid"
           }]}]}
 */
 export type MatchResponse = {
@@ -40,4 +41,6 @@ export type MatchItemResponse = {
   provider?: string;
   attributes?: Record<string, string>;
   score: number;
+  // exact: score 0, vector: L2 distance, hybrid: 1 - fused rank, in [0, 1)
+  match_type: 'exact' | 'vector' | 'hybrid';
 };
@@ -7,6 +7,7 @@ import type {
 import type {
   CatalogCategoriesResponse,
   CatalogItemsResponse,
+  CatalogJobResponse,
   CatalogProvidersResponse,
   CatalogSubcategoriesResponse,
   Categories,
@@ -35,6 +36,7 @@ export type {
   CatalogCategoriesResponse,
   CatalogItem,
   CatalogItemsResponse,
+  CatalogJobResponse,
   CatalogList,
   CatalogProvidersResponse,
   CatalogSubcategoriesResponse,
@@ -0,0 +1,16 @@
+import type { MatchItem } from '../types';
+
+// Scores only compare within a match type, lower is better for both
+export const formatMatchScore = ({
+  score,
+  matchType,
+}: Pick<MatchItem, 'score' | 'matchType'>): string => {
+  switch (matchType) {
+    case 'exact':
+      return 'Coincidencia exacta';
+    case 'vector':
+      return `Distancia ${score.toFixed(2)}`;
+    case 'hybrid':
+      return `Ranking combinado ${score.toFixed(2)}`;
+  }
+};
@@ -1,3 +1,4 @@
+import { formatMatchScore } from './formatMatchScore.utils';
 import { mapToFilterOptions } from './mapToFilterOptions.utils';
 import { mapToMatchList } from './mapToMatchList.utils';
-export { mapToFilterOptions, mapToMatchList };
+export { formatMatchScore, mapToFilterOptions, mapToMatchList };
@@ -6,6 +6,7 @@ export const mapToMatchList = (matchResponse: MatchResponse): MatchesList => {
       requirement: result.requirement,
       matches: result.matches.map((match) => ({
         catalogItemId: match.catalog_item_id,
+        matchType: match.match_type,
         ...match,
       })),
     })),